@@ -0,0 +1,295 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from modules.db_manager import DBManager
+from modules.auth_service import AuthService
+from modules.booking_service import BookingService
+from modules.search_service import SearchService
+from tools.generate_data import DEFAULT_PASSWORD, generate_dataset
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Data set name -> (rooms, customers, bookings)
+SIZES = {
+    "small": (50, 500, 2000),
+    "medium": (200, 5000, 20000),
+    "large": (1000, 100000, 1000000),
+}
+
+# Fixed "today" so every run benchmarks the same data
+TODAY = date(2025, 6, 1)
+
+# A case is slower than its baseline when its median grew by more than this
+DEFAULT_THRESHOLD = 0.2
+
+
+class BenchmarkContext:
+    """Services over one generated data set, shared by the cases"""
+
+    def __init__(self, data_folder):
+        self.data_folder = data_folder
+        self.db = DBManager(data_folder)
+        self.auth_service = AuthService(self.db)
+        self.booking_service = BookingService(self.db)
+        self.search_service = SearchService(self.db)
+        rooms = self.db.get_all_rooms()
+        self.room_id = rooms[len(rooms) // 2]["roomId"]
+        self.email = self.db.get_all_customers()[-1]["email"]
+        self.check_in = TODAY + timedelta(days=30)
+        self.check_out = self.check_in + timedelta(days=3)
+
+
+# ----------------------- Cases ----------------------------------------------
+# Each case takes a BenchmarkContext and returns the function to time
+
+def case_load_json(ctx):
+    return lambda: ctx.db.load_json(ctx.db.booking_file)
+
+
+def case_load_json_cold(ctx):
+    def run():
+        ctx.db.invalidate_cache(ctx.db.booking_file)
+        ctx.db.load_json(ctx.db.booking_file)
+    return run
+
+
+def case_save_json(ctx):
+    bookings = ctx.db.get_all_bookings()
+    return lambda: ctx.db.save_json(ctx.db.booking_file, bookings)
+
+
+def case_is_room_available(ctx):
+    return lambda: ctx.db.is_room_available(ctx.room_id, ctx.check_in, ctx.check_out)
+
+
+def case_find_available_rooms_by_date(ctx):
+    return lambda: ctx.db.find_available_rooms_by_date(ctx.check_in, ctx.check_out)
+
+
+def case_search(ctx):
+    def run():
+        rooms = ctx.search_service.find_available_rooms(ctx.check_in, ctx.check_out, "All Types")
+        ctx.search_service.apply_filters(rooms, 0, 3000000, "Deluxe")
+    return run
+
+
+def case_create_booking(ctx):
+    def run():
+        ctx.booking_service.create_booking(
+            ctx.room_id, ctx.check_in, ctx.check_out, 1, "Bench", "0123456789",
+            "bench@example.com", "", 0
+        )
+    return run
+
+
+def case_get_bookings_by_status(ctx):
+    return lambda: ctx.booking_service.get_bookings_by_status("Pending")
+
+
+def case_auto_complete_checkouts(ctx):
+    # The first call completes the due stays; the rest measure the check itself
+    return lambda: ctx.booking_service.auto_complete_checkouts(TODAY)
+
+
+def case_unified_login(ctx):
+    return lambda: ctx.auth_service.unified_login(ctx.email, DEFAULT_PASSWORD)
+
+
+CASES = {
+    "db.load_json": case_load_json,
+    "db.load_json_cold": case_load_json_cold,
+    "db.save_json": case_save_json,
+    "db.is_room_available": case_is_room_available,
+    "db.find_available_rooms_by_date": case_find_available_rooms_by_date,
+    "search.find_available_rooms+apply_filters": case_search,
+    "booking.create_booking": case_create_booking,
+    "booking.get_bookings_by_status": case_get_bookings_by_status,
+    "booking.auto_complete_checkouts": case_auto_complete_checkouts,
+    "auth.unified_login": case_unified_login,
+}
+
+
+# ----------------------- Timing ---------------------------------------------
+def time_function(fn, rounds=5, min_round_time=0.05, max_iterations=10000):
+    """
+    Time a function
+
+    The number of calls per round is calibrated so a round takes at least
+    `min_round_time` seconds (a single call for slow functions).
+
+    Returns:
+        {"median_ms", "min_ms", "max_ms", "rounds", "iterations"} per call
+    """
+    started = time.perf_counter()
+    fn()
+    first = time.perf_counter() - started
+    iterations = 1
+    if first < min_round_time:
+        iterations = min(max_iterations, max(1, int(min_round_time / max(first, 1e-7))))
+
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        per_call.append((time.perf_counter() - started) * 1000 / iterations)
+    return {
+        "median_ms": statistics.median(per_call),
+        "min_ms": min(per_call),
+        "max_ms": max(per_call),
+        "rounds": rounds,
+        "iterations": iterations,
+    }
+
+
+def run_benchmarks(sizes, name_filter=None, rounds=5, work_dir=None):
+    """
+    Run every case on every data set size
+
+    Args:
+        sizes: Data set names from SIZES
+        name_filter: Only run cases whose name contains this text
+        rounds: Timed rounds per case
+        work_dir: Where data sets are generated (a temporary folder by default)
+
+    Returns:
+        {"size/case": timing dict}
+    """
+    results = {}
+    temp_dir = None
+    if work_dir is None:
+        work_dir = temp_dir = tempfile.mkdtemp(prefix="anhotel-bench-")
+    try:
+        for size in sizes:
+            rooms, customers, bookings = SIZES[size]
+            folder = os.path.join(work_dir, size)
+            print(f"Generating {size} data set ({rooms} rooms, {customers} customers, {bookings} bookings)")
+            generate_dataset(folder, rooms, customers, bookings, seed=0, today=TODAY)
+            pristine = folder + ".orig"
+            shutil.copytree(folder, pristine)
+            for name, make_case in CASES.items():
+                if name_filter and name_filter not in name:
+                    continue
+                # Every case starts from the same data (some cases write)
+                shutil.rmtree(folder)
+                shutil.copytree(pristine, folder)
+                fn = make_case(BenchmarkContext(folder))
+                timing = time_function(fn, rounds=rounds)
+                results[f"{size}/{name}"] = timing
+                print(f"{timing['median_ms']:12.3f} ms  {size}/{name}")
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+    return results
+
+
+# ----------------------- Baselines ------------------------------------------
+def save_baseline(results, path):
+    baseline = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=4)
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results against a baseline
+
+    Args:
+        results: Output of run_benchmarks
+        baseline: Saved baseline dict
+        threshold: Allowed relative growth of the median (0.2 = 20% slower)
+
+    Returns:
+        (rows, regressions) - rows are (case, baseline ms or None, current ms, change),
+        regressions lists the cases slower than allowed
+    """
+    previous = baseline.get("results", {})
+    rows = []
+    regressions = []
+    for name, timing in results.items():
+        current = timing["median_ms"]
+        base = previous.get(name, {}).get("median_ms")
+        change = (current - base) / base if base else None
+        rows.append((name, base, current, change))
+        if change is not None and change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def format_comparison(rows):
+    lines = [f"{'baseline ms':>12}{'current ms':>12}{'change':>9}  case"]
+    for name, base, current, change in rows:
+        base_text = f"{base:12.3f}" if base is not None else f"{'-':>12}"
+        change_text = f"{change:+9.1%}" if change is not None else f"{'new':>9}"
+        lines.append(f"{base_text}{current:12.3f}{change_text}  {name}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """CLI: python -m benchmarks.run [--sizes small,medium] [--filter TEXT] [--save | --compare] [--baseline PATH]"""
+    parser = argparse.ArgumentParser(description="Benchmark the service hot paths")
+    parser.add_argument("--sizes", default="small,medium",
+                        help=f"Comma separated data set sizes ({', '.join(SIZES)})")
+    parser.add_argument("--filter", dest="name_filter", help="Only run cases containing this text")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail if a case is slower than the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        print(f"Unknown sizes: {', '.join(unknown)}")
+        return 2
+
+    results = run_benchmarks(sizes, args.name_filter, args.rounds)
+
+    exit_code = 0
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressions = compare(results, baseline, args.threshold)
+        print()
+        print(format_comparison(rows))
+        if regressions:
+            print(f"\n{len(regressions)} case(s) more than {args.threshold:.0%} slower than the baseline:")
+            for name in regressions:
+                print(f"  {name}")
+            if args.compare:
+                exit_code = 1
+    elif args.compare:
+        print(f"No baseline at {args.baseline} (run with --save first)")
+        exit_code = 2
+
+    if args.save:
+        if os.path.exists(args.baseline):
+            # Keep cases that were not run this time
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                merged = json.load(f).get("results", {})
+            merged.update(results)
+            results = merged
+        save_baseline(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,42 +1,107 @@
-import customtkinter as ctk
-
-from modules.db_manager import DBManager
-from modules.auth_service import AuthService
-from modules.booking_service import BookingService
-from modules.room_service import RoomService
-from views.login_view import LoginView
-from views.register_view import RegisterView
-from views.main_app_view import MainAppView
-from views.sign_in import SignInView
-from views.search_view import SearchView
-from views.book_view import BookView
-from views.room_view import RoomView
-from views.account_view import AccountView
-from views.my_bookings_view import MyBookingsView
-from views.admin.admin_booking_view import AdminBookingView
-from views.admin.admin_room_view import AdminRoomView
-from views.admin.admin_user_view import AdminUserView
+import importlib
+import os
+
+# Imported first so the imports below can be timed (stdlib only)
+from modules.startup_profiler import StartupProfiler
+
+startup_profiler = StartupProfiler.from_environment()
+
+with startup_profiler.phase("imports"):
+    with startup_profiler.phase("customtkinter"):
+        import customtkinter as ctk
+
+    with startup_profiler.phase("modules"):
+        from modules.db_manager import DBManager
+        from modules.auth_service import AuthService
+        from modules.booking_service import BookingService
+        from modules.room_service import RoomService
+        from modules.image_cache import ImageCache
+        from modules.session_manager import SessionManager
+        from modules.db_watcher import DBWatcher
+        from modules.checkout_scheduler import CheckoutScheduler, interval_from_environment as checkout_interval_from_environment
+        from modules.event_bus import CUSTOMER_UPDATED, CUSTOMER_DELETED, ADMIN_UPDATED
+        from modules.metrics import start_from_environment as start_metrics
+        from modules.io_accounting import user_action
+        from modules.sampling_profiler import ScreenProfiler
+        from views.asset_cache import get_asset_cache
+
+# Frame name -> (module, class). Views are imported and built on first use.
+FRAME_REGISTRY = {
+    "LoginView": ("views.login_view", "LoginView"),
+    "RegisterView": ("views.register_view", "RegisterView"),
+    "MainAppView": ("views.main_app_view", "MainAppView"),
+    "SignInView": ("views.sign_in", "SignInView"),
+    "SearchView": ("views.search_view", "SearchView"),
+    "BookView": ("views.book_view", "BookView"),
+    "RoomView": ("views.room_view", "RoomView"),
+    "AccountView": ("views.account_view", "AccountView"),
+    "MyBookingsView": ("views.my_bookings_view", "MyBookingsView"),
+    "AdminBookingView": ("views.admin.admin_booking_view", "AdminBookingView"),
+    "AdminRoomView": ("views.admin.admin_room_view", "AdminRoomView"),
+    "AdminUserView": ("views.admin.admin_user_view", "AdminUserView"),
+}
+
+# Screens a user usually opens right after the login screen
+PREWARM_FRAMES = ("SignInView", "RegisterView", "MainAppView")
 
 
 class App(ctk.CTk):
     """Main application window acting as controller/state manager."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, profiler=None):
+        self.profiler = profiler or StartupProfiler()
+        with self.profiler.phase("window"):
+            super().__init__()
+
+            # Window configuration
+            self.title("An Hotel Booking System")
+            self.geometry("1000x750")
+            self.resizable(False, False)
 
-        # Window configuration
-        self.title("An Hotel Booking System")
-        self.geometry("1000x750")
-        self.resizable(False, False)
+        # Opt-in timing of service calls and db/ I/O (ANHOTEL_METRICS=1,
+        # ANHOTEL_METRICS_PORT=PORT for /metrics, ANHOTEL_METRICS_FILE=PATH)
+        self.metrics_server = start_metrics()
 
         # Dependency injection
-        self.db_manager = DBManager("db")
-        self.auth_service = AuthService("db/customer.json")
-        self.booking_service = BookingService(self.db_manager)
-        self.room_service = RoomService(self.db_manager)
+        with self.profiler.phase("services"):
+            self.db_manager = DBManager("db")
+            # Change events are collected for one frame, then delivered on the Tk thread
+            self.db_manager.events.set_scheduler(self.after)
+            self.auth_service = AuthService(self.db_manager)
+            self.booking_service = BookingService(self.db_manager)
+            self.image_cache = ImageCache()
+            self.room_service = RoomService(self.db_manager, self.image_cache)
+            # Hero/banner images shared by every view, backed by the thumbnail cache
+            self.asset_cache = get_asset_cache(self.image_cache)
+
+        # Session state (set ANHOTEL_SESSION_FILE to record the sessions open at every desk)
+        self.session_manager = SessionManager(
+            self.db_manager,
+            session_file=os.environ.get("ANHOTEL_SESSION_FILE")
+        )
+        self.session_token = None
+        # Profiles changed here or by another station are reloaded on next read
+        self.db_manager.events.subscribe(
+            self._invalidate_changed_users,
+            (CUSTOMER_UPDATED, CUSTOMER_DELETED, ADMIN_UPDATED)
+        )
+
+        # Turn writes to db/ by other desk stations into change events
+        # (set ANHOTEL_WATCH_DB=0 to disable)
+        self.db_watcher = DBWatcher(self.db_manager)
+        if os.environ.get("ANHOTEL_WATCH_DB", "1") != "0":
+            self.db_watcher.start()
 
-        # Session state
-        self.current_user = None
+        # Complete due checkouts periodically and at day rollover
+        # (every ANHOTEL_CHECKOUT_INTERVAL seconds, set ANHOTEL_CHECKOUT=0 to disable)
+        self.checkout_scheduler = CheckoutScheduler(
+            self.booking_service,
+            interval=checkout_interval_from_environment()
+        )
+        if os.environ.get("ANHOTEL_CHECKOUT", "1") != "0":
+            # Start once the main loop runs, so the first pass does not hold
+            # the DB lock while the window is being built
+            self.after(0, self.checkout_scheduler.start)
 
         # Main container for stacked frames
         self.container = ctk.CTkFrame(self, fg_color="transparent")
@@ -44,47 +109,151 @@ class App(ctk.CTk):
         self.container.grid_rowconfigure(0, weight=1)
         self.container.grid_columnconfigure(0, weight=1)
 
-        # View registry
+        # View registry (frames are built on first show_frame)
         self.frames = {}
-        for FrameClass in (
-            LoginView, RegisterView, MainAppView, SignInView,
-            SearchView, BookView, RoomView, AccountView, MyBookingsView,
-            AdminBookingView, AdminRoomView, AdminUserView
-        ):
-            frame = FrameClass(parent=self.container, controller=self)
-            frame.grid(row=0, column=0, sticky="nsew")
-            self.frames[FrameClass.__name__] = frame
+        self.current_frame = None
+        # Navigation sidebar shared by the customer views (built on first use)
+        self.sidebar = None
 
         # Initial screen
-        self.show_frame("LoginView")
+        with self.profiler.phase("initial_screen"):
+            self.show_frame("LoginView")
+
+        if self.profiler.enabled:
+            self.after(0, self._record_first_paint)
+
+        # Build likely next screens while the login screen is idle
+        # (set ANHOTEL_PREWARM=0 to disable)
+        if os.environ.get("ANHOTEL_PREWARM", "1") != "0":
+            self.after(200, self.prewarm_frames, list(PREWARM_FRAMES))
+
+        # F8 shows the file I/O of recent user actions (ANHOTEL_IO_OVERLAY=1 opens it
+        # at startup, ANHOTEL_IO_LOG=1 prints every action instead)
+        self.io_overlay = None
+        self.bind("<F8>", lambda event: self.toggle_io_overlay())
+        if os.environ.get("ANHOTEL_IO_OVERLAY") == "1":
+            self.after(0, self.toggle_io_overlay)
+
+        # F9 starts/stops sampling the UI thread and writes a collapsed-stack
+        # file for flamegraph tools to ANHOTEL_PROFILE_DIR (default profiles/)
+        self.screen_profiler = ScreenProfiler(self)
+        self.bind("<F9>", lambda event: self.toggle_screen_profiler())
+
+    def _record_first_paint(self):
+        """Flush pending drawing, then write the startup report."""
+        with self.profiler.phase("first_paint"):
+            self.update_idletasks()
+        self.profiler.mark("first_paint")
+        report_path = self.profiler.write_report()
+        print(f"Startup profile written to {report_path}")
+        if self.profiler.exit_after_paint:
+            self.destroy()
 
     # -------------------------------------------------------------------------
     # Session helpers
     # -------------------------------------------------------------------------
     def set_current_user(self, user_data):
-        """Store current logged-in user data."""
-        self.current_user = user_data
+        """Start a session for the logged-in user, or refresh the current one."""
+        if user_data is None:
+            self.end_session()
+            return
+        if self.session_token and self.session_manager.update_user(self.session_token, user_data):
+            return
+        self.end_session()
+        self.session_token = self.session_manager.create_session(user_data)
+
+    def _invalidate_changed_users(self, events):
+        """Mark sessions of changed customers/admins as stale."""
+        for event in events:
+            role = "admin" if event.type == ADMIN_UPDATED else "customer"
+            self.session_manager.invalidate_user(role, event.key)
+        # Let the sidebar pick up a renamed or deleted user
+        if self.sidebar is not None:
+            self.sidebar.refresh()
 
     def get_current_user(self):
         """Return current logged-in user data (or None)."""
-        return self.current_user
+        return self.session_manager.get_user(self.session_token)
+
+    def end_session(self):
+        """Drop the current session token."""
+        if self.session_token:
+            self.session_manager.end_session(self.session_token)
+            self.session_token = None
 
     def logout(self):
         """Clear session state and return to login screen."""
-        self.current_user = None
+        self.end_session()
         self.show_frame("LoginView")
 
     # -------------------------------------------------------------------------
     # Navigation helpers
     # -------------------------------------------------------------------------
-    def show_frame(self, page_name):
-        """Bring the specified frame to the front."""
+    def get_frame(self, page_name):
+        """Return the frame for page_name, building it on first access."""
         frame = self.frames.get(page_name)
-        if frame is None:
+        if frame is not None:
+            return frame
+        if page_name not in FRAME_REGISTRY:
             raise ValueError(f"Frame '{page_name}' not found")
-        frame.tkraise()
-        if hasattr(frame, "on_show") and callable(frame.on_show):
-            frame.on_show()
+        module_name, class_name = FRAME_REGISTRY[page_name]
+        with self.profiler.phase(f"frame:{page_name}"):
+            with self.profiler.phase("import"):
+                FrameClass = getattr(importlib.import_module(module_name), class_name)
+            with self.profiler.phase("construct"):
+                frame = FrameClass(parent=self.container, controller=self)
+            frame.grid(row=0, column=0, sticky="nsew")
+        # A newly gridded frame stacks on top; keep the current screen visible
+        frame.lower()
+        self.frames[page_name] = frame
+        return frame
+
+    def prewarm_frames(self, page_names):
+        """Build frames one per idle slot so the UI stays responsive."""
+        while page_names and page_names[0] in self.frames:
+            page_names.pop(0)
+        if not page_names:
+            return
+        try:
+            self.get_frame(page_names.pop(0))
+        except Exception as e:
+            print(f"Warning: Failed to prewarm frame: {e}")
+        if page_names:
+            self.after(50, self.prewarm_frames, page_names)
+
+    def is_frame_shown(self, frame):
+        """Return True if `frame` is the screen currently in front."""
+        return self.frames.get(self.current_frame) is frame
+
+    def get_sidebar(self):
+        """Return the shared customer sidebar, building it on first access."""
+        if self.sidebar is None:
+            from views.widgets.sidebar import Sidebar
+            self.sidebar = Sidebar(self.container, controller=self)
+        return self.sidebar
+
+    def show_frame(self, page_name):
+        """Bring the specified frame to the front."""
+        with user_action(f"open {page_name}"):
+            frame = self.get_frame(page_name)
+            frame.tkraise()
+            self.current_frame = page_name
+            if hasattr(frame, "on_show") and callable(frame.on_show):
+                frame.on_show()
+
+    def toggle_screen_profiler(self):
+        """Start or stop sampling the current screen."""
+        self.screen_profiler.toggle()
+        title = "An Hotel Booking System"
+        self.title(f"{title} [profiling]" if self.screen_profiler.running else title)
+
+    def toggle_io_overlay(self):
+        """Show or hide the per-action file I/O debug window."""
+        if self.io_overlay is None:
+            from views.widgets.io_overlay import IOOverlay
+            self.io_overlay = IOOverlay(self)
+            return
+        self.io_overlay.toggle()
 
     # -------------------------------------------------------------------------
     # Service accessors
@@ -101,34 +270,62 @@ class App(ctk.CTk):
     def get_room_service(self):
         return self.room_service
 
+    def get_image_cache(self):
+        return self.image_cache
+
+    def get_asset_cache(self):
+        return self.asset_cache
+
+    def get_session_manager(self):
+        return self.session_manager
+
+    def get_event_bus(self):
+        return self.db_manager.events
+
+    def destroy(self):
+        if self.screen_profiler.running:
+            self.screen_profiler.toggle()
+        self.checkout_scheduler.stop()
+        self.db_watcher.stop()
+        # Leave snapshots of the big tables for the next cold start
+        self.db_manager.refresh_snapshots(cached_only=True)
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        super().destroy()
+
     def is_admin(self):
         """Check if current user is admin"""
-        if not self.current_user:
+        current_user = self.get_current_user()
+        if not current_user:
             return False
-        return self.current_user.get("role") == "admin"
+        return current_user.get("role") == "admin"
 
     def is_customer(self):
         """Check if current user is customer"""
-        if not self.current_user:
+        current_user = self.get_current_user()
+        if not current_user:
             return False
-        return self.current_user.get("role") == "customer"
+        return current_user.get("role") == "customer"
 
     def show_book_view(self, room=None, checkin_date=None, checkout_date=None, num_guests=1):
         """Show BookView with booking parameters."""
-        book_view = self.frames.get("BookView")
+        book_view = self.get_frame("BookView")
         if book_view and hasattr(book_view, "update_booking_data"):
             book_view.update_booking_data(room, checkin_date, checkout_date, num_guests)
         self.show_frame("BookView")
     
     def show_search_view(self, checkin=None, checkout=None, guests=None):
         """Show SearchView with search parameters."""
-        search_view = self.frames.get("SearchView")
+        search_view = self.get_frame("SearchView")
         if search_view and hasattr(search_view, "set_search_criteria_and_reload"):
             search_view.set_search_criteria_and_reload(checkin, checkout, guests)
         self.show_frame("SearchView")
 
 
 if __name__ == "__main__":
-    app = App()
+    # Startup profiling: python main.py --profile-startup[=PATH] [--profile-exit]
+    # or ANHOTEL_PROFILE_STARTUP=PATH; check with
+    # python -m modules.startup_profiler PATH startup_budget.json
+    app = App(profiler=startup_profiler)
     app.mainloop()
 
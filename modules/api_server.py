@@ -0,0 +1,572 @@
+import argparse
+import asyncio
+import ipaddress
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import parse_qs, urlsplit
+
+from .db_manager import DBManager
+from .auth_service import AuthService
+from .booking_service import BookingService
+from .room_service import RoomService
+from .search_service import SearchService
+from .session_manager import SessionManager
+from .db_watcher import DBWatcher
+from .checkout_scheduler import CheckoutScheduler, interval_from_environment as checkout_interval_from_environment
+from .group_commit import GroupCommitter, DEFAULT_WINDOW_MS
+from . import metrics
+
+MAX_BODY_BYTES = 1024 * 1024
+IDLE_TIMEOUT = 30
+# Threads running read-only requests (searches, listings, logins)
+READ_WORKERS = 8
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# Fields never sent to clients
+PRIVATE_USER_FIELDS = ("passwordHash", "password")
+
+# Room statuses an admin may set directly ("Booked" is only set by bookings)
+MANUAL_ROOM_STATUSES = ("Available", "Cleaning", "Maintenance")
+
+
+class ApiError(Exception):
+    """Error returned to the client as {"error": message} with an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ApiRequest:
+    """A parsed HTTP request passed to route handlers"""
+
+    def __init__(self, method, path, query, headers, body, params=None, client=None):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+        self.params = params or {}
+        # Peer IP address (None when unknown)
+        self.client = client
+
+    @property
+    def is_local(self):
+        """True if the request came from this machine"""
+        try:
+            return ipaddress.ip_address(self.client).is_loopback
+        except (TypeError, ValueError):
+            return False
+
+    @property
+    def token(self):
+        auth = self.headers.get("authorization", "")
+        if auth.lower().startswith("bearer "):
+            return auth[7:].strip()
+        return None
+
+
+class ApiServer:
+    """
+    Headless HTTP/JSON API over the booking services
+
+    One process holds a single DBManager (and so a single in-memory cache)
+    shared by every client. Connections are handled by asyncio. Requests that
+    write run one at a time on the commit worker, so read-check-write
+    sequences such as "is the room free? then book it" cannot interleave
+    between clients. The worker commits the calls that arrive within a few
+    milliseconds as one group (see GroupCommitter): a response is sent only
+    after the group's writes are on disk, but a burst of bookings costs one
+    file write, not one per booking. Reads and logins (bcrypt) run on a
+    small thread pool instead, so they never hold up a commit group.
+
+    Clients log in with POST /auth/login and send the returned token as
+    `Authorization: Bearer <token>`. Room management, confirm and check-in
+    require an admin session.
+    """
+
+    def __init__(self, db_manager=None, host="127.0.0.1", port=8000, commit_window_ms=DEFAULT_WINDOW_MS):
+        """
+        Args:
+            db_manager: Shared DBManager (defaults to the db/ folder)
+            host: Interface to listen on (local only by default)
+            port: TCP port
+            commit_window_ms: How long a commit group waits for more requests
+        """
+        self.db = db_manager or DBManager("db")
+        self.host = host
+        self.port = port
+        self.auth_service = AuthService(self.db)
+        self.booking_service = BookingService(self.db)
+        self.room_service = RoomService(self.db)
+        self.search_service = SearchService(self.db)
+        self.session_manager = SessionManager(self.db)
+        self.committer = GroupCommitter(self.db, window_ms=commit_window_ms)
+        self._readers = ThreadPoolExecutor(max_workers=READ_WORKERS, thread_name_prefix="api-read")
+        self.routes = self._build_routes()
+        self._server = None
+
+    # ----------------------- Routing ----------------------------------------
+    def _build_routes(self):
+        # (method, path, handler, writes): only handlers that write go through
+        # the commit worker
+        routes = [
+            ("GET", r"/health", self.health, False),
+            ("GET", r"/metrics", self.get_metrics, False),
+            ("POST", r"/auth/login", self.login, False),
+            ("POST", r"/auth/logout", self.logout, False),
+            ("GET", r"/search", self.search_rooms, False),
+            ("GET", r"/room-types", self.list_room_types, False),
+            ("GET", r"/rooms", self.list_rooms, False),
+            ("POST", r"/rooms", self.create_room, True),
+            ("PATCH", r"/rooms/(?P<room_id>\d+)", self.update_room, True),
+            ("DELETE", r"/rooms/(?P<room_id>\d+)", self.delete_room, True),
+            ("POST", r"/rooms/(?P<room_id>\d+)/status", self.update_room_status, True),
+            ("GET", r"/bookings", self.list_bookings, False),
+            ("POST", r"/bookings", self.create_booking, True),
+            ("GET", r"/bookings/(?P<booking_id>\d+)", self.get_booking, False),
+            ("POST", r"/bookings/(?P<booking_id>\d+)/cancel", self.cancel_booking, True),
+            ("POST", r"/bookings/(?P<booking_id>\d+)/confirm", self.confirm_booking, True),
+            ("POST", r"/bookings/(?P<booking_id>\d+)/check-in", self.check_in_booking, True),
+            ("GET", r"/me/bookings", self.my_bookings, False),
+        ]
+        return [(method, re.compile(f"^{pattern}$"), handler, writes) for method, pattern, handler, writes in routes]
+
+    def match(self, method, path):
+        """
+        Find the handler for a request
+
+        Returns:
+            (handler, path params, whether the handler writes)
+
+        Raises:
+            ApiError: 404 for an unknown path, 405 for a known path with another method
+        """
+        path_known = False
+        for route_method, pattern, handler, writes in self.routes:
+            m = pattern.match(path)
+            if m is None:
+                continue
+            path_known = True
+            if route_method == method:
+                return handler, {k: int(v) for k, v in m.groupdict().items()}, writes
+        if path_known:
+            raise ApiError(405, "Method not allowed")
+        raise ApiError(404, "Not found")
+
+    async def dispatch(self, method, target, headers, body, client=None):
+        """
+        Run one request through its handler
+
+        Args:
+            client: Peer IP address
+
+        Returns:
+            (status, JSON-serializable payload or None)
+        """
+        split = urlsplit(target)
+        query = {k: v[0] for k, v in parse_qs(split.query).items()}
+        started = time.perf_counter()
+        handler = None
+        try:
+            handler, params, writes = self.match(method, split.path.rstrip("/") or "/")
+            data = {}
+            if body:
+                try:
+                    data = json.loads(body)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    raise ApiError(400, "Body must be JSON")
+                if not isinstance(data, dict):
+                    raise ApiError(400, "Body must be a JSON object")
+            request = ApiRequest(method, split.path, query, headers, data, params, client)
+            if writes:
+                result = await asyncio.wrap_future(self.committer.submit(handler, request))
+            else:
+                # Reads and password checks run in parallel, outside of commit groups
+                result = await asyncio.get_running_loop().run_in_executor(self._readers, handler, request)
+        except ApiError as e:
+            return e.status, {"error": e.message}
+        except Exception as e:
+            print(f"Warning: API request {method} {target} failed: {e}")
+            return 500, {"error": "Internal server error"}
+        finally:
+            if handler is not None:
+                metrics.registry.observe("api_request_seconds", time.perf_counter() - started,
+                                         {"route": f"{method} {handler.__name__}"})
+        if isinstance(result, tuple):
+            return result
+        return 200, result
+
+    # ----------------------- HTTP -------------------------------------------
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection (keep-alive supported)"""
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) and peer else None
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._send(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    length = -1
+                if length < 0 or length > MAX_BODY_BYTES:
+                    await self._send(writer, 413 if length > 0 else 400, {"error": "Invalid body length"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                status, payload = await self.dispatch(method.upper(), target, headers, body, client)
+                await self._send(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _send(self, writer, status, payload, keep_alive):
+        content_type = "application/json; charset=utf-8"
+        if payload is None or status == 204:
+            body = b""
+        elif isinstance(payload, str):
+            # Plain text (Prometheus metrics)
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def start(self):
+        """Start listening"""
+        self.committer.start()
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        if self._server is not None:
+            self._server.close()
+        self.committer.stop()
+        self._readers.shutdown(wait=True)
+
+    # ----------------------- Helpers ----------------------------------------
+    def current_user(self, request, role=None):
+        """
+        Return the user of the request's session
+
+        Raises:
+            ApiError: 401 without a valid session, 403 if the role does not match
+        """
+        user = self.session_manager.get_user(request.token)
+        if user is None:
+            raise ApiError(401, "Login required")
+        if role is not None and user.get("role") != role:
+            raise ApiError(403, f"{role.capitalize()} access required")
+        return user
+
+    def optional_user(self, request):
+        return self.session_manager.get_user(request.token) if request.token else None
+
+    def public_user(self, user):
+        return {k: v for k, v in user.items() if k not in PRIVATE_USER_FIELDS}
+
+    def require_fields(self, body, *fields):
+        missing = [f for f in fields if body.get(f) in (None, "")]
+        if missing:
+            raise ApiError(400, f"Missing fields: {', '.join(missing)}")
+
+    def parse_date(self, value, field):
+        parsed = self.search_service.parse_date(str(value)) if value else None
+        if parsed is None:
+            raise ApiError(400, f"{field} must be a date (YYYY-MM-DD or DD/MM/YYYY)")
+        return parsed
+
+    def parse_int(self, value, field, default=None):
+        if value in (None, ""):
+            return default
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ApiError(400, f"{field} must be an integer")
+
+    def parse_stay(self, checkin, checkout):
+        check_in = self.parse_date(checkin, "checkInDate")
+        check_out = self.parse_date(checkout, "checkOutDate")
+        if check_out <= check_in:
+            raise ApiError(400, "Check-out date must be after check-in date")
+        return check_in, check_out
+
+    def get_booking_or_404(self, booking_id):
+        booking = self.booking_service.view_booking_details(booking_id)
+        if booking is None:
+            raise ApiError(404, "Booking not found")
+        return booking
+
+    # ----------------------- Handlers ---------------------------------------
+    def health(self, request):
+        return {"status": "ok"}
+
+    def get_metrics(self, request):
+        """
+        Prometheus text of the in-process metrics (empty until metrics are enabled)
+
+        Served to scrapers on this machine and to admin sessions only.
+        """
+        if not request.is_local:
+            self.current_user(request, "admin")
+        return metrics.registry.render_prometheus()
+
+    def login(self, request):
+        self.require_fields(request.body, "email", "password")
+        user = self.auth_service.unified_login(request.body["email"], request.body["password"])
+        if user is None:
+            raise ApiError(401, "Invalid email or password")
+        token = self.session_manager.create_session(user)
+        return {"token": token, "user": self.public_user(user)}
+
+    def logout(self, request):
+        if request.token:
+            self.session_manager.end_session(request.token)
+        return 204, None
+
+    def search_rooms(self, request):
+        q = request.query
+        check_in, check_out = self.parse_stay(q.get("checkin"), q.get("checkout"))
+        room_type = q.get("type") or "All Types"
+        rooms = self.search_service.find_available_rooms(check_in, check_out, room_type)
+        rooms = self.search_service.apply_filters(
+            rooms,
+            min_price=self.parse_int(q.get("min_price"), "min_price", 0),
+            max_price=self.parse_int(q.get("max_price"), "max_price", 999999999),
+            room_type_name=room_type
+        )
+        return {"rooms": rooms}
+
+    def list_room_types(self, request):
+        return {"roomTypes": self.room_service.get_all_room_types()}
+
+    def list_rooms(self, request):
+        limit = self.parse_int(request.query.get("limit"), "limit", 50)
+        cursor = self.parse_int(request.query.get("cursor"), "cursor")
+        rooms, next_cursor = self.room_service.get_rooms_page(page_size=max(1, min(limit, 500)), cursor=cursor)
+        return {"rooms": rooms, "next_cursor": next_cursor}
+
+    def create_room(self, request):
+        self.current_user(request, "admin")
+        self.require_fields(request.body, "roomNumber", "typeID")
+        type_id = self.parse_int(request.body["typeID"], "typeID")
+        if self.room_service.db.get_room_type_by_id(type_id) is None:
+            raise ApiError(400, "Unknown room type")
+        status = request.body.get("status", "Available")
+        if status not in MANUAL_ROOM_STATUSES:
+            raise ApiError(400, f"status must be one of: {', '.join(MANUAL_ROOM_STATUSES)}")
+        room = self.room_service.create_room(str(request.body["roomNumber"]), type_id, status)
+        if room is None:
+            raise ApiError(409, "Room number already exists")
+        return 201, room
+
+    def update_room(self, request):
+        self.current_user(request, "admin")
+        room_id = request.params["room_id"]
+        if self.db.get_room_by_id(room_id) is None:
+            raise ApiError(404, "Room not found")
+        body = request.body
+        if "status" in body:
+            raise ApiError(400, "Change the status with POST /rooms/{id}/status")
+        success = self.room_service.update_room(
+            room_id,
+            room_number=str(body["roomNumber"]) if body.get("roomNumber") else None,
+            type_id=self.parse_int(body.get("typeID"), "typeID")
+        )
+        if not success:
+            raise ApiError(409, "Room number already exists")
+        return self.db.get_room_by_id(room_id)
+
+    def delete_room(self, request):
+        self.current_user(request, "admin")
+        if not self.room_service.delete_room(request.params["room_id"]):
+            raise ApiError(409, "Cannot delete room (room is booked or not found)")
+        return 204, None
+
+    def update_room_status(self, request):
+        self.current_user(request, "admin")
+        self.require_fields(request.body, "status")
+        if not self.room_service.update_room_status(request.params["room_id"], request.body["status"]):
+            raise ApiError(409, "Invalid status change")
+        return self.db.get_room_by_id(request.params["room_id"])
+
+    def list_bookings(self, request):
+        self.current_user(request, "admin")
+        limit = max(1, min(self.parse_int(request.query.get("limit"), "limit", 50), 500))
+        cursor = self.parse_int(request.query.get("cursor"), "cursor")
+        status = request.query.get("status")
+        if status:
+            bookings, next_cursor = self.booking_service.get_bookings_page(status, page_size=limit, cursor=cursor)
+        else:
+            bookings, next_cursor = self.db.get_bookings_page(after_id=cursor, limit=limit)
+        return {"bookings": bookings, "next_cursor": next_cursor}
+
+    def get_booking(self, request):
+        user = self.current_user(request)
+        booking = self.get_booking_or_404(request.params["booking_id"])
+        if user.get("role") != "admin" and booking.get("customerID") != user.get("customerID"):
+            raise ApiError(404, "Booking not found")
+        return booking
+
+    def my_bookings(self, request):
+        user = self.current_user(request, "customer")
+        return {"bookings": self.booking_service.view_booking_list(user.get("customerID"))}
+
+    def create_booking(self, request):
+        body = request.body
+        self.require_fields(body, "roomId", "checkInDate", "checkOutDate", "guestName", "guestPhone")
+        user = self.optional_user(request)
+        customer_id = user.get("customerID") if user and user.get("role") == "customer" else None
+
+        room_id = self.parse_int(body["roomId"], "roomId")
+        check_in, check_out = self.parse_stay(body["checkInDate"], body["checkOutDate"])
+        if check_in < date.today():
+            raise ApiError(400, "Check-in date cannot be in the past")
+        num_guests = self.parse_int(body.get("numGuests"), "numGuests", 1)
+
+        room = self.db.get_room_by_id(room_id)
+        if room is None:
+            raise ApiError(404, "Room not found")
+        room_type = self.db.get_room_type_by_id(room.get("typeID")) or {}
+        # Requests run one at a time, so the room cannot be taken between check and write
+        if not self.booking_service.check_room_availability(room_id, check_in, check_out):
+            raise ApiError(409, "Room is not available for these dates")
+
+        total = self.booking_service.calculate_total_amount(room_type.get("price", 0), check_in, check_out, num_guests)
+        booking = self.booking_service.create_booking(
+            room_id, check_in, check_out, num_guests,
+            body["guestName"], body["guestPhone"], body.get("guestEmail", ""), body.get("guestNationalID", ""),
+            total, customer_id
+        )
+        return 201, booking
+
+    def cancel_booking(self, request):
+        user = self.current_user(request)
+        booking_id = request.params["booking_id"]
+        self.get_booking_or_404(booking_id)
+        if user.get("role") == "admin":
+            success = self.booking_service.cancel_booking_admin(booking_id)
+        else:
+            success = self.booking_service.cancel_booking(booking_id, user.get("customerID"))
+        if not success:
+            raise ApiError(409, "Booking cannot be canceled")
+        return self.booking_service.view_booking_details(booking_id)
+
+    def confirm_booking(self, request):
+        self.current_user(request, "admin")
+        booking_id = request.params["booking_id"]
+        self.get_booking_or_404(booking_id)
+        if not self.booking_service.confirm_booking(booking_id):
+            raise ApiError(409, "Only pending bookings can be confirmed")
+        return self.booking_service.view_booking_details(booking_id)
+
+    def check_in_booking(self, request):
+        self.current_user(request, "admin")
+        booking_id = request.params["booking_id"]
+        self.get_booking_or_404(booking_id)
+        if not self.booking_service.check_in_booking(booking_id):
+            raise ApiError(409, "Only confirmed bookings can be checked in")
+        return self.booking_service.view_booking_details(booking_id)
+
+
+def main(argv=None):
+    """CLI: python -m modules.api_server [--host HOST] [--port PORT] [--data-folder DIR] [--commit-window-ms MS]"""
+    parser = argparse.ArgumentParser(description="An Hotel booking API server")
+    parser.add_argument("--host", default=os.environ.get("ANHOTEL_API_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("ANHOTEL_API_PORT", "8000")))
+    parser.add_argument("--data-folder", default="db")
+    parser.add_argument("--commit-window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="How long a write group waits for more requests (0 = no wait)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    # ANHOTEL_METRICS=1 records metrics for GET /metrics
+    metrics_server = metrics.start_from_environment()
+    db_manager = DBManager(args.data_folder)
+    server = ApiServer(db_manager, args.host, args.port, commit_window_ms=args.commit_window_ms)
+
+    # Same background services as the desktop app
+    watcher = DBWatcher(db_manager)
+    if os.environ.get("ANHOTEL_WATCH_DB", "1") != "0":
+        watcher.start()
+    scheduler = CheckoutScheduler(server.booking_service, interval=checkout_interval_from_environment())
+    if os.environ.get("ANHOTEL_CHECKOUT", "1") != "0":
+        scheduler.start()
+
+    async def run():
+        await server.start()
+        print(f"Booking API listening on http://{server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+        watcher.stop()
+        server.close()
+        db_manager.refresh_snapshots(cached_only=True)
+        if metrics_server is not None:
+            metrics_server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,20 @@
-import json
+from .db_manager import DBManager
+from .io_accounting import accounted
 import bcrypt
 from typing import Optional
 
 
 class AuthService:
-    def __init__(self, user_file_path: str = "db/customer.json"):
-        self.user_file = user_file_path
+    def __init__(self, db_manager: Optional[DBManager] = None):
+        # Credentials and profiles go through the shared DBManager cache
+        self.db = db_manager or DBManager("db")
 
     # ----------------------- Helper: Load / Save JSON -----------------------
     def load_users(self) -> list:
-        try:
-            with open(self.user_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
+        return self.db.get_all_customers()
 
     def save_users(self, users: list):
-        with open(self.user_file, "w", encoding="utf-8") as f:
-            json.dump(users, f, indent=4, ensure_ascii=False)
+        self.db.save_json(self.db.customer_file, users)
 
     # ----------------------- Hash / Verify Password -------------------------
     def hash_password(self, plain_password: str) -> str:
@@ -43,50 +40,51 @@ class AuthService:
         return False
 
     # --------------------------- Register -----------------------------------
+    @accounted("register")
     def register(self, name: str, email: str, phone: str, password: str) -> bool:
-        users = self.load_users()
+        # Hash outside the lock, bcrypt is deliberately slow
+        hashed_pw = self.hash_password(password)
 
-        # Check email exists
-        if any(u["email"].lower() == email.lower() for u in users):
-            return False  # Email already exists
+        with self.db.lock:
+            # Check email exists
+            if self.db.find_customer_by_email(email):
+                return False  # Email already exists
 
-        # Find max customerID and auto increment
-        max_id = 0
-        for u in users:
-            if "customerID" in u:
-                if u["customerID"] > max_id:
-                    max_id = u["customerID"]
-        
-        new_customer_id = max_id + 1
-        hashed_pw = self.hash_password(password)
+            # Find max customerID and auto increment
+            max_id = 0
+            for u in self.db.get_all_customers():
+                if "customerID" in u:
+                    if u["customerID"] > max_id:
+                        max_id = u["customerID"]
+            
+            new_customer_id = max_id + 1
 
-        new_user = {
-            "customerID": new_customer_id,
-            "name": name,
-            "email": email,
-            "phone": phone,
-            "passwordHash": hashed_pw
-        }
+            new_user = {
+                "customerID": new_customer_id,
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "passwordHash": hashed_pw
+            }
 
-        users.append(new_user)
-        self.save_users(users)
+            self.db.add_customer(new_user)
         return True
 
     # --------------------------- Login --------------------------------------
+    @accounted("login")
     def login(self, email: str, password: str) -> Optional[dict]:
-        users = self.load_users()
-
-        for u in users:
-            if u["email"].lower() == email.lower():
-                # Check both passwordHash (new format) and password (old format)
-                password_field = u.get("passwordHash") or u.get("password")
-                if password_field and self.verify_password(password, password_field):
-                    return u  # Login success
-                return None  # Wrong password
+        u = self.db.find_customer_by_email(email)
+        if u is None:
+            return None  # Email not found
 
-        return None  # Email not found
+        # Check both passwordHash (new format) and password (old format)
+        password_field = u.get("passwordHash") or u.get("password")
+        if password_field and self.verify_password(password, password_field):
+            return u  # Login success
+        return None  # Wrong password
 
     # --------------------------- Unified Login ------------------------------
+    @accounted("login")
     def unified_login(self, email: str, password: str) -> Optional[dict]:
         """
         Try to login as admin first, then as customer.
@@ -99,40 +97,34 @@ class AuthService:
         Returns:
             User dict with role field (from JSON or inferred), or None if not found
         """
-        # Step 1: Try admin.json first
-        try:
-            with open("db/admin.json", "r", encoding="utf-8") as f:
-                admins = json.load(f)
-        except FileNotFoundError:
-            admins = []
+        # Step 1: Try admins first
+        admin = self.db.find_admin_by_email(email)
+        if admin is not None:
+            password_field = admin.get("passwordHash")
+            if password_field and self.verify_password(password, password_field):
+                admin_data = admin.copy()
+                # Use role from JSON if exists, otherwise default to "admin"
+                if "role" not in admin_data:
+                    admin_data["role"] = "admin"
+                return admin_data
+            return None  # Wrong password for admin
         
-        for admin in admins:
-            if admin.get("email", "").lower() == email.lower():
-                password_field = admin.get("passwordHash")
-                if password_field and self.verify_password(password, password_field):
-                    admin_data = admin.copy()
-                    # Use role from JSON if exists, otherwise default to "admin"
-                    if "role" not in admin_data:
-                        admin_data["role"] = "admin"
-                    return admin_data
-                return None  # Wrong password for admin
-        
-        # Step 2: Try customer.json if not found in admin
-        users = self.load_users()
-        for user in users:
-            if user.get("email", "").lower() == email.lower():
-                password_field = user.get("passwordHash") or user.get("password")
-                if password_field and self.verify_password(password, password_field):
-                    user_data = user.copy()
-                    # Use role from JSON if exists, otherwise default to "customer"
-                    if "role" not in user_data:
-                        user_data["role"] = "customer"
-                    return user_data
-                return None  # Wrong password for customer
+        # Step 2: Try customers if not found in admin
+        user = self.db.find_customer_by_email(email)
+        if user is not None:
+            password_field = user.get("passwordHash") or user.get("password")
+            if password_field and self.verify_password(password, password_field):
+                user_data = user.copy()
+                # Use role from JSON if exists, otherwise default to "customer"
+                if "role" not in user_data:
+                    user_data["role"] = "customer"
+                return user_data
+            return None  # Wrong password for customer
         
         return None  # Not found in both
 
     # ----------------------- Change Password --------------------------------
+    @accounted("change password")
     def change_password(self, user_data: dict, old_pw: str, new_pw: str) -> tuple:
         """
         Change password for both customer and admin.
@@ -158,63 +150,33 @@ class AuthService:
         
         # Update password
         if user_role == "admin":
-            # Update admin in admin.json
-            try:
-                with open("db/admin.json", "r", encoding="utf-8") as f:
-                    admins = json.load(f)
-            except FileNotFoundError:
-                return False, None, "Không tìm thấy file admin.json"
-            
             admin_id = user_data.get("adminID")
-            found = False
-            for admin in admins:
-                if admin.get("adminID") == admin_id:
-                    admin["passwordHash"] = self.hash_password(new_pw)
-                    found = True
-                    # Return updated admin data
-                    updated_user = admin.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "admin"
-                    break
-            
-            if not found:
+            if self.db.get_admin_by_id(admin_id) is None:
                 return False, None, "Không tìm thấy tài khoản admin"
             
-            # Save admin.json
-            with open("db/admin.json", "w", encoding="utf-8") as f:
-                json.dump(admins, f, indent=4, ensure_ascii=False)
-            
-            return True, updated_user, None
+            self.db.update_admin(admin_id, {"passwordHash": self.hash_password(new_pw)})
+            return True, self._with_role(self.db.get_admin_by_id(admin_id), "admin"), None
         else:
-            # Update customer in customer.json
-            users = self.load_users()
-            found = False
-            for user in users:
-                if user.get("email", "").lower() == user_email.lower():
-                    # Check both passwordHash (new format) and password (old format)
-                    password_field = user.get("passwordHash") or user.get("password")
-                    if not password_field or not self.verify_password(old_pw, password_field):
-                        return False, None, "Mật khẩu hiện tại không đúng"
-                    
-                    # Update to passwordHash format
-                    user["passwordHash"] = self.hash_password(new_pw)
-                    # Remove old password field if exists
-                    if "password" in user:
-                        del user["password"]
-                    
-                    found = True
-                    updated_user = user.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "customer"
-                    break
-            
-            if not found:
+            user = self.db.find_customer_by_email(user_email)
+            if user is None:
                 return False, None, "Không tìm thấy tài khoản customer"
+
+            # Check both passwordHash (new format) and password (old format)
+            password_field = user.get("passwordHash") or user.get("password")
+            if not password_field or not self.verify_password(old_pw, password_field):
+                return False, None, "Mật khẩu hiện tại không đúng"
             
-            self.save_users(users)
-            return True, updated_user, None
+            # Update to passwordHash format and remove old password field if exists
+            customer_id = user.get("customerID")
+            self.db.update_customer(
+                customer_id,
+                {"passwordHash": self.hash_password(new_pw)},
+                remove_fields=["password"]
+            )
+            return True, self._with_role(self.db.get_customer_by_id(customer_id), "customer"), None
 
     # ----------------------- Admin Change Password (No Old Password) --------
+    @accounted("admin change password")
     def admin_change_password(self, user_data: dict, new_pw: str) -> tuple:
         """
         Admin can change user password without requiring old password.
@@ -237,56 +199,27 @@ class AuthService:
         
         # Update password
         if user_role == "admin":
-            # Update admin in admin.json
-            try:
-                with open("db/admin.json", "r", encoding="utf-8") as f:
-                    admins = json.load(f)
-            except FileNotFoundError:
-                return False, None, "Không tìm thấy file admin.json"
-            
             admin_id = user_data.get("adminID")
-            found = False
-            for admin in admins:
-                if admin.get("adminID") == admin_id:
-                    admin["passwordHash"] = self.hash_password(new_pw)
-                    found = True
-                    updated_user = admin.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "admin"
-                    break
-            
-            if not found:
+            if self.db.get_admin_by_id(admin_id) is None:
                 return False, None, "Không tìm thấy tài khoản admin"
             
-            # Save admin.json
-            with open("db/admin.json", "w", encoding="utf-8") as f:
-                json.dump(admins, f, indent=4, ensure_ascii=False)
-            
-            return True, updated_user, None
+            self.db.update_admin(admin_id, {"passwordHash": self.hash_password(new_pw)})
+            return True, self._with_role(self.db.get_admin_by_id(admin_id), "admin"), None
         else:
-            # Update customer in customer.json
-            users = self.load_users()
-            found = False
-            for user in users:
-                if user.get("email", "").lower() == user_email.lower():
-                    user["passwordHash"] = self.hash_password(new_pw)
-                    # Remove old password field if exists
-                    if "password" in user:
-                        del user["password"]
-                    
-                    found = True
-                    updated_user = user.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "customer"
-                    break
-            
-            if not found:
+            user = self.db.find_customer_by_email(user_email)
+            if user is None:
                 return False, None, "Không tìm thấy tài khoản customer"
-            
-            self.save_users(users)
-            return True, updated_user, None
+
+            customer_id = user.get("customerID")
+            self.db.update_customer(
+                customer_id,
+                {"passwordHash": self.hash_password(new_pw)},
+                remove_fields=["password"]
+            )
+            return True, self._with_role(self.db.get_customer_by_id(customer_id), "customer"), None
 
     # ----------------------- Update User Info -------------------------------
+    @accounted("update user info")
     def update_user_info(self, user_data: dict, name: str, phone: str, identity: str = None) -> tuple:
         """
         Update user information for both customer and admin.
@@ -315,46 +248,22 @@ class AuthService:
             update_data["identity"] = identity
         
         if user_role == "admin":
-            # Update admin in admin.json
-            try:
-                with open("db/admin.json", "r", encoding="utf-8") as f:
-                    admins = json.load(f)
-            except FileNotFoundError:
-                return False, None, "Không tìm thấy file admin.json"
-            
-            found = False
-            for admin in admins:
-                if admin.get("adminID") == user_id:
-                    admin.update(update_data)
-                    found = True
-                    # Return updated admin data
-                    updated_user = admin.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "admin"
-                    break
-            
-            if not found:
+            if self.db.get_admin_by_id(user_id) is None:
                 return False, None, "Không tìm thấy tài khoản admin"
             
-            # Save admin.json
-            with open("db/admin.json", "w", encoding="utf-8") as f:
-                json.dump(admins, f, indent=4, ensure_ascii=False)
-            
-            return True, updated_user, None
+            self.db.update_admin(user_id, update_data)
+            return True, self._with_role(self.db.get_admin_by_id(user_id), "admin"), None
         else:
-            # Update customer using DBManager
-            # We need to import it here to avoid circular import
-            from modules.db_manager import DBManager
-            db_manager = DBManager("db")
-            db_manager.update_customer(user_id, update_data)
-            
-            # Get updated user data
-            customers = db_manager.get_all_customers()
-            for customer in customers:
-                if customer.get("customerID") == user_id:
-                    updated_user = customer.copy()
-                    if "role" not in updated_user:
-                        updated_user["role"] = "customer"
-                    return True, updated_user, None
+            self.db.update_customer(user_id, update_data)
             
-            return False, None, "Không tìm thấy user sau khi cập nhật"
\ No newline at end of file
+            # Updated record comes from the ID index, no full re-read
+            updated_user = self.db.get_customer_by_id(user_id)
+            if updated_user is None:
+                return False, None, "Không tìm thấy user sau khi cập nhật"
+            return True, self._with_role(updated_user, "customer"), None
+
+    def _with_role(self, user: dict, role: str) -> dict:
+        """Return the user dict with a role field (from JSON or default)"""
+        if "role" not in user:
+            user["role"] = role
+        return user
@@ -1,6 +1,17 @@
 from .db_manager import DBManager
 from datetime import datetime, date
 
+# Stored booking status -> status shown in the admin tabs
+STATUS_MAP = {
+    "Pending": "Pending",
+    "Confirmed": "Confirmed",
+    "In stay": "In stay",
+    "In Stay": "In stay",
+    "Completed": "Completed",
+    "Cancelled": "Cancelled",
+    "Canceled": "Cancelled"
+}
+
 class BookingService:
     def __init__(self, db_manager=None):
         self.db = db_manager or DBManager("db")
@@ -24,9 +35,6 @@ class BookingService:
         Returns:
             Booking data with auto-generated bookingID
         """
-        bookings = self.db.get_all_bookings()
-        new_booking_id = len(bookings) + 1
-        
         # Convert dates to ISO format if they are date objects
         if isinstance(checkin_date, date) and not isinstance(checkin_date, datetime):
             checkin_date = datetime.combine(checkin_date, datetime.min.time()).isoformat()
@@ -34,7 +42,7 @@ class BookingService:
             checkout_date = datetime.combine(checkout_date, datetime.min.time()).isoformat()
         
         booking_data = {
-            "bookingID": new_booking_id,
+            "bookingID": None,
             "customerID": customer_id,  # Set from logged-in user session
             "roomId": room_id,
             "checkInDate": checkin_date,
@@ -48,11 +56,13 @@ class BookingService:
             "guestNationalID": guest_national_id
         }
         
-        # Save booking
-        self.db.add_booking(booking_data)
+        with self.db.lock:
+            # Take the next ID and save under one lock so concurrent bookings get distinct IDs
+            booking_data["bookingID"] = self.db.next_booking_id()
+            self.db.add_booking(booking_data)
         
-        # Update room status to "Booked"
-        self.db.update_room_status(room_id, "Booked")
+            # Update room status to "Booked"
+            self.db.update_room_status(room_id, "Booked")
         
         return booking_data
     
@@ -79,11 +89,8 @@ class BookingService:
         return total
 
     def book_room(self, customer_id, room_id, check_in, check_out, num_guests, total_amount, guest_name, guest_phone):
-        bookings = self.db.get_all_bookings()
-        new_booking_id = len(bookings) + 1
-        
         booking_data = {
-            "bookingID": new_booking_id,
+            "bookingID": None,
             "customerID": customer_id,
             "roomId": room_id,
             "checkInDate": check_in,
@@ -95,18 +102,18 @@ class BookingService:
             "guestPhone": guest_phone
         }
         
-        self.db.add_booking(booking_data)
+        with self.db.lock:
+            booking_data["bookingID"] = self.db.next_booking_id()
+            self.db.add_booking(booking_data)
         return booking_data
 
     def view_booking_list(self, customer_id):
         return self.db.get_customer_bookings(customer_id)
 
     def view_booking_details(self, booking_id, customer_id=None):
-        bookings = self.db.get_all_bookings()
-        for booking in bookings:
-            if booking.get("bookingID") == booking_id:
-                if customer_id is None or booking.get("customerID") == customer_id:
-                    return booking
+        booking = self.db.get_booking_by_id(booking_id)
+        if booking and (customer_id is None or booking.get("customerID") == customer_id):
+            return booking
         return None
 
     def cancel_booking(self, booking_id, customer_id):
@@ -130,11 +137,8 @@ class BookingService:
     
     def get_room_number_by_id(self, room_id):
         """Get room number by room ID"""
-        rooms = self.db.get_all_rooms()
-        for room in rooms:
-            if room.get("roomId") == room_id:
-                return room.get("roomNumber", "")
-        return ""
+        room = self.db.get_room_by_id(room_id)
+        return room.get("roomNumber", "") if room else ""
     
     def get_bookings_by_status(self, status):
         """
@@ -148,15 +152,7 @@ class BookingService:
         """
         bookings = self.db.get_all_bookings()
         # Normalize status names
-        status_map = {
-            "Pending": "Pending",
-            "Confirmed": "Confirmed",
-            "In stay": "In stay",
-            "In Stay": "In stay",
-            "Completed": "Completed",
-            "Cancelled": "Cancelled",
-            "Canceled": "Cancelled"
-        }
+        status_map = STATUS_MAP
         normalized_status = status_map.get(status, status)
         
         filtered = []
@@ -169,6 +165,49 @@ class BookingService:
                 filtered.append(booking)
         return filtered
     
+    def get_revenue_by_month(self, start=None, end=None, statuses=("Confirmed", "In stay", "In Stay", "Completed")):
+        """
+        Total booked amount per check-in month
+
+        Streams booking.json (see DBManager.iter_bookings), so the whole
+        history can be summed without loading it.
+
+        Args:
+            start: First check-in date included (date or YYYY-MM-DD string)
+            end: Check-in date excluded (date or YYYY-MM-DD string)
+            statuses: Booking statuses counted as revenue
+
+        Returns:
+            {"YYYY-MM": (bookings, total amount)}, in month order
+
+        Raises:
+            ValueError: start or end is not a valid date
+        """
+        months = {}
+        for booking in self.db.iter_bookings(statuses=statuses, start=start, end=end):
+            month = str(booking.get("checkInDate", ""))[:7]
+            count, total = months.get(month, (0, 0))
+            months[month] = (count + 1, total + (booking.get("totalAmount") or 0))
+        return dict(sorted(months.items()))
+
+    def get_bookings_page(self, status, page_size=50, cursor=None):
+        """
+        Get one page of bookings with a status, ordered by bookingID
+        
+        Args:
+            status: Booking status (Pending, Confirmed, In stay, Completed, Cancelled)
+            page_size: Maximum number of bookings to return
+            cursor: next_cursor of the previous page (None for the first page)
+            
+        Returns:
+            (bookings, next_cursor) - next_cursor is None on the last page
+        """
+        normalized_status = STATUS_MAP.get(status, status)
+        # Every stored spelling of the status (e.g. "Canceled" and "Cancelled")
+        statuses = {normalized_status}
+        statuses.update(k for k, v in STATUS_MAP.items() if v == normalized_status)
+        return self.db.get_bookings_page(sorted(statuses), after_id=cursor, limit=page_size)
+    
     def confirm_booking(self, booking_id):
         """
         Confirm a pending booking (Pending -> Confirmed)
@@ -221,37 +260,46 @@ class BookingService:
             return True
         return False
     
-    def auto_complete_checkouts(self):
+    def auto_complete_checkouts(self, today=None):
         """
         Automatically change In stay bookings to Completed if checkout date has passed
-        
+
+        Only In stay bookings due for checkout are visited (through an index
+        ordered by checkout date), and all transitions are applied in one
+        batch: one write per table, with the change events published after
+        the batch commits and the DB lock is released.
+
+        Args:
+            today: Date to complete checkouts for (defaults to today)
+
         Returns:
             Number of bookings updated
         """
-        today = date.today()
-        bookings = self.get_bookings_by_status("In stay")
-        updated_count = 0
-        
-        for booking in bookings:
-            checkout_date_str = booking.get("checkOutDate", "")
-            if not checkout_date_str:
-                continue
-            
-            try:
-                # Parse checkout date (handle both ISO format and date-only format)
-                if "T" in checkout_date_str:
-                    checkout_date = datetime.fromisoformat(checkout_date_str.replace("Z", "+00:00")).date()
-                else:
-                    checkout_date = datetime.strptime(checkout_date_str, "%Y-%m-%d").date()
-                
-                # If checkout date has passed, mark as completed
+        today = today or date.today()
+        in_stay_statuses = [k for k, v in STATUS_MAP.items() if v == "In stay"]
+
+        with self.db.batch():
+            completed = {}
+            freed_rooms = {}
+            for booking in self.db.get_bookings_due_for_checkout(in_stay_statuses, today):
+                checkout_date_str = booking.get("checkOutDate", "")
+                if not checkout_date_str:
+                    continue
+                try:
+                    # Parse checkout date (handle both ISO format and date-only format)
+                    if "T" in checkout_date_str:
+                        checkout_date = datetime.fromisoformat(checkout_date_str.replace("Z", "+00:00")).date()
+                    else:
+                        checkout_date = datetime.strptime(checkout_date_str, "%Y-%m-%d").date()
+                except Exception:
+                    # Skip if date parsing fails
+                    continue
                 if checkout_date <= today:
-                    self.db.update_booking_status(booking.get("bookingID"), "Completed")
-                    # Update room status to Available
-                    self.db.update_room_status(booking.get("roomId"), "Available")
-                    updated_count += 1
-            except Exception:
-                # Skip if date parsing fails
-                continue
-        
-        return updated_count
\ No newline at end of file
+                    completed[booking.get("bookingID")] = "Completed"
+                    freed_rooms[booking.get("roomId")] = "Available"
+
+            if not completed:
+                return 0
+            updated_count = self.db.update_booking_statuses(completed)
+            self.db.update_room_statuses(freed_rooms)
+        return updated_count
@@ -0,0 +1,99 @@
+import os
+import threading
+from datetime import datetime, timedelta
+
+DEFAULT_INTERVAL = 300
+
+
+def interval_from_environment():
+    """
+    Seconds between checkout runs, from ANHOTEL_CHECKOUT_INTERVAL
+
+    A value that is not a whole number of seconds above 0 is reported and
+    replaced by DEFAULT_INTERVAL, so a typo does not stop the app at startup.
+    """
+    value = os.environ.get("ANHOTEL_CHECKOUT_INTERVAL")
+    if value is None:
+        return DEFAULT_INTERVAL
+    try:
+        interval = int(value)
+    except ValueError:
+        interval = None
+    if interval is None or interval <= 0:
+        print(f"Warning: Invalid ANHOTEL_CHECKOUT_INTERVAL={value!r} (expected seconds > 0), "
+              f"using {DEFAULT_INTERVAL}")
+        return DEFAULT_INTERVAL
+    return interval
+
+
+class CheckoutScheduler:
+    """
+    Completes due checkouts in the background
+
+    A daemon thread runs BookingService.auto_complete_checkouts once at start,
+    then every `interval` seconds and right after each midnight. The status
+    changes reach the views as change events, so screens no longer need to
+    run the check when they are opened.
+    """
+
+    def __init__(self, booking_service, interval=DEFAULT_INTERVAL):
+        """
+        Args:
+            booking_service: BookingService used to complete checkouts
+            interval: Seconds between runs (a run also happens at day rollover)
+        """
+        self.booking_service = booking_service
+        self.interval = interval
+        self.last_run = None
+        self.last_count = 0
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self):
+        """Start the scheduler thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="checkout-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the scheduler thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def run_now(self):
+        """Ask the thread to run a check as soon as possible"""
+        self._wake.set()
+
+    def seconds_until_next_run(self, now=None):
+        """Return the delay before the next run: the interval, or less if midnight comes first"""
+        now = now or datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # Run just after midnight so the new day's checkouts are due
+        return max(0.0, min(self.interval, (midnight - now).total_seconds() + 1))
+
+    def run_once(self):
+        """
+        Complete every due checkout now
+
+        Returns:
+            Number of bookings completed
+        """
+        try:
+            self.last_count = self.booking_service.auto_complete_checkouts()
+        except Exception as e:
+            print(f"Warning: Failed to complete checkouts: {e}")
+            self.last_count = 0
+        self.last_run = datetime.now()
+        return self.last_count
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.run_once()
+            self._wake.wait(self.seconds_until_next_run())
+            self._wake.clear()
@@ -1,125 +1,919 @@
-import json
+import bisect
+import heapq
+import itertools
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, date
 
+from . import event_bus
+from . import io_accounting
+from .event_bus import EventBus
+from .metrics import registry as metrics
+from .json_codec import JsonCodec, iter_array
+from .snapshot import Snapshot, write_snapshot
+
+
+class DeferringLock:
+    """
+    Re-entrant lock that can defer work until the current thread releases it
+
+    call_after_release() runs a callback at once when the calling thread does
+    not hold the lock, otherwise when that thread leaves its outermost `with`
+    block. DBManager publishes change events this way, so the event bus and
+    its subscribers are never called with the lock held, whatever outer
+    block (a service, a batch) the write happened in.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def acquire(self, blocking=True, timeout=-1):
+        if not self._lock.acquire(blocking, timeout):
+            return False
+        self._local.depth = getattr(self._local, "depth", 0) + 1
+        return True
+
+    def release(self):
+        self._local.depth -= 1
+        deferred = None
+        if not self._local.depth:
+            deferred = getattr(self._local, "deferred", None)
+            self._local.deferred = []
+        self._lock.release()
+        for callback, args in deferred or ():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Warning: Deferred database callback failed: {e}")
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def held(self):
+        """Return True if the calling thread holds the lock"""
+        return getattr(self._local, "depth", 0) > 0
+
+    def call_after_release(self, callback, *args):
+        """Run callback(*args) once the calling thread no longer holds the lock"""
+        if not self.held():
+            callback(*args)
+            return
+        if not hasattr(self._local, "deferred"):
+            self._local.deferred = []
+        self._local.deferred.append((callback, args))
+
 
 class DBManager:
-    def __init__(self, data_folder="data"):
+    # Indexed (field, ignore case) pairs of each table's binary snapshot
+    SNAPSHOT_INDEXES = {
+        "booking.json": (("bookingID", False), ("customerID", False)),
+        "customer.json": (("customerID", False), ("email", False), ("email", True)),
+        "admin.json": (("adminID", False), ("username", False), ("email", True)),
+        "room.json": (("roomId", False), ("roomNumber", False)),
+        "roomType.json": (("typeID", False),),
+    }
+    # Smaller tables parse fast enough that a snapshot is not worth keeping
+    SNAPSHOT_MIN_BYTES = 1024 * 1024
+
+    def __init__(self, data_folder="data", events=None, codec=None):
         self.data_folder = data_folder
+        # Compact JSON through orjson/msgspec when installed (see JsonCodec)
+        self.codec = codec or JsonCodec()
         self.room_type_file = os.path.join(data_folder, "roomType.json")
         self.room_file = os.path.join(data_folder, "room.json")
         self.customer_file = os.path.join(data_folder, "customer.json")
         self.booking_file = os.path.join(data_folder, "booking.json")
         self.admin_file = os.path.join(data_folder, "admin.json")
 
-    def load_json(self, file_path):
+        # Parsed files are cached and revalidated by mtime/size, so writes made
+        # by another process are still picked up on the next read.
+        # Hold `lock` around read-modify-write sequences that span several calls;
+        # change events are published once it is released (see DeferringLock).
+        self.lock = DeferringLock()
+        self._tables = {}
+
+        # Change events for every write made through this manager
+        self.events = events or EventBus()
+        # Optional function(file_path, old_data, new_data) called when a cached
+        # table is found changed on disk by another process (see DBWatcher),
+        # after the reading thread has released the lock
+        self.on_external_change = None
+
+        # Flush written files to stable storage before reporting them saved
+        self.fsync = True
+        # Group commit state (see batch())
+        self._batch_depth = 0
+        self._batch_owner = None
+        self._dirty = set()
+        self._batched_events = []
+
+        # Binary snapshots answer lookups on tables not parsed yet (see
+        # refresh_snapshots()); the JSON files stay the source of truth
+        self.snapshot_folder = os.path.join(data_folder, ".snapshots")
+        self.use_snapshots = os.environ.get("ANHOTEL_SNAPSHOTS", "1") != "0"
+        self._snapshots = {}  # file path -> (JSON stamp, Snapshot or None)
+
+    # ----------------------- Cached file access -----------------------------
+    def _file_stamp(self, file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
-        except json.JSONDecodeError:
-            return []
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_table(self, file_path):
+        """
+        Return the cached parsed contents of a JSON file
+
+        The returned object is shared with the cache and must not be mutated;
+        use load_json() to get a private copy.
+        """
+        with self.lock:
+            entry = self._tables.get(file_path)
+            if file_path in self._dirty:
+                # Written in the open batch, not on disk yet
+                return entry["data"]
+            stamp = self._file_stamp(file_path)
+            if entry is not None and entry["stamp"] == stamp:
+                if metrics.enabled:
+                    metrics.inc("db_cache_hits_total", {"table": os.path.basename(file_path)})
+                io_accounting.record("cache_hit", file_path)
+                return entry["data"]
+            started = time.perf_counter()
+            try:
+                with open(file_path, "rb") as f:
+                    data = self.codec.loads(f.read())
+            except FileNotFoundError:
+                data = []
+            except ValueError:
+                data = []
+            elapsed = time.perf_counter() - started
+            nbytes = stamp[1] if stamp else 0
+            io_accounting.record("read", file_path, nbytes, elapsed)
+            if metrics.enabled:
+                labels = {"table": os.path.basename(file_path)}
+                metrics.inc("db_cache_misses_total", labels)
+                metrics.observe("db_read_seconds", elapsed, labels)
+                metrics.inc("db_read_bytes_total", labels, nbytes)
+            self._tables[file_path] = {"stamp": stamp, "data": data, "indexes": {}}
+            if entry is not None and self.on_external_change is not None:
+                # Diffed and published once this thread releases the lock
+                self.lock.call_after_release(self.on_external_change, file_path, entry["data"], data)
+            return data
+
+    def _write_table(self, file_path, data, indexes=None):
+        """
+        Atomically write a file and make `data` the cached contents
+
+        Inside batch() the file is only marked dirty and written once when
+        the batch commits.
+
+        Args:
+            indexes: Indexes already valid for `data` (see _append_record)
+        """
+        with self.lock:
+            if self._batch_depth:
+                self._tables[file_path] = {"stamp": None, "data": data, "indexes": indexes or {}}
+                self._dirty.add(file_path)
+                return
+            self._flush_table(file_path, data, indexes)
+
+    def _flush_table(self, file_path, data, indexes=None):
+        with self.lock:
+            started = time.perf_counter()
+            # Create directory if it doesn't exist
+            directory = os.path.dirname(file_path)
+            if directory:  # Only create if directory path is not empty
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{file_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self.codec.dumps(data))
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+            if self.fsync:
+                self._fsync_directory(directory or ".")
+            stamp = self._file_stamp(file_path)
+            self._tables[file_path] = {
+                "stamp": stamp,
+                "data": data,
+                "indexes": indexes or {}
+            }
+            elapsed = time.perf_counter() - started
+            nbytes = stamp[1] if stamp else 0
+            io_accounting.record("write", file_path, nbytes, elapsed)
+            if metrics.enabled:
+                labels = {"table": os.path.basename(file_path)}
+                metrics.observe("db_write_seconds", elapsed, labels)
+                metrics.inc("db_written_bytes_total", labels, nbytes)
+
+    def _fsync_directory(self, directory):
+        """Make a rename in `directory` durable (POSIX only)"""
+        if os.name != "posix":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several writes into one commit
+
+        The lock is held for the whole block. Tables written inside it are
+        kept in the cache (reads see them) and each is written and fsynced
+        once on exit from the outermost batch; change events are published
+        after that commit. Batches nest: if a block raises, the writes made
+        inside that block alone are discarded and the exception propagates,
+        so an inner batch acts as a savepoint.
+
+        Raises:
+            OSError: The commit failed (the cache is reset to what is on disk)
+        """
+        with self.lock:
+            saved = (dict(self._tables), set(self._dirty), len(self._batched_events))
+            self._batch_depth += 1
+            self._batch_owner = threading.get_ident()
+            try:
+                yield self
+            except BaseException:
+                for file_path, entry in saved[0].items():
+                    if self._tables.get(file_path) is not entry:
+                        # Its indexes may have been extended in place (_append_record)
+                        entry["indexes"] = {}
+                self._tables.clear()
+                self._tables.update(saved[0])
+                self._dirty = saved[1]
+                del self._batched_events[saved[2]:]
+                raise
+            finally:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._batch_owner = None
+            if self._batch_depth:
+                return
+            events = self._commit_batch()
+        for type, key, data in events:
+            self.lock.call_after_release(self.events.publish, type, key, data)
+
+    def _commit_batch(self):
+        """Write every dirty table once; returns the events held back by the batch"""
+        dirty, self._dirty = sorted(self._dirty), set()
+        events, self._batched_events = self._batched_events, []
+        try:
+            for file_path in dirty:
+                entry = self._tables[file_path]
+                self._flush_table(file_path, entry["data"], entry["indexes"])
+        except BaseException:
+            for file_path in dirty:
+                self._tables.pop(file_path, None)
+            raise
+        return events
+
+    def _copy_data(self, data):
+        """Copy a table one level deep (records are flat dicts)"""
+        if isinstance(data, list):
+            return [r.copy() if isinstance(r, dict) else r for r in data]
+        if isinstance(data, dict):
+            return {k: v.copy() if isinstance(v, dict) else v for k, v in data.items()}
+        return data
+
+    def _get_index(self, file_path, field, lower=False):
+        """Return a cached {value: record} index over a table (first match wins)"""
+        with self.lock:
+            data = self._read_table(file_path)
+            indexes = self._tables[file_path]["indexes"]
+            key = ("unique", field, lower)
+            index = indexes.get(key)
+            if index is None:
+                index = {}
+                for record in data:
+                    value = record.get(field)
+                    if lower and isinstance(value, str):
+                        value = value.lower()
+                    index.setdefault(value, record)
+                indexes[key] = index
+            return index
+
+    def _get_max(self, file_path, field):
+        """Return the cached largest integer value of a field (0 for an empty table)"""
+        with self.lock:
+            data = self._read_table(file_path)
+            indexes = self._tables[file_path]["indexes"]
+            key = ("max", field)
+            if key not in indexes:
+                indexes[key] = max(
+                    (r[field] for r in data if isinstance(r.get(field), int) and not isinstance(r[field], bool)),
+                    default=0
+                )
+            return indexes[key]
+
+    def _append_record(self, file_path, record):
+        """
+        Add one record to a table without copying the records already in it
+
+        The unique and group indexes and the max counters of the cached table
+        are extended with the record instead of being rebuilt; sorted indexes
+        are rebuilt on next use.
+        """
+        with self.lock:
+            data = self._read_table(file_path)
+            entry = self._tables[file_path]
+            new_data = (data if isinstance(data, list) else []) + [record]
+            indexes = {}
+            for key, index in entry["indexes"].items():
+                kind, field = key[0], key[1]
+                value = record.get(field)
+                if kind == "unique":
+                    if key[2] and isinstance(value, str):
+                        value = value.lower()
+                    index.setdefault(value, record)
+                elif kind == "group":
+                    # New list: readers may be iterating the old one
+                    index[value] = index.get(value, []) + [record]
+                elif kind == "max":
+                    if isinstance(value, int) and not isinstance(value, bool):
+                        index = max(index, value)
+                else:
+                    continue
+                indexes[key] = index
+            try:
+                self._write_table(file_path, new_data, indexes)
+            except BaseException:
+                # The extended indexes no longer match the cached table
+                entry["indexes"] = {}
+                raise
+
+    def _get_group_index(self, file_path, field):
+        """Return a cached {value: [records]} index over a table"""
+        with self.lock:
+            data = self._read_table(file_path)
+            indexes = self._tables[file_path]["indexes"]
+            key = ("group", field)
+            index = indexes.get(key)
+            if index is None:
+                index = {}
+                for record in data:
+                    index.setdefault(record.get(field), []).append(record)
+                indexes[key] = index
+            return index
+
+    def _get_sorted_group_index(self, file_path, field, sort_field):
+        """
+        Return a cached {value: (sort keys, records)} index over a table
+
+        Each group is sorted by sort_field so pages can be cut with bisect.
+        With field=None the whole table is a single group under the key None.
+        """
+        with self.lock:
+            data = self._read_table(file_path)
+            indexes = self._tables[file_path]["indexes"]
+            key = ("sorted_group", field, sort_field)
+            index = indexes.get(key)
+            if index is None:
+                groups = {}
+                for record in data:
+                    if record.get(sort_field) is None:
+                        continue
+                    group = record.get(field) if field else None
+                    groups.setdefault(group, []).append(record)
+                index = {}
+                for group, records in groups.items():
+                    records.sort(key=lambda r: r[sort_field])
+                    index[group] = ([r[sort_field] for r in records], records)
+                indexes[key] = index
+            return index
+
+    def _get_page(self, file_path, sort_field, field=None, values=None, after_id=None, limit=50):
+        """Keyset pagination over the groups of a sorted group index"""
+        index = self._get_sorted_group_index(file_path, field, sort_field)
+        groups = [index[v] for v in ([None] if field is None else values) if v in index]
+        slices = []
+        for keys, records in groups:
+            start = 0 if after_id is None else bisect.bisect_right(keys, after_id)
+            slices.append(records[start:start + limit + 1])
+        page = list(itertools.islice(heapq.merge(*slices, key=lambda r: r[sort_field]), limit + 1))
+        next_cursor = page[limit - 1][sort_field] if len(page) > limit else None
+        return [r.copy() for r in page[:limit]], next_cursor
+
+    def _find_one(self, file_path, field, value, lower=False):
+        """Return a copy of the first record whose field equals value (or None)"""
+        records = self._snapshot_lookup(file_path, field, value, lower)
+        if records is not None:
+            return records[0] if records else None
+        if lower and isinstance(value, str):
+            value = value.lower()
+        record = self._get_index(file_path, field, lower).get(value)
+        return record.copy() if record else None
+
+    # ----------------------- Binary snapshots -------------------------------
+    def snapshot_tables(self):
+        """Return the paths of the tables that can have a snapshot"""
+        return [os.path.join(self.data_folder, name) for name in self.SNAPSHOT_INDEXES]
+
+    def _snapshot_path(self, file_path):
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(self.snapshot_folder, f"{name}.snap")
+
+    def _close_snapshot(self, file_path):
+        _, snapshot = self._snapshots.pop(file_path, (None, None))
+        if snapshot is not None:
+            snapshot.close()
+
+    def _open_snapshot(self, file_path, stamp):
+        """Return the Snapshot built from the JSON file as of `stamp` (or None)"""
+        cached = self._snapshots.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        self._close_snapshot(file_path)
+        snapshot = None
+        if stamp is not None:
+            try:
+                snapshot = Snapshot(self._snapshot_path(file_path))
+            except (OSError, ValueError):
+                snapshot = None
+            if snapshot is not None and snapshot.source_stamp != stamp:
+                snapshot.close()
+                snapshot = None
+        self._snapshots[file_path] = (stamp, snapshot)
+        return snapshot
+
+    def get_snapshot(self, file_path):
+        """Return the table's Snapshot if it matches the JSON file on disk, else None"""
+        with self.lock:
+            return self._open_snapshot(file_path, self._file_stamp(file_path))
+
+    def _snapshot_lookup(self, file_path, field, value, lower=False):
+        """
+        Look records up in the table's snapshot instead of parsing the table
+
+        Returns:
+            Matching records, or None when the table is cached and current
+            (its indexes are faster) or has no usable snapshot
+        """
+        if not self.use_snapshots:
+            return None
+        with self.lock:
+            if file_path in self._dirty:
+                return None
+            stamp = self._file_stamp(file_path)
+            entry = self._tables.get(file_path)
+            if entry is not None and entry["stamp"] == stamp:
+                return None
+            snapshot = self._open_snapshot(file_path, stamp)
+            if snapshot is None or not snapshot.has_index(field, lower):
+                return None
+            if metrics.enabled:
+                metrics.inc("db_snapshot_lookups_total", {"table": os.path.basename(file_path)})
+            return snapshot.find(field, value, lower)
+
+    def refresh_snapshots(self, min_bytes=None, cached_only=False):
+        """
+        Rebuild the snapshots that no longer match their JSON file
+
+        Args:
+            min_bytes: Skip tables smaller than this (defaults to SNAPSHOT_MIN_BYTES)
+            cached_only: Only snapshot tables this manager has already parsed,
+                so no table is read just for the snapshot (used on shutdown)
+
+        Returns:
+            Paths of the tables whose snapshot was written
+        """
+        min_bytes = self.SNAPSHOT_MIN_BYTES if min_bytes is None else min_bytes
+        built = []
+        with self.lock:
+            for file_path in self.snapshot_tables():
+                stamp = self._file_stamp(file_path)
+                if stamp is None or stamp[1] < min_bytes or file_path in self._dirty:
+                    continue
+                entry = self._tables.get(file_path)
+                if cached_only and (entry is None or entry["stamp"] != stamp):
+                    continue
+                if self._open_snapshot(file_path, stamp) is not None:
+                    continue
+                data = self._read_table(file_path)
+                if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+                    continue
+                # Unmap first: Windows cannot replace a mapped file
+                self._close_snapshot(file_path)
+                try:
+                    write_snapshot(self._snapshot_path(file_path), data,
+                                   self.SNAPSHOT_INDEXES[os.path.basename(file_path)],
+                                   self._tables[file_path]["stamp"])
+                except OSError as e:
+                    print(f"Warning: could not write snapshot of {file_path}: {e}")
+                    continue
+                built.append(file_path)
+        return built
+
+    def reload_table(self, file_path):
+        """
+        Re-read a file if it was changed on disk by someone else
+
+        Writes made through this manager update the cached stamp, so they are
+        not reported again. A previously cached table is also reported to
+        on_external_change.
+
+        Returns:
+            (old data or None if it was never loaded, new data), or None if unchanged.
+            Both are shared with the cache and must not be mutated.
+        """
+        with self.lock:
+            entry = self._tables.get(file_path)
+            if file_path in self._dirty:
+                return None
+            if entry is not None and entry["stamp"] == self._file_stamp(file_path):
+                return None
+            old_data = entry["data"] if entry is not None else None
+            return old_data, self._read_table(file_path)
+
+    def _emit(self, type, key=None, data=None):
+        """Publish a change event (call after the write) once this thread releases the lock"""
+        if self._batch_depth and self._batch_owner == threading.get_ident():
+            # Held back until the batch is committed
+            self._batched_events.append((type, key, data))
+            return
+        self.lock.call_after_release(self.events.publish, type, key, data)
+
+    def emit(self, type, key=None, data=None):
+        """
+        Publish a change event that is not tied to a table write (e.g. an image
+        file replaced under the same path); held back like write events while
+        a batch is open
+        """
+        self._emit(type, key, data)
+
+    def invalidate_cache(self, file_path=None):
+        """Drop cached data for one file, or for all files"""
+        with self.lock:
+            if file_path is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(file_path, None)
+
+    def load_json(self, file_path):
+        return self._copy_data(self._read_table(file_path))
 
     def save_json(self, file_path, data):
-        # Create directory if it doesn't exist
-        directory = os.path.dirname(file_path)
-        if directory:  # Only create if directory path is not empty
-            os.makedirs(directory, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        self._write_table(file_path, self._copy_data(data))
+        self._emit(event_bus.TABLE_CHANGED, file_path)
 
     def get_all_room_types(self):
         return self.load_json(self.room_type_file)
 
     def add_room_type(self, type_data):
-        room_types = self.load_json(self.room_type_file)
-        room_types.append(type_data)
-        self.save_json(self.room_type_file, room_types)
+        with self.lock:
+            room_types = self.load_json(self.room_type_file)
+            room_types.append(type_data.copy())
+            self._write_table(self.room_type_file, room_types)
+        self._emit(event_bus.ROOM_TYPE_CREATED, type_data.get("typeID"), type_data.copy())
 
     def update_room_type(self, typeID, new_data):
-        room_types = self.load_json(self.room_type_file)
-        for rt in room_types:
-            if rt["typeID"] == typeID:
-                rt.update(new_data)
-                break
-        self.save_json(self.room_type_file, room_types)
+        with self.lock:
+            room_types = self.load_json(self.room_type_file)
+            updated = None
+            for rt in room_types:
+                if rt["typeID"] == typeID:
+                    rt.update(new_data)
+                    updated = rt.copy()
+                    break
+            self._write_table(self.room_type_file, room_types)
+        if updated is not None:
+            self._emit(event_bus.ROOM_TYPE_UPDATED, typeID, updated)
 
     def delete_room_type(self, typeID):
-        room_types = self.load_json(self.room_type_file)
-        room_types = [rt for rt in room_types if rt["typeID"] != typeID]
-        self.save_json(self.room_type_file, room_types)
+        with self.lock:
+            room_types = self.load_json(self.room_type_file)
+            room_types = [rt for rt in room_types if rt["typeID"] != typeID]
+            self._write_table(self.room_type_file, room_types)
+        self._emit(event_bus.ROOM_TYPE_DELETED, typeID)
 
     def get_all_rooms(self):
         return self.load_json(self.room_file)
 
+    def get_rooms_page(self, after_id=None, limit=50):
+        """
+        Get one page of rooms ordered by roomId (keyset pagination)
+
+        Returns:
+            (rooms, next_cursor) - next_cursor is None on the last page
+        """
+        return self._get_page(self.room_file, "roomId", after_id=after_id, limit=limit)
+
     def update_room_status(self, roomId, new_status):
-        rooms = self.load_json(self.room_file)
-        for r in rooms:
-            if r["roomId"] == roomId:
-                r["Status"] = new_status
-        self.save_json(self.room_file, rooms)
+        with self.lock:
+            rooms = self.load_json(self.room_file)
+            updated = None
+            for r in rooms:
+                if r["roomId"] == roomId:
+                    r["Status"] = new_status
+                    updated = r.copy()
+            self._write_table(self.room_file, rooms)
+        if updated is not None:
+            self._emit(event_bus.ROOM_UPDATED, roomId, updated)
+
+    def update_room_statuses(self, new_statuses):
+        """
+        Set the status of several rooms with a single write
+
+        Args:
+            new_statuses: {roomId: new status}
+
+        Returns:
+            Number of rooms whose status changed
+        """
+        with self.lock:
+            rooms = self.load_json(self.room_file)
+            updated = []
+            for r in rooms:
+                new_status = new_statuses.get(r["roomId"])
+                if new_status is not None and r.get("Status") != new_status:
+                    r["Status"] = new_status
+                    updated.append(r.copy())
+            if updated:
+                self._write_table(self.room_file, rooms)
+        for room in updated:
+            self._emit(event_bus.ROOM_UPDATED, room["roomId"], room)
+        return len(updated)
 
     def get_all_customers(self):
         return self.load_json(self.customer_file)
 
     def get_customer_by_email(self, email):
-        customers = self.load_json(self.customer_file)
-        for c in customers:
-            if c["email"] == email:
-                return c
-        return None
+        return self._find_one(self.customer_file, "email", email)
+
+    def find_customer_by_email(self, email):
+        """Get customer by email, ignoring case"""
+        return self._find_one(self.customer_file, "email", email.lower(), lower=True)
+
+    def get_customer_by_id(self, customerID):
+        """Get customer by ID"""
+        return self._find_one(self.customer_file, "customerID", customerID)
 
     def add_customer(self, customer_data):
-        customers = self.load_json(self.customer_file)
-        customers.append(customer_data)
-        self.save_json(self.customer_file, customers)
-
-    def update_customer(self, customerID, new_data):
-        customers = self.load_json(self.customer_file)
-        for c in customers:
-            if c["customerID"] == customerID:
-                c.update(new_data)
-        self.save_json(self.customer_file, customers)
+        with self.lock:
+            customers = self.load_json(self.customer_file)
+            customers.append(customer_data.copy())
+            self._write_table(self.customer_file, customers)
+        self._emit(event_bus.CUSTOMER_CREATED, customer_data.get("customerID"))
+
+    def update_customer(self, customerID, new_data, remove_fields=None):
+        """
+        Update customer fields
+
+        Args:
+            customerID: Customer ID
+            new_data: Fields to set
+            remove_fields: Optional field names to delete (e.g. legacy "password")
+        """
+        with self.lock:
+            customers = self.load_json(self.customer_file)
+            for c in customers:
+                if c["customerID"] == customerID:
+                    c.update(new_data)
+                    for field in remove_fields or ():
+                        c.pop(field, None)
+            self._write_table(self.customer_file, customers)
+        self._emit(event_bus.CUSTOMER_UPDATED, customerID)
     
     def delete_customer(self, customerID):
         """Delete a customer by ID"""
-        customers = self.load_json(self.customer_file)
-        customers = [c for c in customers if c.get("customerID") != customerID]
-        self.save_json(self.customer_file, customers)
+        with self.lock:
+            customers = self.load_json(self.customer_file)
+            customers = [c for c in customers if c.get("customerID") != customerID]
+            self._write_table(self.customer_file, customers)
+        self._emit(event_bus.CUSTOMER_DELETED, customerID)
         return True
 
     def get_admin_by_username(self, username):
-        admins = self.load_json(self.admin_file)
-        for a in admins:
-            if a["username"] == username:
-                return a
-        return None
+        return self._find_one(self.admin_file, "username", username)
+
+    def find_admin_by_email(self, email):
+        """Get admin by email, ignoring case"""
+        return self._find_one(self.admin_file, "email", email.lower(), lower=True)
+
+    def get_admin_by_id(self, adminID):
+        """Get admin by ID"""
+        return self._find_one(self.admin_file, "adminID", adminID)
+
+    def update_admin(self, adminID, new_data):
+        """Update admin fields"""
+        with self.lock:
+            admins = self.load_json(self.admin_file)
+            for a in admins:
+                if a.get("adminID") == adminID:
+                    a.update(new_data)
+                    break
+            self._write_table(self.admin_file, admins)
+        self._emit(event_bus.ADMIN_UPDATED, adminID)
 
     def get_all_bookings(self):
         return self.load_json(self.booking_file)
 
+    def iter_bookings(self, statuses=None, room_id=None, customer_id=None, start=None, end=None):
+        """
+        Yield bookings one at a time, optionally filtered
+
+        booking.json is streamed from disk without being cached, so scans of
+        the whole history (exports, reports) run in constant memory. When the
+        table is already cached and current the cached records are used.
+        The stream reads the file as it was when iteration started; writes
+        made meanwhile replace the file and are not seen.
+
+        Args:
+            statuses: Only bookings with one of these statuses
+            room_id: Only bookings of this room
+            customer_id: Only bookings of this customer
+            start: Only bookings checking in on or after this date (date or YYYY-MM-DD string)
+            end: Only bookings checking in before this date (date or YYYY-MM-DD string)
+
+        Returns:
+            Iterator of copies of the matching bookings, in table order
+
+        Raises:
+            ValueError: start or end is not a valid date (raised at once), or
+                booking.json is not a valid JSON array (raised while iterating)
+        """
+        statuses = set(statuses) if statuses is not None else None
+        # Compare ISO dates as strings ("2024-07-01")
+        start = self._iso_date(start, "start")
+        end = self._iso_date(end, "end")
+
+        def matches(b):
+            if statuses is not None and b.get("status") not in statuses:
+                return False
+            if room_id is not None and b.get("roomId") != room_id:
+                return False
+            if customer_id is not None and b.get("customerID") != customer_id:
+                return False
+            if start is not None or end is not None:
+                check_in = str(b.get("checkInDate") or "")[:10]
+                if not check_in or (start is not None and check_in < start) or (end is not None and check_in >= end):
+                    return False
+            return True
+
+        return self._stream_bookings(matches)
+
+    def _iso_date(self, value, name):
+        """Return a date, datetime or ISO date string as "YYYY-MM-DD" (None stays None)"""
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        try:
+            return date.fromisoformat(value).isoformat()
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {name} date: {value!r} (expected YYYY-MM-DD)") from None
+
+    def _stream_bookings(self, matches):
+        """Yield copies of the bookings for which matches(booking) is true (see iter_bookings)"""
+        with self.lock:
+            entry = self._tables.get(self.booking_file)
+            if entry is not None and (self.booking_file in self._dirty
+                                      or entry["stamp"] == self._file_stamp(self.booking_file)):
+                cached = entry["data"]
+            else:
+                cached = None
+        if cached is not None:
+            # Writes replace the cached list, so this one stays unchanged
+            for b in cached:
+                if matches(b):
+                    yield b.copy()
+            return
+
+        started = time.perf_counter()
+        try:
+            f = open(self.booking_file, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for b in iter_array(f):
+                if isinstance(b, dict) and matches(b):
+                    yield b
+            nbytes = f.tell()
+        io_accounting.record("read", self.booking_file, nbytes, time.perf_counter() - started)
+
+    def next_booking_id(self):
+        """Return the ID for a new booking (one more than the largest bookingID)"""
+        return self._get_max(self.booking_file, "bookingID") + 1
+
     def add_booking(self, booking_data):
-        bookings = self.load_json(self.booking_file)
-        bookings.append(booking_data)
-        self.save_json(self.booking_file, bookings)
+        self._append_record(self.booking_file, booking_data.copy())
+        self._emit(event_bus.BOOKING_CREATED, booking_data.get("bookingID"), booking_data.copy())
+
+    def get_bookings_page(self, statuses=None, after_id=None, limit=50):
+        """
+        Get one page of bookings ordered by bookingID (keyset pagination)
+
+        Args:
+            statuses: Stored status values to include (None for every booking)
+            after_id: Only bookings with a bookingID greater than this (None for the first page)
+            limit: Page size
+
+        Returns:
+            (bookings, next_cursor) - next_cursor is None on the last page
+        """
+        if statuses is None:
+            return self._get_page(self.booking_file, "bookingID", after_id=after_id, limit=limit)
+        return self._get_page(self.booking_file, "bookingID", "status", statuses, after_id, limit)
 
     def update_booking_status(self, bookingID, new_status):
-        bookings = self.load_json(self.booking_file)
-        for b in bookings:
-            if b["bookingID"] == bookingID:
-                b["status"] = new_status
-        self.save_json(self.booking_file, bookings)
+        with self.lock:
+            bookings = self.load_json(self.booking_file)
+            updated = None
+            for b in bookings:
+                if b["bookingID"] == bookingID:
+                    previous = b["status"]
+                    b["status"] = new_status
+                    updated = {"booking": b.copy(), "status": new_status, "previous": previous}
+            self._write_table(self.booking_file, bookings)
+        if updated is not None:
+            self._emit(event_bus.BOOKING_STATUS_CHANGED, bookingID, updated)
+
+    def update_booking_statuses(self, new_statuses):
+        """
+        Set the status of several bookings with a single write
+
+        Args:
+            new_statuses: {bookingID: new status}
+
+        Returns:
+            Number of bookings whose status changed
+        """
+        with self.lock:
+            bookings = self.load_json(self.booking_file)
+            updated = []
+            for b in bookings:
+                new_status = new_statuses.get(b["bookingID"])
+                if new_status is not None and b["status"] != new_status:
+                    previous = b["status"]
+                    b["status"] = new_status
+                    updated.append({"booking": b.copy(), "status": new_status, "previous": previous})
+            if updated:
+                self._write_table(self.booking_file, bookings)
+        for change in updated:
+            self._emit(event_bus.BOOKING_STATUS_CHANGED, change["booking"]["bookingID"], change)
+        return len(updated)
+
+    def get_bookings_due_for_checkout(self, statuses, until):
+        """
+        Get bookings with one of `statuses` whose checkout date is on or before `until`
+
+        Uses a cached index of those bookings ordered by checkOutDate, so only
+        the due bookings are visited.
+
+        Args:
+            statuses: Stored status values to include (e.g. ["In stay", "In Stay"])
+            until: Last checkout date included (date)
+
+        Returns:
+            List of booking copies
+        """
+        # ISO dates and datetimes sort by date first; "~" sorts after any time suffix
+        upper = until.isoformat() + "~"
+        index = self._get_sorted_group_index(self.booking_file, "status", "checkOutDate")
+        due = []
+        for status in statuses:
+            if status not in index:
+                continue
+            keys, records = index[status]
+            end = bisect.bisect_right(keys, upper)
+            due.extend(r.copy() for r in records[:end])
+        return due
+
+    def get_booking_by_id(self, bookingID):
+        """Get booking by ID"""
+        return self._find_one(self.booking_file, "bookingID", bookingID)
 
     def get_customer_bookings(self, customerID):
-        bookings = self.load_json(self.booking_file)
-        return [b for b in bookings if b["customerID"] == customerID]
+        records = self._snapshot_lookup(self.booking_file, "customerID", customerID)
+        if records is not None:
+            return records
+        bookings = self._get_group_index(self.booking_file, "customerID").get(customerID, [])
+        return [b.copy() for b in bookings]
 
     def is_room_available(self, roomId, check_in, check_out):
-        bookings = self.load_json(self.booking_file)
+        # Convert check_in and check_out to datetime if they are date objects
+        if isinstance(check_in, date) and not isinstance(check_in, datetime):
+            check_in = datetime.combine(check_in, datetime.min.time())
+        if isinstance(check_out, date) and not isinstance(check_out, datetime):
+            check_out = datetime.combine(check_out, datetime.max.time())
+
+        # Only this room's bookings are scanned (read-only, no copy needed)
+        bookings = self._get_group_index(self.booking_file, "roomId").get(roomId, [])
         for b in bookings:
-            if b["roomId"] != roomId:
-                continue
             if b["status"] == "Canceled":
                 continue
             
@@ -136,30 +930,24 @@ class DBManager:
             if b_out.tzinfo is not None:
                 b_out = b_out.replace(tzinfo=None)
             
-            # Convert check_in and check_out to datetime if they are date objects
-            if isinstance(check_in, date) and not isinstance(check_in, datetime):
-                check_in = datetime.combine(check_in, datetime.min.time())
-            if isinstance(check_out, date) and not isinstance(check_out, datetime):
-                check_out = datetime.combine(check_out, datetime.max.time())
-            
             # Check for overlap
             if not (check_out <= b_in or check_in >= b_out):
                 return False
         return True
       
     def find_available_rooms(self, typeID, check_in, check_out):
-        rooms = self.get_all_rooms()
+        rooms = self._read_table(self.room_file)
         available = []
         for r in rooms:
             if r["typeID"] != typeID:
                 continue
             if self.is_room_available(r["roomId"], check_in, check_out):
-                available.append(r)
+                available.append(r.copy())
         return available
     
     def find_available_rooms_by_date(self, check_in, check_out, typeID=None):
         """Find all available rooms for given dates, optionally filtered by room type"""
-        rooms = self.get_all_rooms()
+        rooms = self._read_table(self.room_file)
         available = []
         for r in rooms:
             # Filter by typeID if provided
@@ -167,46 +955,47 @@ class DBManager:
                 continue
             # Check if room is available for the given dates
             if self.is_room_available(r["roomId"], check_in, check_out):
-                available.append(r)
+                available.append(r.copy())
         return available
     
     def add_room(self, room_data):
         """Add a new room"""
-        rooms = self.load_json(self.room_file)
-        rooms.append(room_data)
-        self.save_json(self.room_file, rooms)
+        with self.lock:
+            rooms = self.load_json(self.room_file)
+            rooms.append(room_data.copy())
+            self._write_table(self.room_file, rooms)
+        self._emit(event_bus.ROOM_CREATED, room_data.get("roomId"), room_data.copy())
     
     def update_room(self, roomId, new_data):
         """Update room information"""
-        rooms = self.load_json(self.room_file)
-        for r in rooms:
-            if r["roomId"] == roomId:
-                r.update(new_data)
-                break
-        self.save_json(self.room_file, rooms)
+        with self.lock:
+            rooms = self.load_json(self.room_file)
+            updated = None
+            for r in rooms:
+                if r["roomId"] == roomId:
+                    r.update(new_data)
+                    updated = r.copy()
+                    break
+            self._write_table(self.room_file, rooms)
+        if updated is not None:
+            self._emit(event_bus.ROOM_UPDATED, roomId, updated)
     
     def delete_room(self, roomId):
         """Delete a room"""
-        rooms = self.load_json(self.room_file)
-        rooms = [r for r in rooms if r["roomId"] != roomId]
-        self.save_json(self.room_file, rooms)
+        with self.lock:
+            rooms = self.load_json(self.room_file)
+            rooms = [r for r in rooms if r["roomId"] != roomId]
+            self._write_table(self.room_file, rooms)
+        self._emit(event_bus.ROOM_DELETED, roomId)
     
+    def get_room_by_id(self, roomId):
+        """Get room by ID"""
+        return self._find_one(self.room_file, "roomId", roomId)
+
     def get_room_by_number(self, room_number):
         """Get room by room number"""
-        rooms = self.load_json(self.room_file)
-        for r in rooms:
-            if r.get("roomNumber") == room_number:
-                return r
-        return None
+        return self._find_one(self.room_file, "roomNumber", room_number)
     
     def get_room_type_by_id(self, typeID):
         """Get room type by ID"""
-        room_types = self.load_json(self.room_type_file)
-        for rt in room_types:
-            if rt.get("typeID") == typeID:
-                return rt
-        return None
-
-
-
-
+        return self._find_one(self.room_type_file, "typeID", typeID)
@@ -0,0 +1,262 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+
+from . import event_bus
+
+# inotify flags (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class InotifyBackend:
+    """Blocks until a file in the folder changes (Linux inotify through ctypes)"""
+
+    def __init__(self, folder):
+        """
+        Raises:
+            OSError: inotify is not available (not Linux, no libc, or out of watches)
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(folder), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, os.strerror(err))
+
+    def wait(self, timeout):
+        """
+        Wait for changes
+
+        Returns:
+            Set of changed file names (empty on timeout)
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        names = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                name = buf[offset:offset + length].split(b"\0", 1)[0]
+                offset += length
+                if name:
+                    names.add(os.fsdecode(name))
+        return names
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class PollingBackend:
+    """Fallback that compares file mtimes/sizes every interval"""
+
+    def __init__(self, folder, names):
+        self.folder = folder
+        self.names = list(names)
+        self._stamps = {name: self._stamp(name) for name in self.names}
+
+    def _stamp(self, name):
+        try:
+            st = os.stat(os.path.join(self.folder, name))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def wait(self, timeout):
+        """Sleep for `timeout`, then return the names whose stamp changed"""
+        threading.Event().wait(timeout)
+        changed = set()
+        for name in self.names:
+            stamp = self._stamp(name)
+            if stamp != self._stamps[name]:
+                self._stamps[name] = stamp
+                changed.add(name)
+        return changed
+
+    def close(self):
+        pass
+
+
+class DBWatcher:
+    """
+    Turns writes to db/ made by other processes (other desk stations) into change events
+
+    A daemon thread waits for file changes (inotify, or mtime polling where
+    inotify is unavailable) and re-reads each changed table once through
+    DBManager.reload_table. Whenever the DBManager replaces a cached table
+    with newer contents from disk (here or on any ordinary read), the old and
+    new records are diffed by ID and record-level events are published on the
+    DBManager's event bus. Writes made by this process are recognised by their
+    cached stamp and skipped.
+    """
+
+    # Table file name -> (DBManager attribute, ID field)
+    TABLES = {
+        "booking.json": ("booking_file", "bookingID"),
+        "room.json": ("room_file", "roomId"),
+        "roomType.json": ("room_type_file", "typeID"),
+        "customer.json": ("customer_file", "customerID"),
+        "admin.json": ("admin_file", "adminID"),
+    }
+
+    def __init__(self, db_manager, poll_interval=1.0, use_inotify=True):
+        """
+        Args:
+            db_manager: DBManager whose folder is watched and whose bus receives the events
+            poll_interval: Seconds between checks (polling) or stop-flag checks (inotify)
+            use_inotify: Set False to force the polling backend
+        """
+        self.db = db_manager
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.backend = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    # ----------------------- Lifecycle --------------------------------------
+    def start(self):
+        """Start watching in a daemon thread"""
+        if self._thread is not None:
+            return
+        folder = self.db.data_folder
+        os.makedirs(folder, exist_ok=True)
+        self.backend = None
+        self.db.on_external_change = self.publish_changes
+        if self.use_inotify:
+            try:
+                self.backend = InotifyBackend(folder)
+            except (OSError, AttributeError) as e:
+                print(f"Warning: inotify unavailable, polling db/ instead: {e}")
+        if self.backend is None:
+            self.backend = PollingBackend(folder, self.TABLES)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="db-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watcher thread"""
+        self._stop.set()
+        if self.db.on_external_change == self.publish_changes:
+            self.db.on_external_change = None
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 2)
+            self._thread = None
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                names = self.backend.wait(self.poll_interval)
+            except OSError as e:
+                print(f"Warning: db/ watcher stopped: {e}")
+                return
+            for name in sorted(names):
+                if name in self.TABLES:
+                    self.check_table(name)
+
+    # ----------------------- Diffing ----------------------------------------
+    def check_table(self, name):
+        """Re-read one table if another process changed it (changes are published by publish_changes)"""
+        file_path = getattr(self.db, self.TABLES[name][0])
+        try:
+            result = self.db.reload_table(file_path)
+        except Exception as e:
+            print(f"Warning: Failed to reload {file_path}: {e}")
+            return
+        if result is not None and result[0] is None:
+            # Nothing to diff against: the table was never loaded here
+            self.db.events.publish(event_bus.TABLE_CHANGED, file_path)
+
+    def publish_changes(self, file_path, old_data, new_data):
+        """Publish the differences between two versions of a table"""
+        name = os.path.basename(file_path)
+        events = None
+        if name in self.TABLES and isinstance(old_data, list) and isinstance(new_data, list):
+            events = diff_records(name, old_data, new_data, self.TABLES[name][1])
+        if events is None:
+            events = [(event_bus.TABLE_CHANGED, file_path, None)]
+        for type, key, data in events:
+            self.db.events.publish(type, key, data)
+
+
+def diff_records(name, old_data, new_data, id_field):
+    """
+    Describe the changes between two versions of a table as change events
+
+    Args:
+        name: Table file name (e.g. "booking.json")
+        old_data: Records before the change
+        new_data: Records after the change
+        id_field: Record ID field
+
+    Returns:
+        List of (type, key, data), or None if the change can only be described
+        as a whole-table change
+    """
+    old_by_id = {r.get(id_field): r for r in old_data if isinstance(r, dict)}
+    new_by_id = {r.get(id_field): r for r in new_data if isinstance(r, dict)}
+    created = [k for k in new_by_id if k not in old_by_id]
+    deleted = [k for k in old_by_id if k not in new_by_id]
+    updated = [k for k in new_by_id if k in old_by_id and new_by_id[k] != old_by_id[k]]
+
+    if name == "booking.json":
+        if deleted:
+            return None
+        events = [(event_bus.BOOKING_CREATED, k, new_by_id[k].copy()) for k in created]
+        for k in updated:
+            old, new = old_by_id[k], new_by_id[k]
+            if {f: v for f, v in old.items() if f != "status"} != {f: v for f, v in new.items() if f != "status"}:
+                return None
+            events.append((event_bus.BOOKING_STATUS_CHANGED, k, {
+                "booking": new.copy(),
+                "status": new.get("status"),
+                "previous": old.get("status")
+            }))
+        return events
+
+    kinds = {
+        "room.json": (event_bus.ROOM_CREATED, event_bus.ROOM_UPDATED, event_bus.ROOM_DELETED),
+        "roomType.json": (event_bus.ROOM_TYPE_CREATED, event_bus.ROOM_TYPE_UPDATED, event_bus.ROOM_TYPE_DELETED),
+        "customer.json": (event_bus.CUSTOMER_CREATED, event_bus.CUSTOMER_UPDATED, event_bus.CUSTOMER_DELETED),
+    }
+    if name not in kinds:
+        # Admins: only in-place updates have a record-level event
+        if created or deleted:
+            return None
+        return [(event_bus.ADMIN_UPDATED, k, None) for k in updated]
+
+    created_type, updated_type, deleted_type = kinds[name]
+    events = [(created_type, k, new_by_id[k].copy()) for k in created]
+    events += [(updated_type, k, new_by_id[k].copy()) for k in updated]
+    events += [(deleted_type, k, None) for k in deleted]
+    return events
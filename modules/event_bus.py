@@ -0,0 +1,169 @@
+import threading
+from collections import OrderedDict
+
+from . import io_accounting
+
+# Change event types
+BOOKING_CREATED = "booking.created"
+BOOKING_STATUS_CHANGED = "booking.status_changed"
+ROOM_CREATED = "room.created"
+ROOM_UPDATED = "room.updated"
+ROOM_DELETED = "room.deleted"
+ROOM_TYPE_CREATED = "room_type.created"
+ROOM_TYPE_UPDATED = "room_type.updated"
+ROOM_TYPE_DELETED = "room_type.deleted"
+ROOM_TYPE_IMAGE_CHANGED = "room_type.image_changed"
+CUSTOMER_CREATED = "customer.created"
+CUSTOMER_UPDATED = "customer.updated"
+CUSTOMER_DELETED = "customer.deleted"
+ADMIN_UPDATED = "admin.updated"
+# A whole table changed in a way that cannot be described record by record
+TABLE_CHANGED = "table.changed"
+
+BOOKING_EVENTS = (BOOKING_CREATED, BOOKING_STATUS_CHANGED)
+ROOM_EVENTS = (ROOM_CREATED, ROOM_UPDATED, ROOM_DELETED)
+ROOM_TYPE_EVENTS = (ROOM_TYPE_CREATED, ROOM_TYPE_UPDATED, ROOM_TYPE_DELETED, ROOM_TYPE_IMAGE_CHANGED)
+
+# Milliseconds events are collected before subscribers are called (about one frame)
+DEFAULT_INTERVAL_MS = 16
+
+
+class ChangeEvent:
+    """A change to one record (or to a whole table when key is None)"""
+
+    __slots__ = ("type", "key", "data")
+
+    def __init__(self, type, key=None, data=None):
+        """
+        Args:
+            type: One of the event type constants (e.g. BOOKING_STATUS_CHANGED)
+            key: ID of the changed record (bookingID, roomId, typeID, ...)
+            data: Event details, e.g. the new record or {"status": ..., "previous": ...}
+        """
+        self.type = type
+        self.key = key
+        self.data = data if data is not None else {}
+
+    def __repr__(self):
+        return f"ChangeEvent({self.type!r}, {self.key!r}, {self.data!r})"
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus for data change events
+
+    publish() may be called from any thread (e.g. the db/ watcher); it only
+    queues the event and never calls the scheduler. With a scheduler (the
+    App's `after`), a recurring drain on the scheduler's thread delivers
+    every event queued within one interval in a single call per subscriber,
+    and repeated events for the same record are coalesced into the latest
+    one. Worker threads therefore never touch Tk.
+    Without a scheduler, events are delivered immediately.
+    """
+
+    def __init__(self, scheduler=None, interval_ms=DEFAULT_INTERVAL_MS):
+        """
+        Args:
+            scheduler: Optional function(delay_ms, callback) such as Tk's `after`
+            interval_ms: Delay used to collect a burst of events before delivering it
+        """
+        self.scheduler = scheduler
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._subscribers = []  # (event types or None, callback)
+        self._pending = OrderedDict()  # (type, key) -> event
+        # User action that published the first pending event (for I/O accounting)
+        self._pending_action = None
+        # Incremented by set_scheduler() so an older drain loop stops
+        self._drain_generation = 0
+        if scheduler is not None:
+            self._schedule_drain(self._drain_generation)
+
+    def set_scheduler(self, scheduler, interval_ms=None):
+        """
+        Deliver events in batches through `scheduler` (e.g. App.after)
+
+        Must be called on the thread the scheduler runs callbacks on (the Tk
+        thread), which starts the recurring drain there.
+        """
+        with self._lock:
+            self.scheduler = scheduler
+            if interval_ms is not None:
+                self.interval_ms = interval_ms
+            self._drain_generation += 1
+            generation = self._drain_generation
+        if scheduler is not None:
+            self._schedule_drain(generation)
+
+    def _schedule_drain(self, generation):
+        try:
+            self.scheduler(self.interval_ms, lambda: self._drain(generation))
+        except Exception as e:
+            # The window was destroyed; nothing is left to deliver to
+            print(f"Warning: Event delivery stopped: {e}")
+
+    def _drain(self, generation):
+        """Deliver the queued events, then run again after one interval (scheduler thread)"""
+        if generation != self._drain_generation:
+            return
+        self.flush()
+        self._schedule_drain(generation)
+
+    def subscribe(self, callback, event_types=None):
+        """
+        Call `callback(events)` with each batch of matching events
+
+        Args:
+            callback: Function receiving a list of ChangeEvent
+            event_types: Event types to receive (None for every event)
+
+        Returns:
+            The callback (to pass to unsubscribe later)
+        """
+        types = frozenset(event_types) if event_types is not None else None
+        with self._lock:
+            self._subscribers.append((types, callback))
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop delivering events to a callback"""
+        with self._lock:
+            self._subscribers = [(t, cb) for t, cb in self._subscribers if cb != callback]
+
+    def publish(self, type, key=None, data=None):
+        """Queue a change event for delivery"""
+        event = ChangeEvent(type, key, data)
+        with self._lock:
+            # The latest event for a record wins, but keeps its first position
+            # (a status change keeps the status the burst started from)
+            pending_key = (type, key)
+            earlier = self._pending.get(pending_key)
+            if earlier is not None and "previous" in earlier.data and isinstance(event.data, dict):
+                event.data = dict(event.data, previous=earlier.data["previous"])
+            self._pending[pending_key] = event
+            if self._pending_action is None:
+                self._pending_action = io_accounting.current_action()
+            deliver_now = self.scheduler is None
+
+        if deliver_now:
+            self.flush()
+
+    def flush(self):
+        """Deliver every queued event now"""
+        with self._lock:
+            events = list(self._pending.values())
+            self._pending.clear()
+            action, self._pending_action = self._pending_action, None
+            subscribers = list(self._subscribers)
+        if not events:
+            return
+        # Reloads done by subscribers count as I/O of the action that caused the events
+        with io_accounting.continue_action(action):
+            for types, callback in subscribers:
+                matching = events if types is None else [e for e in events if e.type in types]
+                if not matching:
+                    continue
+                try:
+                    callback(matching)
+                except Exception as e:
+                    print(f"Warning: Event subscriber failed: {e}")
@@ -0,0 +1,144 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+# Milliseconds a commit group stays open for more calls after the first one
+DEFAULT_WINDOW_MS = 2
+MAX_GROUP_SIZE = 256
+
+
+class GroupCommitter:
+    """
+    Runs DB calls on one worker thread and commits them in groups
+
+    Calls submitted within a short window are run back to back inside a
+    single DBManager.batch(): one lock acquisition, and each table they touch
+    is written and fsynced once for the whole group. A call's Future resolves
+    only after the group has been committed to disk, so a caller never sees a
+    result that could still be lost. A call that raises is rolled back on its
+    own (nested batch) without affecting the rest of its group.
+    """
+
+    def __init__(self, db_manager, window_ms=DEFAULT_WINDOW_MS, max_group_size=MAX_GROUP_SIZE):
+        """
+        Args:
+            db_manager: DBManager the calls write through
+            window_ms: How long to wait for more calls after the first (0 commits whatever is queued)
+            max_group_size: Most calls committed together
+        """
+        self.db = db_manager
+        self.window_ms = window_ms
+        self.max_group_size = max_group_size
+        self.groups_committed = 0
+        self.calls_committed = 0
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """Start the commit thread"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Commit the calls already queued, then stop the commit thread"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue fn(*args, **kwargs) for the next commit group
+
+        Returns:
+            concurrent.futures.Future resolved with the result (or exception) after commit
+        """
+        future = Future()
+        if self._thread is not None and not self._thread.is_alive():
+            future.set_exception(RuntimeError("Group commit worker is not running"))
+            return future
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def _collect(self, first):
+        group = [first]
+        deadline = time.monotonic() + self.window_ms / 1000
+        while len(group) < self.max_group_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Stop after this group
+                self._queue.put(None)
+                break
+            group.append(item)
+        return group
+
+    def _run(self):
+        try:
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                self.commit_group(self._collect(first))
+        except BaseException:
+            # The worker is dying: nobody would ever resolve the queued calls
+            self._fail_queued(RuntimeError("Group commit worker stopped"))
+            raise
+
+    def _fail_queued(self, error):
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and not item[0].done():
+                item[0].set_exception(error)
+
+    def commit_group(self, group):
+        """
+        Run a group of queued calls in one batch and resolve their futures
+
+        Every future of the group is resolved, whatever happens: if the commit
+        fails, or a BaseException (e.g. SystemExit) escapes a call, the calls
+        that were not saved get the error.
+        """
+        outcomes = []
+        failure = None
+        try:
+            with self.db.batch():
+                for future, fn, args, kwargs in group:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        with self.db.batch():
+                            outcomes.append((future, fn(*args, **kwargs), None))
+                    except Exception as e:
+                        outcomes.append((future, None, e))
+        except Exception as e:
+            # The commit itself failed: nothing in the group was saved
+            print(f"Warning: Group commit failed: {e}")
+            failure = e
+        except BaseException as e:
+            failure = RuntimeError(f"Group commit interrupted: {e!r}")
+            raise
+        finally:
+            for future, result, error in outcomes:
+                if failure is not None:
+                    future.set_exception(failure)
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            for future, _, _, _ in group:
+                if not future.done():
+                    future.set_exception(failure or RuntimeError("Call was not run"))
+        if failure is None:
+            self.groups_committed += 1
+            self.calls_committed += len(outcomes)
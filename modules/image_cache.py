@@ -0,0 +1,223 @@
+from PIL import Image, ImageOps
+from collections import OrderedDict
+import glob
+import hashlib
+import os
+import threading
+
+# (size, mode) of every room-type thumbnail the views draw:
+# RoomView, MainAppView, SearchView and AdminRoomView cards
+ROOM_TYPE_THUMBNAILS = [
+    ((300, 200), "crop"),
+    ((250, 250), "resize"),
+    ((180, 180), "resize"),
+    ((200, 150), "resize"),
+]
+
+
+class ImageCache:
+    """Service class that produces each room image thumbnail only once"""
+
+    def __init__(self, thumbnail_folder="assets/cache/thumbnails", max_items=128):
+        """
+        Args:
+            thumbnail_folder: Folder for persisted thumbnails (None disables disk cache)
+            max_items: Maximum number of thumbnails kept in memory
+        """
+        self.thumbnail_folder = thumbnail_folder
+        self.max_items = max_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        if self.thumbnail_folder:
+            os.makedirs(os.path.abspath(self.thumbnail_folder), exist_ok=True)
+
+    @staticmethod
+    def center_crop(image, target_width, target_height):
+        """
+        Center crop image to target size while maintaining aspect ratio
+
+        Args:
+            image: PIL Image object
+            target_width: Target width
+            target_height: Target height
+
+        Returns:
+            Cropped PIL Image
+        """
+        img_width, img_height = image.size
+        target_ratio = target_width / target_height
+        img_ratio = img_width / img_height
+
+        # Calculate crop size
+        if img_ratio > target_ratio:
+            # Image is wider, crop width
+            new_height = img_height
+            new_width = int(img_height * target_ratio)
+        else:
+            # Image is taller, crop height
+            new_width = img_width
+            new_height = int(img_width / target_ratio)
+
+        # Calculate crop box (center crop)
+        left = (img_width - new_width) // 2
+        top = (img_height - new_height) // 2
+        right = left + new_width
+        bottom = top + new_height
+
+        # Crop and resize
+        cropped = image.crop((left, top, right, bottom))
+        return cropped.resize((target_width, target_height), Image.Resampling.LANCZOS)
+
+    def get_thumbnail(self, image_path, size, mode="resize"):
+        """
+        Get a thumbnail of an image, decoding the original only on a cache miss
+
+        Args:
+            image_path: Path to the source image
+            size: Target (width, height)
+            mode: "resize" to stretch to size, "crop" to center crop to size
+
+        Returns:
+            PIL Image of exactly `size`, or None if the source is missing or unreadable
+        """
+        try:
+            st = os.stat(image_path)
+        except (OSError, TypeError, ValueError):
+            return None
+        size = (int(size[0]), int(size[1]))
+        key = (os.path.abspath(image_path), size, mode)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        # 1. In-memory LRU
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._memory.move_to_end(key)
+                return entry[1]
+
+        # 2. Persisted thumbnail, 3. decode and scale the original
+        thumb_path = self._thumbnail_path(key, stamp)
+        image = self._load_persisted(thumb_path)
+        if image is None:
+            image = self._render(image_path, size, mode)
+            if image is None:
+                return None
+            self._persist(key, thumb_path, image)
+
+        with self._lock:
+            self._memory[key] = (stamp, image)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+        return image
+
+    def pregenerate(self, image_path, specs=ROOM_TYPE_THUMBNAILS):
+        """
+        Render and persist thumbnails ahead of time
+
+        Args:
+            image_path: Path to the source image
+            specs: List of (size, mode) pairs
+
+        Returns:
+            Number of thumbnails available after the call
+        """
+        count = 0
+        for size, mode in specs:
+            if self.get_thumbnail(image_path, size, mode) is not None:
+                count += 1
+        return count
+
+    def optimize_upload(self, source_path, dest_base, max_side=1600, quality=85):
+        """
+        Re-encode an uploaded image: apply EXIF orientation, cap its size and compress it
+
+        Args:
+            source_path: Uploaded image file
+            dest_base: Destination path without extension
+            max_side: Longest side of the stored original in pixels
+            quality: JPEG quality
+
+        Returns:
+            Path of the written file (.jpg, or .png for images with transparency)
+        """
+        os.makedirs(os.path.dirname(dest_base) or ".", exist_ok=True)
+        with Image.open(source_path) as source:
+            image = ImageOps.exif_transpose(source)
+            image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+            has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+            if has_alpha:
+                dest_path = f"{dest_base}.png"
+                tmp_path = f"{dest_path}.tmp"
+                image.save(tmp_path, format="PNG", optimize=True)
+            else:
+                dest_path = f"{dest_base}.jpg"
+                tmp_path = f"{dest_path}.tmp"
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                image.save(tmp_path, format="JPEG", quality=quality, optimize=True, progressive=True)
+
+        os.replace(tmp_path, dest_path)
+        self.invalidate(dest_path)
+        return dest_path
+
+    def invalidate(self, image_path=None):
+        """Drop in-memory thumbnails of one image, or of all images"""
+        with self._lock:
+            if image_path is None:
+                self._memory.clear()
+                return
+            abs_path = os.path.abspath(image_path)
+            for key in [k for k in self._memory if k[0] == abs_path]:
+                del self._memory[key]
+
+    # ----------------------- Helpers ----------------------------------------
+    def _render(self, image_path, size, mode):
+        try:
+            with Image.open(image_path) as opened:
+                # Phone photos are often stored rotated with an EXIF orientation tag
+                source = ImageOps.exif_transpose(opened)
+                if mode == "crop":
+                    return self.center_crop(source, size[0], size[1])
+                return source.resize(size)
+        except Exception as e:
+            print(f"Could not load image: {e}")
+            return None
+
+    def _key_prefix(self, key):
+        abs_path, size, mode = key
+        digest = hashlib.sha1(f"{abs_path}|{size[0]}x{size[1]}|{mode}".encode("utf-8")).hexdigest()
+        return digest[:20]
+
+    def _thumbnail_path(self, key, stamp):
+        if not self.thumbnail_folder:
+            return None
+        # Source mtime is part of the name, so a replaced image never hits an old thumbnail
+        filename = f"{self._key_prefix(key)}-{stamp[0]}-{stamp[1]}.png"
+        return os.path.join(self.thumbnail_folder, filename)
+
+    def _load_persisted(self, thumb_path):
+        if not thumb_path or not os.path.exists(thumb_path):
+            return None
+        try:
+            with Image.open(thumb_path) as image:
+                image.load()
+                return image.copy()
+        except Exception:
+            return None
+
+    def _persist(self, key, thumb_path, image):
+        if not thumb_path:
+            return
+        try:
+            # Remove thumbnails rendered from older versions of the same source
+            pattern = os.path.join(self.thumbnail_folder, f"{self._key_prefix(key)}-*.png")
+            for old_path in glob.glob(pattern):
+                if old_path != thumb_path:
+                    os.remove(old_path)
+            tmp_path = f"{thumb_path}.tmp"
+            image.save(tmp_path, format="PNG")
+            os.replace(tmp_path, thumb_path)
+        except Exception as e:
+            print(f"Warning: Failed to save thumbnail: {e}")
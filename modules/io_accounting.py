@@ -0,0 +1,226 @@
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Number of finished actions kept for the debug overlay
+RECENT_ACTIONS = 50
+
+_current = contextvars.ContextVar("anhotel_io_action", default=None)
+
+
+class FileIO:
+    """I/O on one file within an action"""
+
+    __slots__ = ("reads", "cache_hits", "writes", "bytes_read", "bytes_written", "read_ms", "write_ms")
+
+    def __init__(self):
+        self.reads = 0
+        self.cache_hits = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.read_ms = 0.0
+        self.write_ms = 0.0
+
+    def merge(self, other):
+        for field in self.__slots__:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+
+class ActionIO:
+    """File reads (open + parse), cache hits and writes (dump) caused by one user action"""
+
+    def __init__(self, name, parent=None):
+        """
+        Args:
+            name: What the user did, e.g. "admin confirm booking #12"
+            parent: Action this is a follow-up of (work done later on its behalf)
+        """
+        self.name = name
+        self.parent = parent
+        self.files = {}  # file name -> FileIO
+        self.started = time.perf_counter()
+        self.duration_ms = None
+        self._lock = threading.Lock()
+
+    def record(self, kind, file_path, nbytes=0, seconds=0.0):
+        with self._lock:
+            name = os.path.basename(file_path)
+            stats = self.files.get(name)
+            if stats is None:
+                stats = self.files[name] = FileIO()
+            if kind == "read":
+                stats.reads += 1
+                stats.bytes_read += nbytes
+                stats.read_ms += seconds * 1000
+            elif kind == "write":
+                stats.writes += 1
+                stats.bytes_written += nbytes
+                stats.write_ms += seconds * 1000
+            else:
+                stats.cache_hits += 1
+
+    def totals(self):
+        total = FileIO()
+        with self._lock:
+            for stats in self.files.values():
+                total.merge(stats)
+        return total
+
+    def merge(self, other):
+        with self._lock:
+            for name, stats in other.files.items():
+                self.files.setdefault(name, FileIO()).merge(stats)
+
+    def summary(self):
+        """One line: reads/writes per file, bytes and time"""
+        total = self.totals()
+        with self._lock:
+            parts = []
+            for name, stats in sorted(self.files.items()):
+                counts = []
+                if stats.reads:
+                    counts.append(f"{stats.reads}r")
+                if stats.writes:
+                    counts.append(f"{stats.writes}w")
+                if stats.cache_hits:
+                    counts.append(f"{stats.cache_hits}c")
+                parts.append(f"{name} {'/'.join(counts)}")
+        duration = f"{self.duration_ms:.1f} ms" if self.duration_ms is not None else "running"
+        return (
+            f"{self.name}: {total.reads} reads ({_format_bytes(total.bytes_read)}, {total.read_ms:.1f} ms), "
+            f"{total.writes} writes ({_format_bytes(total.bytes_written)}, {total.write_ms:.1f} ms), "
+            f"{total.cache_hits} cache hits in {duration}"
+            + (f" [{', '.join(parts)}]" if parts else "")
+        )
+
+    def as_dict(self):
+        with self._lock:
+            files = {name: {field: getattr(stats, field) for field in FileIO.__slots__}
+                     for name, stats in self.files.items()}
+        return {"action": self.name, "duration_ms": self.duration_ms, "files": files}
+
+
+def _format_bytes(n):
+    if n < 1024:
+        return f"{n} B"
+    if n < 1024 * 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n / (1024 * 1024):.1f} MB"
+
+
+class IOAccountant:
+    """
+    Keeps the most recent finished actions and reports them
+
+    With `log` set (ANHOTEL_IO_LOG=1) every action that touched a file is
+    printed. Listeners (e.g. the debug overlay) are called with each
+    finished ActionIO, from the thread that finished it.
+    """
+
+    def __init__(self, log=False):
+        self.log = log
+        self.recent = deque(maxlen=RECENT_ACTIONS)
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        with self._lock:
+            self._listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._listeners = [cb for cb in self._listeners if cb != callback]
+
+    def finish(self, action):
+        action.duration_ms = (time.perf_counter() - action.started) * 1000
+        if not action.files:
+            return
+        with self._lock:
+            self.recent.append(action)
+            listeners = list(self._listeners)
+        if self.log:
+            print(f"[io] {action.summary()}")
+        for callback in listeners:
+            try:
+                callback(action)
+            except Exception as e:
+                print(f"Warning: I/O accounting listener failed: {e}")
+
+
+accountant = IOAccountant(log=os.environ.get("ANHOTEL_IO_LOG") == "1")
+
+
+def current_action():
+    """Return the ActionIO file I/O is currently attributed to (or None)"""
+    return _current.get()
+
+
+@contextmanager
+def user_action(name):
+    """
+    Attribute the file I/O done inside the block to a named user action
+
+    Nested actions join the outer one, so "sign in" keeps the I/O of the
+    screen it opens.
+    """
+    if _current.get() is not None:
+        yield _current.get()
+        return
+    action = ActionIO(name)
+    token = _current.set(action)
+    try:
+        yield action
+    finally:
+        _current.reset(token)
+        accountant.finish(action)
+
+
+@contextmanager
+def continue_action(action):
+    """
+    Attribute work done later on behalf of an action (e.g. views reloading
+    after its change events) to a follow-up of that action
+    """
+    if action is None or _current.get() is not None:
+        yield
+        return
+    follow_up = ActionIO(f"{action.name} (follow-up)", parent=action)
+    token = _current.set(follow_up)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+        action.merge(follow_up)
+        accountant.finish(follow_up)
+
+
+def accounted(name):
+    """Decorator running a function as user_action(name) unless an action is already open"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with user_action(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record(kind, file_path, nbytes=0, seconds=0.0):
+    """
+    Attribute one file operation to the current action (no-op outside of actions)
+
+    Args:
+        kind: "read" (open + parse), "write" (dump) or "cache_hit"
+        file_path: File involved
+        nbytes: Bytes read or written
+        seconds: Time taken
+    """
+    action = _current.get()
+    if action is not None:
+        action.record(kind, file_path, nbytes, seconds)
@@ -0,0 +1,237 @@
+import argparse
+import codecs
+import json
+import os
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Backends in order of preference (the first installed one is used)
+BACKENDS = ("orjson", "msgspec", "json")
+
+COMPACT = "compact"
+PRETTY = "pretty"
+
+# Bytes read at a time by iter_array()
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def available_backends():
+    """Return the installed backends in order of preference"""
+    installed = {"orjson": orjson is not None, "msgspec": msgspec is not None, "json": True}
+    return [name for name in BACKENDS if installed[name]]
+
+
+class JsonCodec:
+    """
+    Encodes and decodes the db/ tables
+
+    By default tables keep the indented layout of the sample data committed
+    in db/, so running the app does not rewrite it. Deployments set
+    ANHOTEL_JSON_FORMAT=compact (no indentation or spaces), which roughly
+    halves booking.json and the bytes parsed on every reload. orjson or
+    msgspec is used when installed, with the standard json module as the
+    fallback; all of them read files written by the others. Non-ASCII text
+    is always stored as UTF-8, not escaped.
+    """
+
+    def __init__(self, backend=None, storage_format=None):
+        """
+        Args:
+            backend: "orjson", "msgspec" or "json" (defaults to ANHOTEL_JSON_BACKEND
+                or the fastest installed one)
+            storage_format: COMPACT or PRETTY (defaults to ANHOTEL_JSON_FORMAT or PRETTY)
+
+        Raises:
+            ValueError: Unknown or uninstalled backend, or unknown format
+        """
+        backend = backend or os.environ.get("ANHOTEL_JSON_BACKEND") or available_backends()[0]
+        if backend not in available_backends():
+            raise ValueError(f"JSON backend not available: {backend}")
+        storage_format = storage_format or os.environ.get("ANHOTEL_JSON_FORMAT") or PRETTY
+        if storage_format not in (COMPACT, PRETTY):
+            raise ValueError(f"Unknown JSON storage format: {storage_format}")
+        self.backend = backend
+        self.storage_format = storage_format
+        if backend == "msgspec":
+            self._msgspec_encoder = msgspec.json.Encoder()
+            self._msgspec_decoder = msgspec.json.Decoder()
+
+    def dumps(self, data, pretty=None):
+        """
+        Encode data as UTF-8 JSON bytes
+
+        Args:
+            data: Table contents
+            pretty: Override the storage format (True for indented output)
+        """
+        if pretty is None:
+            pretty = self.storage_format == PRETTY
+        if pretty:
+            # Same layout as the files shipped in db/
+            return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+        if self.backend == "orjson":
+            return orjson.dumps(data)
+        if self.backend == "msgspec":
+            return self._msgspec_encoder.encode(data)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, raw):
+        """
+        Decode UTF-8 JSON bytes
+
+        Raises:
+            ValueError: The data is not valid JSON
+        """
+        if self.backend == "orjson":
+            return orjson.loads(raw)
+        if self.backend == "msgspec":
+            try:
+                return self._msgspec_decoder.decode(raw)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        return json.loads(raw)
+
+
+def iter_array(f, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield the items of a top-level JSON array one at a time
+
+    The file is read in chunks and each item is decoded as soon as it is
+    complete, so memory use is bounded by one chunk plus one item instead of
+    the size of the file. Works on compact and indented files alike. Uses
+    ijson's incremental parser when installed.
+
+    Args:
+        f: File opened in binary mode
+        chunk_size: Bytes read at a time
+
+    Raises:
+        ValueError: The data is not a valid JSON array
+    """
+    if ijson is not None:
+        try:
+            yield from ijson.items(f, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        return
+
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos, eof = "", 0, False
+    started = False
+    expect_item = True  # after "[" or ","; False after an item
+    first = True
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n":
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                raise ValueError("Unexpected end of JSON array" if started else "Expected a JSON array")
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if not started:
+            if char != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            pos += 1
+        elif not expect_item:
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            expect_item = True
+            pos += 1
+        elif char == "]" and first:
+            return
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ValueError(str(e)) from e
+                end = None
+            # A number or literal is only complete once a delimiter follows it
+            # ("12" may be the start of "12.5")
+            if end is not None and char not in "{[\"" and not eof:
+                if end == len(buffer) or buffer[end] not in " \t\r\n,]":
+                    end = None
+            if end is None:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+                pos = 0
+                continue
+            yield item
+            pos = end
+            expect_item = first = False
+
+
+def convert_folder(source, destination=None, storage_format=PRETTY, codec=None):
+    """
+    Rewrite every .json file of a folder in another layout
+
+    Args:
+        source: Folder to read (e.g. db/)
+        destination: Folder to write to (defaults to rewriting `source` in place)
+        storage_format: PRETTY for reading/diffing by humans, COMPACT for production
+        codec: JsonCodec used to parse the files
+
+    Returns:
+        List of (file name, bytes before, bytes after)
+    """
+    codec = codec or JsonCodec()
+    destination = destination or source
+    os.makedirs(destination, exist_ok=True)
+    converted = []
+    for name in sorted(os.listdir(source)):
+        if not name.endswith(".json"):
+            continue
+        with open(os.path.join(source, name), "rb") as f:
+            raw = f.read()
+        encoded = codec.dumps(codec.loads(raw), pretty=storage_format == PRETTY)
+        target = os.path.join(destination, name)
+        tmp_path = f"{target}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, target)
+        converted.append((name, len(raw), len(encoded)))
+    return converted
+
+
+def main(argv=None):
+    """CLI: python -m modules.json_codec {export,compact} SOURCE [DESTINATION]"""
+    parser = argparse.ArgumentParser(description="Convert db/ tables between pretty and compact JSON")
+    parser.add_argument("command", choices=("export", "compact"),
+                        help="export: indented copy for humans; compact: production layout")
+    parser.add_argument("source", help="Folder with the .json tables (e.g. db)")
+    parser.add_argument("destination", nargs="?", help="Output folder (default: rewrite SOURCE in place)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    storage_format = PRETTY if args.command == "export" else COMPACT
+    for name, before, after in convert_folder(args.source, args.destination, storage_format):
+        print(f"{before:12d} -> {after:12d} bytes  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,317 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name -> help text (Prometheus # HELP lines)
+METRIC_HELP = {
+    "service_call_seconds": "Latency of public service methods",
+    "service_call_errors_total": "Service method calls that raised",
+    "api_request_seconds": "Latency of HTTP API requests",
+    "db_cache_hits_total": "Table reads served from the DBManager cache",
+    "db_cache_misses_total": "Table reads that parsed the file",
+    "db_read_seconds": "Time spent reading and parsing table files",
+    "db_read_bytes_total": "Bytes of table files parsed",
+    "db_write_seconds": "Time spent writing table files",
+    "db_written_bytes_total": "Bytes of table files written",
+}
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self):
+        """Return [(upper bound, observations <= bound)] including +Inf"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        result.append((float("inf"), self.count))
+        return result
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket it falls in"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """
+    In-process store of counters and histograms
+
+    Metrics are keyed by name and a small set of labels, e.g.
+    ("service_call_seconds", {"method": "BookingService.create_booking"}).
+    Recording is a no-op until the registry is enabled, so instrumented code
+    costs one attribute check when metrics are off.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters = {}  # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> Histogram
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items())) if labels else ()
+
+    def inc(self, name, labels=None, amount=1):
+        """Add to a counter"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=None):
+        """Record a value (seconds for latencies) in a histogram"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self):
+        """
+        Return the current values as plain data
+
+        Returns:
+            {"counters": [...], "histograms": [...], "cache_hit_rate": {table: ratio}}
+        """
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "sum": h.sum,
+                    "p50": h.quantile(0.5),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                    "buckets": [[bound, total] for bound, total in h.cumulative()[:-1]],
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+        hits, misses = {}, {}
+        for counter in counters:
+            table = counter["labels"].get("table")
+            if counter["name"] == "db_cache_hits_total":
+                hits[table] = counter["value"]
+            elif counter["name"] == "db_cache_misses_total":
+                misses[table] = counter["value"]
+        hit_rate = {
+            table: hits.get(table, 0) / (hits.get(table, 0) + misses.get(table, 0))
+            for table in set(hits) | set(misses)
+        }
+        return {"counters": counters, "histograms": histograms, "cache_hit_rate": hit_rate}
+
+    def dump(self, path):
+        """Write snapshot() to a JSON file"""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=4, default=str)
+
+    def render_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(
+                ((key, h.cumulative(), h.sum, h.count) for key, h in self._histograms.items()),
+                key=lambda item: item[0]
+            )
+        lines = []
+        described = set()
+
+        def describe(name, kind):
+            if name not in described:
+                described.add(name)
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in counters:
+            describe(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        for (name, labels), buckets, total_sum, count in histograms:
+            describe(name, "histogram")
+            for bound, total in buckets:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {total}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {total_sum}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        parts.append(f"{name}=\"{value}\"")
+    return "{" + ",".join(parts) + "}"
+
+
+registry = MetricsRegistry()
+
+
+# ----------------------- Instrumentation ------------------------------------
+def timed(metric="service_call_seconds", **labels):
+    """
+    Decorator recording the latency of each call in a histogram
+
+    Calls that raise are also counted in `<metric minus _seconds>_errors_total`.
+    """
+    error_metric = metric[:-len("_seconds")] + "_errors_total" if metric.endswith("_seconds") else metric + "_errors_total"
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                registry.inc(error_metric, labels)
+                raise
+            finally:
+                registry.observe(metric, time.perf_counter() - started, labels)
+        wrapper._metrics_timed = True
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _service_classes():
+    from .auth_service import AuthService
+    from .booking_service import BookingService
+    from .room_service import RoomService
+    from .search_service import SearchService
+    return AuthService, BookingService, RoomService, SearchService
+
+
+def instrument_class(cls, metric="service_call_seconds"):
+    """Wrap every public method of a class with timed(method="Class.method")"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not callable(attr) or getattr(attr, "_metrics_timed", False):
+            continue
+        setattr(cls, name, timed(metric, method=f"{cls.__name__}.{name}")(attr))
+
+
+def install():
+    """Enable the registry and time the public methods of the services"""
+    registry.enabled = True
+    for cls in _service_classes():
+        instrument_class(cls)
+
+
+# ----------------------- Export ---------------------------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsServer:
+    """Serves GET /metrics (Prometheus text) from a daemon thread"""
+
+    def __init__(self, host="127.0.0.1", port=9464):
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+
+def start_from_environment():
+    """
+    Turn metrics on when configured through the environment
+
+    ANHOTEL_METRICS=1 enables recording, ANHOTEL_METRICS_PORT=PORT also
+    serves /metrics on 127.0.0.1, and ANHOTEL_METRICS_FILE=PATH writes a
+    JSON snapshot on exit. Either of the last two implies the first.
+
+    Returns:
+        The started MetricsServer, or None
+    """
+    port = os.environ.get("ANHOTEL_METRICS_PORT")
+    dump_path = os.environ.get("ANHOTEL_METRICS_FILE")
+    if os.environ.get("ANHOTEL_METRICS") != "1" and not port and not dump_path:
+        return None
+    install()
+    if dump_path:
+        atexit.register(registry.dump, dump_path)
+    if not port:
+        return None
+    server = MetricsServer(port=int(port))
+    try:
+        server.start()
+    except OSError as e:
+        print(f"Warning: Failed to start metrics server on port {port}: {e}")
+        return None
+    print(f"Metrics served on http://127.0.0.1:{server.port}/metrics")
+    return server
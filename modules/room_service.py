@@ -1,11 +1,13 @@
 from .db_manager import DBManager
+from .image_cache import ImageCache, ROOM_TYPE_THUMBNAILS
+from .event_bus import ROOM_TYPE_IMAGE_CHANGED
 import os
-import shutil
 from datetime import datetime
 
 class RoomService:
-    def __init__(self, db_manager=None):
+    def __init__(self, db_manager=None, image_cache=None):
         self.db = db_manager or DBManager("db")
+        self.image_cache = image_cache or ImageCache()
         self.images_folder = "assets/images"
         # Create images folder if it doesn't exist (using absolute path)
         abs_images_folder = os.path.abspath(self.images_folder)
@@ -14,7 +16,24 @@ class RoomService:
     # Room CRUD operations
     def get_all_rooms(self):
         """Get all rooms with room type information"""
-        rooms = self.db.get_all_rooms()
+        return self._with_type_names(self.db.get_all_rooms())
+
+    def get_rooms_page(self, page_size=50, cursor=None):
+        """
+        Get one page of rooms with room type information, ordered by roomId
+        
+        Args:
+            page_size: Maximum number of rooms to return
+            cursor: next_cursor of the previous page (None for the first page)
+            
+        Returns:
+            (rooms, next_cursor) - next_cursor is None on the last page
+        """
+        rooms, next_cursor = self.db.get_rooms_page(after_id=cursor, limit=page_size)
+        return self._with_type_names(rooms), next_cursor
+
+    def _with_type_names(self, rooms):
+        """Enrich room records with their room type name"""
         room_types = self.db.get_all_room_types()
         type_dict = {rt["typeID"]: rt for rt in room_types}
         
@@ -157,28 +176,10 @@ class RoomService:
         # Generate new type ID
         new_type_id = max([rt.get("typeID", 0) for rt in room_types], default=0) + 1
         
-        # Handle image upload
+        # Handle image upload (if it fails, still create room type but without image)
         final_image_path = ""
         if image_path and os.path.exists(image_path):
-            try:
-                # Get file extension
-                _, ext = os.path.splitext(image_path)
-                # Create new filename
-                new_filename = f"room_type_{new_type_id}{ext}"
-                dest_path = os.path.join(self.images_folder, new_filename)
-                
-                # Ensure destination directory exists
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                
-                # Copy image to assets folder
-                shutil.copy2(image_path, dest_path)
-                
-                # Normalize path to use forward slashes for cross-platform compatibility
-                final_image_path = dest_path.replace("\\", "/")
-            except Exception as e:
-                # If copy fails, still create room type but without image
-                print(f"Warning: Failed to copy image: {e}")
-                final_image_path = ""
+            final_image_path = self.store_room_type_image(image_path, new_type_id) or ""
         
         type_data = {
             "typeID": new_type_id,
@@ -230,30 +231,62 @@ class RoomService:
         if price is not None:
             update_data["price"] = price
         
-        # Handle image update
+        # Handle image update (if it fails, skip image update)
+        new_image_path = None
         if image_path and os.path.exists(image_path):
-            try:
-                # Get file extension
-                _, ext = os.path.splitext(image_path)
-                # Create new filename
-                new_filename = f"room_type_{type_id}{ext}"
-                dest_path = os.path.join(self.images_folder, new_filename)
-                
-                # Ensure destination directory exists
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                
-                # Copy image to assets folder
-                shutil.copy2(image_path, dest_path)
-                
-                # Normalize path to use forward slashes for cross-platform compatibility
-                update_data["imagePath"] = dest_path.replace("\\", "/")
-            except Exception as e:
-                # If copy fails, skip image update
-                print(f"Warning: Failed to copy image: {e}")
+            new_image_path = self.store_room_type_image(image_path, type_id)
+            if new_image_path:
+                update_data["imagePath"] = new_image_path
+                self._remove_replaced_image(target_type.get("imagePath", ""), new_image_path, type_id)
         
         self.db.update_room_type(type_id, update_data)
+        if new_image_path:
+            # The record may keep the same path while the file content changed
+            self.db.emit(ROOM_TYPE_IMAGE_CHANGED, type_id, {"imagePath": new_image_path})
         return True
     
+    def store_room_type_image(self, image_path, type_id):
+        """
+        Store an uploaded room type image and pre-generate its thumbnails
+
+        The original is re-encoded with EXIF orientation applied and its size
+        capped, then every thumbnail size used by the views is rendered so
+        card grids only ever decode small files.
+
+        Args:
+            image_path: Uploaded image file
+            type_id: Room type ID (used in the file name)
+
+        Returns:
+            Stored image path with forward slashes, or None if the image could not be stored
+        """
+        try:
+            dest_base = os.path.join(self.images_folder, f"room_type_{type_id}")
+            dest_path = self.image_cache.optimize_upload(image_path, dest_base)
+        except Exception as e:
+            print(f"Warning: Failed to copy image: {e}")
+            return None
+
+        self.image_cache.pregenerate(dest_path, ROOM_TYPE_THUMBNAILS)
+
+        # Normalize path to use forward slashes for cross-platform compatibility
+        return dest_path.replace("\\", "/")
+
+    def _remove_replaced_image(self, old_path, new_path, type_id):
+        """Delete the previous stored image of a room type (e.g. room_type_3.png replaced by .jpg)"""
+        if not old_path or os.path.abspath(old_path) == os.path.abspath(new_path):
+            return
+        # Only remove files this service created for the same room type
+        old_name, _ = os.path.splitext(os.path.basename(old_path))
+        if old_name != f"room_type_{type_id}":
+            return
+        if os.path.dirname(os.path.abspath(old_path)) != os.path.abspath(self.images_folder):
+            return
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+
     def delete_room_type(self, type_id):
         """
         Delete a room type
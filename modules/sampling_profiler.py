@@ -0,0 +1,185 @@
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_INTERVAL = 0.005
+DEFAULT_OUTPUT_DIR = "profiles"
+
+# Frames of the Tk event loop itself; a stack that ends in one of them is idle
+IDLE_FUNCTIONS = {"mainloop"}
+
+
+def frame_label(code):
+    """Name a stack frame as "qualified.name (file.py:first line)" """
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of one thread at a fixed interval
+
+    A daemon thread reads the target thread's current frame through
+    sys._current_frames(), so the profiled code runs unmodified and the cost
+    is one stack walk per sample. Samples are aggregated as collapsed stacks
+    ("root;caller;callee count"), the input format of flamegraph.pl,
+    speedscope and similar tools. Each stack is rooted at the value of
+    `label()` when it was taken (the screen shown), and samples where the
+    thread was idle in the Tk event loop are dropped unless include_idle is set.
+    """
+
+    def __init__(self, thread_id=None, interval=DEFAULT_INTERVAL, label=None, include_idle=False):
+        """
+        Args:
+            thread_id: Thread to sample (defaults to the thread creating the profiler)
+            interval: Seconds between samples
+            label: Optional function() -> root frame name (e.g. the current screen)
+            include_idle: Keep samples taken while the thread waits in the event loop
+        """
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.label = label
+        self.include_idle = include_idle
+        self.stacks = {}  # collapsed stack -> samples
+        self.samples = 0
+        self.idle_samples = 0
+        self.started_at = None
+        self.stopped_at = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        """Start sampling (clears previous samples)"""
+        if self._thread is not None:
+            return
+        self.stacks = {}
+        self.samples = 0
+        self.idle_samples = 0
+        self.started_at = time.perf_counter()
+        self.stopped_at = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.stopped_at = time.perf_counter()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Take one sample of the target thread"""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        if frame.f_code.co_name in IDLE_FUNCTIONS and not self.include_idle:
+            self.idle_samples += 1
+            return
+        names = []
+        while frame is not None:
+            names.append(frame_label(frame.f_code))
+            frame = frame.f_back
+        root = None
+        if self.label is not None:
+            try:
+                root = self.label()
+            except Exception:
+                root = None
+        names.append(str(root or "main"))
+        stack = ";".join(reversed(names))
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+
+    def collapsed_stacks(self):
+        """Return "stack count" lines, heaviest first"""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1])]
+
+    def write(self, path):
+        """Write the collapsed stacks to `path` (folders are created)"""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.collapsed_stacks()) + "\n")
+        return path
+
+    def top_functions(self, limit=10):
+        """
+        Return the functions most often at the top of the stack
+
+        Returns:
+            List of (frame label, share of busy samples)
+        """
+        leaves = {}
+        for stack, count in self.stacks.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            leaves[leaf] = leaves.get(leaf, 0) + count
+        total = self.samples or 1
+        return [(leaf, count / total) for leaf, count in sorted(leaves.items(), key=lambda item: -item[1])[:limit]]
+
+
+class ScreenProfiler:
+    """
+    Hotkey-driven capture for the App: toggle() starts sampling the Tk thread,
+    the next toggle() stops it and writes `<screen>-<time>.folded` to
+    ANHOTEL_PROFILE_DIR (default profiles/).
+    """
+
+    def __init__(self, app, output_dir=None, interval=DEFAULT_INTERVAL):
+        """
+        Args:
+            app: App whose `current_frame` names the screen being profiled
+            output_dir: Folder for the .folded files
+            interval: Seconds between samples
+        """
+        self.app = app
+        self.output_dir = output_dir or os.environ.get("ANHOTEL_PROFILE_DIR", DEFAULT_OUTPUT_DIR)
+        self.interval = interval
+        self.profiler = None
+        self._start_screen = None
+
+    def toggle(self):
+        """
+        Start or stop a capture
+
+        Returns:
+            Path of the written file when a capture was stopped, else None
+        """
+        if self.profiler is None:
+            self._start_screen = self.app.current_frame
+            self.profiler = SamplingProfiler(
+                interval=self.interval,
+                label=lambda: self.app.current_frame
+            )
+            self.profiler.start()
+            print(f"Profiling {self._start_screen or 'App'} (press F9 again to stop)")
+            return None
+
+        profiler, self.profiler = self.profiler, None
+        profiler.stop()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self.output_dir, f"{self._start_screen or 'App'}-{stamp}.folded")
+        profiler.write(path)
+        elapsed = (profiler.stopped_at - profiler.started_at) if profiler.started_at else 0
+        print(f"Profile written to {path}: {profiler.samples} busy samples "
+              f"({profiler.idle_samples} idle) over {elapsed:.1f} s")
+        for leaf, share in profiler.top_functions(5):
+            print(f"  {share:6.1%}  {leaf}")
+        return path
+
+    @property
+    def running(self):
+        return self.profiler is not None
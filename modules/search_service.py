@@ -6,8 +6,8 @@ import re
 class SearchService:
     """Service class for handling search operations"""
     
-    def __init__(self):
-        self.db_manager = DBManager("db")
+    def __init__(self, db_manager=None):
+        self.db_manager = db_manager or DBManager("db")
     
     def parse_date(self, date_str):
         """Parse date string in DD/MM/YYYY or YYYY-MM-DD format"""
@@ -0,0 +1,249 @@
+from .db_manager import DBManager
+import os
+import secrets
+import threading
+import time
+
+# Entries in the shared session file older than this are dropped (seconds)
+SHARED_SESSION_MAX_AGE = 24 * 60 * 60
+
+
+class SessionManager:
+    """Keeps logged-in users in memory behind opaque session tokens"""
+
+    def __init__(self, db_manager=None, session_file=None, refresh_interval=300):
+        """
+        Args:
+            db_manager: Shared DBManager used to reload profile fields
+            session_file: Optional JSON file listing the sessions open at every desk process
+            refresh_interval: Seconds before a cached profile is reloaded on next read
+        """
+        self.db = db_manager or DBManager("db")
+        self.session_file = session_file
+        self.refresh_interval = refresh_interval
+        self._sessions = {}
+        self._lock = threading.RLock()
+        self._listeners = []
+
+    # ----------------------- Change notifications ---------------------------
+    def subscribe(self, callback):
+        """
+        Call `callback(token, user)` whenever a session starts, ends or its user changes
+
+        `user` is the new user dict, or None when the session ended. Callbacks
+        run on the thread that changed the session, outside of the session lock.
+
+        Returns:
+            The callback (to pass to unsubscribe later)
+        """
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop notifying a callback registered with subscribe()"""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _notify(self, token, user):
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(token, user)
+            except Exception as e:
+                print(f"Warning: Session listener failed: {e}")
+
+    # ----------------------- Identity helpers -------------------------------
+    def get_identity(self, user_data):
+        """
+        Return (role, userID) for a user dict
+
+        Customers are keyed by customerID and admins by adminID. Users returned
+        by AuthService.login have no role field, so the role is inferred.
+        """
+        role = user_data.get("role")
+        if not role:
+            role = "admin" if "adminID" in user_data else "customer"
+        user_id = user_data.get("adminID") if role == "admin" else user_data.get("customerID")
+        return role, user_id
+
+    def _load_profile(self, role, user_id):
+        """Read the latest profile fields for a user from the database"""
+        if role == "admin":
+            profile = self.db.get_admin_by_id(user_id)
+        else:
+            profile = self.db.get_customer_by_id(user_id)
+        if profile is None:
+            return None
+        profile = profile.copy()
+        if "role" not in profile:
+            profile["role"] = role
+        return profile
+
+    # ----------------------- Session lifecycle ------------------------------
+    def create_session(self, user_data):
+        """
+        Start a session for a logged-in user
+
+        Args:
+            user_data: User dict returned by AuthService
+
+        Returns:
+            Opaque session token
+        """
+        role, user_id = self.get_identity(user_data)
+        user = user_data.copy()
+        user["role"] = role
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._sessions[token] = {
+                "role": role,
+                "userID": user_id,
+                "user": user,
+                "loadedAt": time.monotonic(),
+                "stale": False
+            }
+            self._persist()
+        self._notify(token, user)
+        return token
+
+    def end_session(self, token):
+        """Forget a session (logout)"""
+        with self._lock:
+            removed = self._sessions.pop(token, None)
+            if self.session_file:
+                shared = self._read_shared()
+                if shared.pop(token, None) is not None or removed:
+                    self._write_shared(shared)
+        if removed is not None:
+            self._notify(token, None)
+
+    def get_user(self, token):
+        """
+        Return the cached user dict for a session
+
+        The profile is only reloaded from disk when it was invalidated or is
+        older than refresh_interval. Tokens are only valid in the process
+        that created them.
+
+        Returns:
+            User dict, or None if the token is unknown or the user was deleted
+        """
+        if not token:
+            return None
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+
+            age = time.monotonic() - session["loadedAt"]
+            if not (session["stale"] or (self.refresh_interval is not None and age > self.refresh_interval)):
+                return session["user"]
+
+            previous = session["user"]
+            profile = self._load_profile(session["role"], session["userID"])
+            if profile is None:
+                # User was deleted while logged in
+                self._sessions.pop(token, None)
+                self._persist()
+            else:
+                session["user"] = profile
+                session["loadedAt"] = time.monotonic()
+                session["stale"] = False
+
+        if profile != previous:
+            self._notify(token, profile)
+        return profile
+
+    def update_user(self, token, user_data):
+        """
+        Replace the cached profile of a session with fresh data
+
+        Returns:
+            True if the session exists and belongs to the same user, False otherwise
+        """
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return False
+            if self.get_identity(user_data) != (session["role"], session["userID"]):
+                return False
+            user = user_data.copy()
+            user["role"] = session["role"]
+            previous = session["user"]
+            session["user"] = user
+            session["loadedAt"] = time.monotonic()
+            session["stale"] = False
+        if user != previous:
+            self._notify(token, user)
+        return True
+
+    def invalidate_user(self, role, user_id):
+        """Mark every session of a user as stale so the next read reloads it"""
+        with self._lock:
+            for session in self._sessions.values():
+                if session["role"] == role and session["userID"] == user_id:
+                    session["stale"] = True
+
+    def invalidate_all(self):
+        """Mark every session as stale"""
+        with self._lock:
+            for session in self._sessions.values():
+                session["stale"] = True
+
+    # ----------------------- Shared session file ----------------------------
+    def _read_shared(self):
+        data = self.db.load_json(self.session_file)
+        return data if isinstance(data, dict) else {}
+
+    def _write_shared(self, shared):
+        self.db.save_json(self.session_file, shared)
+
+    def _persist(self):
+        """
+        Write session identities (never profiles or hashes) to the shared file
+
+        Entries of this process that ended are removed, and so are entries
+        left behind by processes that exited without logging out (their pid
+        is gone, or they were not refreshed for SHARED_SESSION_MAX_AGE).
+        """
+        if not self.session_file:
+            return
+        shared = self._read_shared()
+        now = time.time()
+        pid = os.getpid()
+        for token in list(shared):
+            entry = shared[token]
+            if token in self._sessions:
+                continue
+            if entry.get("pid") == pid or not _process_alive(entry.get("pid")) \
+                    or now - entry.get("updatedAt", 0) > SHARED_SESSION_MAX_AGE:
+                del shared[token]
+        for token, session in self._sessions.items():
+            shared[token] = {
+                "role": session["role"],
+                "userID": session["userID"],
+                "pid": pid,
+                "updatedAt": now
+            }
+        self._write_shared(shared)
+
+
+def _process_alive(pid):
+    """Return False if no process has this pid (always True where that cannot be checked)"""
+    if not isinstance(pid, int) or pid <= 0:
+        return False
+    if os.name != "posix":
+        # os.kill(pid, 0) would terminate the process on Windows; rely on the age limit
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to another user
+        return True
+    return True
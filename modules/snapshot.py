@@ -0,0 +1,306 @@
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"ANHSNAP1"
+VERSION = 1
+
+# magic, version, records, fields, source mtime_ns, source size,
+# fields offset, records offset, heap offset, index directory offset, indexes
+_HEADER = struct.Struct("<8sIIIqqQQQQI")
+_SLOT = struct.Struct("<B8s")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_REF = struct.Struct("<II")  # heap offset, length
+_ENTRY = struct.Struct("<QI")  # key hash, record number
+_U16 = struct.Struct("<H")
+_INDEX_INFO = struct.Struct("<BQI")  # lower, entries offset, entries
+
+# Slot tags
+MISSING, NULL, FALSE, TRUE, INT, FLOAT, STR, JSON = range(8)
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def key_hash(value, lower=False):
+    """64-bit index key of a field value (ints map to themselves)"""
+    if isinstance(value, bool) or value is None:
+        value = json.dumps(value)
+    if isinstance(value, int) and INT64_MIN <= value <= INT64_MAX:
+        return value & 0xFFFFFFFFFFFFFFFF
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True)
+    elif lower:
+        value = value.lower()
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def write_snapshot(path, records, indexes=(), source_stamp=None):
+    """
+    Write records as a binary snapshot
+
+    Layout: a fixed header, the field names, one fixed-width record per row
+    (a 9-byte slot per field: type tag + int/float value or a reference into
+    the string heap), the deduplicated UTF-8 string heap, and sorted
+    (key hash, record number) arrays for the indexed fields. Nested values
+    are stored as JSON text in the heap.
+
+    Args:
+        path: Snapshot file to write (replaced atomically)
+        records: List of flat dicts
+        indexes: (field, lower) pairs to index
+        source_stamp: (mtime_ns, size) of the JSON file the records came from
+    """
+    fields = []
+    positions = {}
+    for record in records:
+        for name in record:
+            if name not in positions:
+                positions[name] = len(fields)
+                fields.append(name)
+
+    heap = bytearray()
+    heap_offsets = {}
+
+    def heap_ref(text):
+        offset = heap_offsets.get(text)
+        data = text.encode("utf-8")
+        if offset is None:
+            offset = heap_offsets[text] = len(heap)
+            heap.extend(data)
+        return _REF.pack(offset, len(data))
+
+    empty = _SLOT.pack(MISSING, b"")
+    rows = bytearray()
+    for record in records:
+        slots = [empty] * len(fields)
+        for name, value in record.items():
+            if value is None:
+                slot = _SLOT.pack(NULL, b"")
+            elif value is True or value is False:
+                slot = _SLOT.pack(TRUE if value else FALSE, b"")
+            elif isinstance(value, int) and INT64_MIN <= value <= INT64_MAX:
+                slot = _SLOT.pack(INT, _INT.pack(value))
+            elif isinstance(value, float):
+                slot = _SLOT.pack(FLOAT, _FLOAT.pack(value))
+            elif isinstance(value, str):
+                slot = _SLOT.pack(STR, heap_ref(value))
+            else:
+                slot = _SLOT.pack(JSON, heap_ref(json.dumps(value, ensure_ascii=False)))
+            slots[positions[name]] = slot
+        rows.extend(b"".join(slots))
+
+    field_block = bytearray()
+    for name in fields:
+        data = name.encode("utf-8")
+        field_block.extend(_U16.pack(len(data)) + data)
+
+    index_entries = []
+    for field, lower in indexes:
+        entries = sorted(
+            (key_hash(record[field], lower), number)
+            for number, record in enumerate(records)
+            if field in record
+        )
+        index_entries.append((field, lower, entries))
+
+    fields_offset = _HEADER.size
+    records_offset = fields_offset + len(field_block)
+    heap_offset = records_offset + len(rows)
+    entries_offset = heap_offset + len(heap)
+    directory = bytearray()
+    entry_blocks = bytearray()
+    for field, lower, entries in index_entries:
+        data = field.encode("utf-8")
+        directory.extend(_U16.pack(len(data)) + data)
+        directory.extend(_INDEX_INFO.pack(int(lower), entries_offset + len(entry_blocks), len(entries)))
+        for entry in entries:
+            entry_blocks.extend(_ENTRY.pack(*entry))
+    directory_offset = entries_offset + len(entry_blocks)
+
+    mtime_ns, size = source_stamp or (0, 0)
+    header = _HEADER.pack(MAGIC, VERSION, len(records), len(fields), mtime_ns, size,
+                          fields_offset, records_offset, heap_offset, directory_offset, len(index_entries))
+
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        for block in (header, field_block, rows, heap, entry_blocks, directory):
+            f.write(block)
+    os.replace(tmp_path, path)
+
+
+class _IndexKeys:
+    """Sequence view of an index's key hashes, for bisect"""
+
+    def __init__(self, buffer, offset, count):
+        self.buffer = buffer
+        self.offset = offset
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return _ENTRY.unpack_from(self.buffer, self.offset + i * _ENTRY.size)[0]
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file
+
+    Opening reads only the header, field names and index directory. Records
+    are decoded one at a time when requested, so an indexed lookup touches a
+    few pages of the index, one record and the strings it references, not
+    the whole table.
+    """
+
+    def __init__(self, path):
+        """
+        Raises:
+            OSError: The file cannot be opened
+            ValueError: The file is not a snapshot of this version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self.count, field_count, mtime_ns, size, fields_offset,
+             self._records_offset, self._heap_offset, directory_offset, index_count) = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Not a snapshot: {path}")
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a version {VERSION} snapshot: {path}")
+        self.source_stamp = (mtime_ns, size)
+
+        self.fields = []
+        offset = fields_offset
+        for _ in range(field_count):
+            length = _U16.unpack_from(self._mmap, offset)[0]
+            self.fields.append(self._mmap[offset + 2:offset + 2 + length].decode("utf-8"))
+            offset += 2 + length
+        self._record_size = _SLOT.size * field_count
+
+        self.indexes = {}  # (field, lower) -> _IndexKeys
+        offset = directory_offset
+        for _ in range(index_count):
+            length = _U16.unpack_from(self._mmap, offset)[0]
+            field = self._mmap[offset + 2:offset + 2 + length].decode("utf-8")
+            offset += 2 + length
+            lower, entries_offset, entries = _INDEX_INFO.unpack_from(self._mmap, offset)
+            offset += _INDEX_INFO.size
+            self.indexes[(field, bool(lower))] = _IndexKeys(self._mmap, entries_offset, entries)
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _heap_text(self, payload):
+        offset, length = _REF.unpack(payload)
+        start = self._heap_offset + offset
+        return self._mmap[start:start + length].decode("utf-8")
+
+    def _decode(self, tag, payload):
+        if tag == NULL:
+            return None
+        if tag == FALSE:
+            return False
+        if tag == TRUE:
+            return True
+        if tag == INT:
+            return _INT.unpack(payload)[0]
+        if tag == FLOAT:
+            return _FLOAT.unpack(payload)[0]
+        if tag == STR:
+            return self._heap_text(payload)
+        return json.loads(self._heap_text(payload))
+
+    def record(self, number):
+        """Decode one record as a new dict"""
+        if not 0 <= number < self.count:
+            raise IndexError(number)
+        base = self._records_offset + number * self._record_size
+        record = {}
+        for i, name in enumerate(self.fields):
+            tag, payload = _SLOT.unpack_from(self._mmap, base + i * _SLOT.size)
+            if tag != MISSING:
+                record[name] = self._decode(tag, payload)
+        return record
+
+    def value(self, number, field):
+        """Decode one field of one record (KeyError if the record lacks it)"""
+        i = self.fields.index(field)
+        tag, payload = _SLOT.unpack_from(self._mmap, self._records_offset + number * self._record_size + i * _SLOT.size)
+        if tag == MISSING:
+            raise KeyError(field)
+        return self._decode(tag, payload)
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self.record(number)
+
+    def has_index(self, field, lower=False):
+        return (field, lower) in self.indexes
+
+    def find(self, field, value, lower=False):
+        """
+        Return the records whose `field` equals `value`, in table order
+
+        Raises:
+            KeyError: The field is not indexed
+        """
+        keys = self.indexes[(field, lower)]
+        target = key_hash(value, lower)
+        start = bisect.bisect_left(keys, target)
+        end = bisect.bisect_right(keys, target, lo=start)
+        wanted = value.lower() if lower and isinstance(value, str) else value
+        matches = []
+        for i in range(start, end):
+            number = _ENTRY.unpack_from(keys.buffer, keys.offset + i * _ENTRY.size)[1]
+            try:
+                found = self.value(number, field)
+            except KeyError:
+                continue
+            if lower and isinstance(found, str):
+                found = found.lower()
+            if found == wanted and type(found) is type(wanted):
+                matches.append(number)
+        return [self.record(number) for number in sorted(matches)]
+
+
+def main(argv=None):
+    """CLI: python -m modules.snapshot {build,show} DATA_FOLDER"""
+    from .db_manager import DBManager
+
+    parser = argparse.ArgumentParser(description="Build or inspect the binary snapshots of the db/ tables")
+    parser.add_argument("command", choices=("build", "show"))
+    parser.add_argument("folder", nargs="?", default="db")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    db = DBManager(args.folder)
+    if args.command == "build":
+        for file_path in db.refresh_snapshots(min_bytes=0):
+            print(f"Built snapshot of {file_path}")
+        return 0
+    for file_path in db.snapshot_tables():
+        snapshot = db.get_snapshot(file_path)
+        state = f"{len(snapshot)} records, {len(snapshot.fields)} fields" if snapshot else "missing or stale"
+        print(f"{os.path.basename(file_path):16s} {state}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+from contextlib import contextmanager
+import json
+import os
+import sys
+import time
+
+DEFAULT_REPORT = "startup_profile.json"
+
+
+class StartupProfiler:
+    """Records nested startup phases and writes a JSON + collapsed-stack report"""
+
+    def __init__(self, report_path=None, exit_after_paint=False):
+        """
+        Args:
+            report_path: Where to write the JSON report (None disables profiling)
+            exit_after_paint: Quit the app once the first paint was recorded (for CI)
+        """
+        self.report_path = report_path
+        self.enabled = report_path is not None
+        self.exit_after_paint = exit_after_paint
+        self._origin = time.perf_counter()
+        self._stack = []
+        self._phases = []
+        self._marks = []
+
+    @classmethod
+    def from_environment(cls, argv=None):
+        """
+        Build a profiler from the command line or environment
+
+        Enabled by `--profile-startup[=PATH]` or ANHOTEL_PROFILE_STARTUP=PATH
+        ("1" uses the default path). `--profile-exit` or ANHOTEL_PROFILE_EXIT=1
+        closes the window after the first paint.
+        """
+        argv = sys.argv[1:] if argv is None else argv
+        report_path = os.environ.get("ANHOTEL_PROFILE_STARTUP") or None
+        exit_after_paint = os.environ.get("ANHOTEL_PROFILE_EXIT") == "1"
+        for arg in argv:
+            if arg == "--profile-startup":
+                report_path = report_path or DEFAULT_REPORT
+            elif arg.startswith("--profile-startup="):
+                report_path = arg.split("=", 1)[1]
+            elif arg == "--profile-exit":
+                exit_after_paint = True
+        if report_path == "1":
+            report_path = DEFAULT_REPORT
+        return cls(report_path, exit_after_paint)
+
+    def _now_ms(self):
+        return (time.perf_counter() - self._origin) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block; phases opened inside it become its children"""
+        if not self.enabled:
+            yield
+            return
+        self._stack.append(name)
+        path = ";".join(self._stack)
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            self._phases.append({
+                "name": name,
+                "path": path,
+                "start_ms": round(start, 3),
+                "duration_ms": round(self._now_ms() - start, 3)
+            })
+            self._stack.pop()
+
+    def mark(self, name):
+        """Record a point in time (e.g. first paint)"""
+        if self.enabled:
+            self._marks.append({"name": name, "at_ms": round(self._now_ms(), 3)})
+
+    # ----------------------- Report -----------------------------------------
+    def build_report(self):
+        """Return the report dict"""
+        phases = sorted(self._phases, key=lambda p: p["start_ms"])
+        totals = {}
+        for phase in phases:
+            totals[phase["path"]] = totals.get(phase["path"], 0) + phase["duration_ms"]
+        marks = {m["name"]: m["at_ms"] for m in self._marks}
+        return {
+            "python": sys.version.split()[0],
+            "total_ms": marks.get("first_paint", round(self._now_ms(), 3)),
+            "marks": marks,
+            "phases": phases,
+            "totals": {path: round(ms, 3) for path, ms in totals.items()}
+        }
+
+    def collapsed_stacks(self):
+        """
+        Return flamegraph.pl / speedscope "collapsed" lines
+
+        Each line is `startup;parent;child <self time in microseconds>`.
+        """
+        self_time = {}
+        for phase in self._phases:
+            self_time[phase["path"]] = self_time.get(phase["path"], 0) + phase["duration_ms"]
+        for phase in self._phases:
+            parent = phase["path"].rpartition(";")[0]
+            if parent:
+                self_time[parent] = self_time.get(parent, 0) - phase["duration_ms"]
+        lines = []
+        for path, ms in self_time.items():
+            micros = int(round(ms * 1000))
+            if micros > 0:
+                lines.append(f"startup;{path} {micros}")
+        return lines
+
+    def write_report(self):
+        """
+        Write the JSON report and a `.folded` collapsed-stack file next to it
+
+        Returns:
+            Path of the JSON report, or None if profiling is disabled
+        """
+        if not self.enabled:
+            return None
+        report = self.build_report()
+        folder = os.path.dirname(self.report_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(self.report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+        folded_path = os.path.splitext(self.report_path)[0] + ".folded"
+        with open(folded_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.collapsed_stacks()) + "\n")
+        return self.report_path
+
+
+def check_budget(report, budget):
+    """
+    Compare a startup report against a budget
+
+    Args:
+        report: Report dict written by StartupProfiler
+        budget: {"total_ms": float, "phases": {phase path: max ms}}
+
+    Returns:
+        List of human readable violations (empty if within budget)
+    """
+    violations = []
+    total_limit = budget.get("total_ms")
+    if total_limit is not None and report.get("total_ms", 0) > total_limit:
+        violations.append(f"total: {report['total_ms']:.1f} ms > {total_limit} ms")
+    totals = report.get("totals", {})
+    for path, limit in budget.get("phases", {}).items():
+        if path not in totals:
+            continue
+        if totals[path] > limit:
+            violations.append(f"{path}: {totals[path]:.1f} ms > {limit} ms")
+    return violations
+
+
+def main(argv=None):
+    """CLI: python -m modules.startup_profiler REPORT.json BUDGET.json"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("Usage: python -m modules.startup_profiler REPORT.json BUDGET.json")
+        return 2
+    with open(argv[0], "r", encoding="utf-8") as f:
+        report = json.load(f)
+    with open(argv[1], "r", encoding="utf-8") as f:
+        budget = json.load(f)
+
+    for path, ms in sorted(report.get("totals", {}).items(), key=lambda item: -item[1]):
+        print(f"{ms:10.1f} ms  {path}")
+    print(f"{report.get('total_ms', 0):10.1f} ms  TOTAL (first paint)")
+
+    violations = check_budget(report, budget)
+    if violations:
+        print("Startup budget exceeded:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    print("Startup within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+import pytest
+
+from modules.checkout_scheduler import DEFAULT_INTERVAL, interval_from_environment
+
+
+def test_interval_defaults_when_unset(monkeypatch):
+    monkeypatch.delenv("ANHOTEL_CHECKOUT_INTERVAL", raising=False)
+    assert interval_from_environment() == DEFAULT_INTERVAL
+
+
+def test_interval_from_environment(monkeypatch):
+    monkeypatch.setenv("ANHOTEL_CHECKOUT_INTERVAL", "60")
+    assert interval_from_environment() == 60
+
+
+@pytest.mark.parametrize("value", ["", "abc", "3.5", "0", "-5"])
+def test_invalid_interval_falls_back_with_warning(monkeypatch, capsys, value):
+    monkeypatch.setenv("ANHOTEL_CHECKOUT_INTERVAL", value)
+    assert interval_from_environment() == DEFAULT_INTERVAL
+    assert "Warning: Invalid ANHOTEL_CHECKOUT_INTERVAL" in capsys.readouterr().out
@@ -0,0 +1,148 @@
+import json
+import os
+from datetime import date, datetime
+
+import pytest
+
+from modules.db_manager import DBManager
+
+BOOKINGS = [
+    {"bookingID": 1, "customerID": 10, "roomId": 101, "checkInDate": "2025-01-02",
+     "checkOutDate": "2025-01-04", "status": "Confirmed", "totalAmount": 200},
+    {"bookingID": 3, "customerID": 11, "roomId": 102, "checkInDate": "2025-02-01",
+     "checkOutDate": "2025-02-03", "status": "Pending", "totalAmount": 300},
+]
+
+
+def booking(booking_id, customer_id=10):
+    return {"bookingID": booking_id, "customerID": customer_id, "roomId": 101,
+            "checkInDate": "2025-03-01", "checkOutDate": "2025-03-02",
+            "status": "Pending", "totalAmount": 100}
+
+
+@pytest.fixture
+def db(tmp_path):
+    with open(tmp_path / "booking.json", "w", encoding="utf-8") as f:
+        json.dump(BOOKINGS, f)
+    manager = DBManager(str(tmp_path))
+    manager.fsync = False
+    # Build the cached indexes that appends extend in place
+    assert manager.get_booking_by_id(1) is not None
+    assert manager.get_customer_bookings(10)
+    assert manager.next_booking_id() == 4
+    return manager
+
+
+def assert_matches_disk(db, missing=()):
+    with open(db.booking_file, encoding="utf-8") as f:
+        on_disk = json.load(f)
+    for record in on_disk:
+        assert db.get_booking_by_id(record["bookingID"]) == record
+    for booking_id in missing:
+        assert db.get_booking_by_id(booking_id) is None
+    assert db.next_booking_id() == max(r["bookingID"] for r in on_disk) + 1
+    for customer_id in {r["customerID"] for r in on_disk}:
+        assert db.get_customer_bookings(customer_id) == [r for r in on_disk if r["customerID"] == customer_id]
+    # A fresh manager reads the same table
+    assert DBManager(db.data_folder).get_all_bookings() == db.get_all_bookings()
+    return on_disk
+
+
+def fail_replace(monkeypatch):
+    def replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", replace)
+
+
+def test_append_extends_indexes(db):
+    db.add_booking(booking(4))
+    on_disk = assert_matches_disk(db)
+    assert [r["bookingID"] for r in on_disk] == [1, 3, 4]
+
+
+def test_nested_batch_that_raises_is_rolled_back(db):
+    with db.batch():
+        db.add_booking(booking(db.next_booking_id()))
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.add_booking(booking(db.next_booking_id(), customer_id=12))
+                assert db.get_booking_by_id(5) is not None
+                assert db.next_booking_id() == 6
+                raise RuntimeError("savepoint")
+        # The outer batch sees its own write only
+        assert db.get_booking_by_id(4) is not None
+        assert db.get_booking_by_id(5) is None
+        assert db.next_booking_id() == 5
+        assert db.get_customer_bookings(12) == []
+    on_disk = assert_matches_disk(db, missing=[5])
+    assert [r["bookingID"] for r in on_disk] == [1, 3, 4]
+
+
+def test_outer_batch_that_raises_writes_nothing(db):
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.add_booking(booking(db.next_booking_id()))
+            raise RuntimeError("rollback")
+    on_disk = assert_matches_disk(db, missing=[4])
+    assert on_disk == BOOKINGS
+
+
+def test_failed_batch_commit_resets_cache(db, monkeypatch):
+    external_changes = []
+    db.on_external_change = lambda *args: external_changes.append(args)
+    fail_replace(monkeypatch)
+    with pytest.raises(OSError):
+        with db.batch():
+            db.add_booking(booking(db.next_booking_id()))
+            db.update_booking_status(1, "Completed")
+    monkeypatch.undo()
+    on_disk = assert_matches_disk(db, missing=[4])
+    assert on_disk == BOOKINGS
+    # The discarded batch is not mistaken for a change made by another process
+    assert external_changes == []
+
+
+def test_failed_append_resets_indexes(db, monkeypatch):
+    fail_replace(monkeypatch)
+    with pytest.raises(OSError):
+        db.add_booking(booking(db.next_booking_id(), customer_id=12))
+    monkeypatch.undo()
+    on_disk = assert_matches_disk(db, missing=[4])
+    assert on_disk == BOOKINGS
+    assert db.get_customer_bookings(12) == []
+    # The next append starts from the table on disk again
+    db.add_booking(booking(db.next_booking_id()))
+    assert [r["bookingID"] for r in assert_matches_disk(db)] == [1, 3, 4]
+
+
+def test_failed_batch_publishes_no_events(db, monkeypatch):
+    received = []
+    db.events.subscribe(received.extend)
+    fail_replace(monkeypatch)
+    with pytest.raises(OSError):
+        with db.batch():
+            db.add_booking(booking(db.next_booking_id()))
+    monkeypatch.undo()
+    db.events.flush()
+    assert received == []
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    ("2025-01-01", None, [1, 3]),
+    ("2025-01-03", None, [3]),
+    (None, "2025-02-01", [1]),
+    (date(2025, 1, 2), date(2025, 1, 3), [1]),
+    (datetime(2025, 2, 1, 12, 30), None, [3]),
+])
+def test_iter_bookings_by_check_in_date(db, start, end, expected):
+    assert [b["bookingID"] for b in db.iter_bookings(start=start, end=end)] == expected
+    db.invalidate_cache()
+    assert [b["bookingID"] for b in db.iter_bookings(start=start, end=end)] == expected
+
+
+@pytest.mark.parametrize("value", ["2025-13-01", "2025-02-30", "01/02/2025", "2025-01-01T10:00", "", 20250101])
+def test_iter_bookings_rejects_invalid_dates(db, value):
+    with pytest.raises(ValueError):
+        db.iter_bookings(start=value)
+    with pytest.raises(ValueError):
+        db.iter_bookings(end=value)
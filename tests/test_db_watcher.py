@@ -0,0 +1,79 @@
+import pytest
+
+from modules import event_bus
+from modules.db_watcher import DBWatcher, diff_records
+
+BOOKING = {"bookingID": 1, "roomId": 101, "status": "Pending", "totalAmount": 100}
+ROOM = {"roomId": 1, "roomNumber": "101", "typeID": 1, "Status": "Available"}
+ROOM_TYPE = {"typeID": 1, "typeName": "Deluxe", "pricePerNight": 100}
+CUSTOMER = {"customerID": 1, "name": "An", "email": "an@example.com"}
+ADMIN = {"adminID": 1, "name": "Admin", "email": "admin@example.com"}
+
+
+def changed(record, **fields):
+    return {**record, **fields}
+
+
+# (case, table, old, new, expected events or None for a whole-table change)
+CASES = [
+    ("booking created", "booking.json", [BOOKING], [BOOKING, changed(BOOKING, bookingID=2)],
+     [(event_bus.BOOKING_CREATED, 2, changed(BOOKING, bookingID=2))]),
+    ("booking status only", "booking.json", [BOOKING], [changed(BOOKING, status="Confirmed")],
+     [(event_bus.BOOKING_STATUS_CHANGED, 1, {
+         "booking": changed(BOOKING, status="Confirmed"), "status": "Confirmed", "previous": "Pending"})]),
+    ("booking other field", "booking.json", [BOOKING], [changed(BOOKING, totalAmount=200)], None),
+    ("booking status and other field", "booking.json", [BOOKING],
+     [changed(BOOKING, status="Confirmed", roomId=102)], None),
+    ("booking field added", "booking.json", [BOOKING], [changed(BOOKING, guestName="An")], None),
+    ("booking deleted", "booking.json", [BOOKING, changed(BOOKING, bookingID=2)], [BOOKING], None),
+    ("booking unchanged", "booking.json", [BOOKING], [dict(BOOKING)], []),
+    ("room created", "room.json", [], [ROOM], [(event_bus.ROOM_CREATED, 1, ROOM)]),
+    ("room updated", "room.json", [ROOM], [changed(ROOM, Status="Booked")],
+     [(event_bus.ROOM_UPDATED, 1, changed(ROOM, Status="Booked"))]),
+    ("room deleted", "room.json", [ROOM], [], [(event_bus.ROOM_DELETED, 1, None)]),
+    ("room type created", "roomType.json", [], [ROOM_TYPE], [(event_bus.ROOM_TYPE_CREATED, 1, ROOM_TYPE)]),
+    ("room type updated", "roomType.json", [ROOM_TYPE], [changed(ROOM_TYPE, pricePerNight=120)],
+     [(event_bus.ROOM_TYPE_UPDATED, 1, changed(ROOM_TYPE, pricePerNight=120))]),
+    ("room type deleted", "roomType.json", [ROOM_TYPE], [], [(event_bus.ROOM_TYPE_DELETED, 1, None)]),
+    ("customer created", "customer.json", [], [CUSTOMER], [(event_bus.CUSTOMER_CREATED, 1, CUSTOMER)]),
+    ("customer updated", "customer.json", [CUSTOMER], [changed(CUSTOMER, name="Binh")],
+     [(event_bus.CUSTOMER_UPDATED, 1, changed(CUSTOMER, name="Binh"))]),
+    ("customer deleted", "customer.json", [CUSTOMER], [], [(event_bus.CUSTOMER_DELETED, 1, None)]),
+    ("admin updated", "admin.json", [ADMIN], [changed(ADMIN, name="Root")], [(event_bus.ADMIN_UPDATED, 1, None)]),
+    ("admin created", "admin.json", [ADMIN], [ADMIN, changed(ADMIN, adminID=2)], None),
+    ("admin deleted", "admin.json", [ADMIN], [], None),
+    ("non-record entries ignored", "room.json", [ROOM, "junk"], [ROOM, None], []),
+]
+
+
+@pytest.mark.parametrize("table, old, new, expected", [case[1:] for case in CASES], ids=[case[0] for case in CASES])
+def test_diff_records(table, old, new, expected):
+    id_field = DBWatcher.TABLES[table][1]
+    assert diff_records(table, old, new, id_field) == expected
+
+
+def test_diff_records_copies_event_data():
+    new = [changed(ROOM, Status="Booked")]
+    [(_, _, data)] = diff_records("room.json", [ROOM], new, "roomId")
+    data["Status"] = "Cleaning"
+    assert new[0]["Status"] == "Booked"
+
+
+class _FakeDB:
+    def __init__(self):
+        self.events = event_bus.EventBus()
+
+
+@pytest.mark.parametrize("table, old, new, expected", [
+    ("booking.json", [BOOKING], [], [(event_bus.TABLE_CHANGED, "db/booking.json", {})]),
+    ("admin.json", [], [ADMIN], [(event_bus.TABLE_CHANGED, "db/admin.json", {})]),
+    ("room.json", None, [ROOM], [(event_bus.TABLE_CHANGED, "db/room.json", {})]),
+    ("other.json", [], [], [(event_bus.TABLE_CHANGED, "db/other.json", {})]),
+    ("room.json", [ROOM], [], [(event_bus.ROOM_DELETED, 1, {})]),
+], ids=["booking deleted", "admin created", "not a list", "unknown table", "record event"])
+def test_publish_changes(table, old, new, expected):
+    db = _FakeDB()
+    received = []
+    db.events.subscribe(lambda events: received.extend((e.type, e.key, e.data) for e in events))
+    DBWatcher(db).publish_changes(f"db/{table}", old, new)
+    assert received == expected
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from tools import export_bookings
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    bookings = [
+        {"bookingID": 1, "roomId": 101, "checkInDate": "2025-12-30", "status": "Confirmed", "totalAmount": 100},
+        {"bookingID": 2, "roomId": 102, "checkInDate": "2026-01-02", "status": "Confirmed", "totalAmount": 200,
+         "internalNote": "not exported"},
+    ]
+    with open(tmp_path / "booking.json", "w", encoding="utf-8") as f:
+        json.dump(bookings, f)
+    return str(tmp_path)
+
+
+def test_export_date_range(data_folder, capsys):
+    assert export_bookings.main(["csv", "--data-folder", data_folder, "--start", "2026-01-01"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("bookingID,")
+    assert [line.split(",")[0] for line in lines[1:]] == ["2"]
+    # Only the known columns are written
+    assert lines[0] == ",".join(export_bookings.COLUMNS)
+    assert "not exported" not in lines[1]
+
+
+@pytest.mark.parametrize("option", ["--start", "--end"])
+@pytest.mark.parametrize("value", ["2025-13-01", "2025-1-1x", "tomorrow"])
+def test_invalid_dates_are_rejected(data_folder, capsys, option, value):
+    with pytest.raises(SystemExit) as exit_info:
+        export_bookings.main(["csv", "--data-folder", data_folder, option, value])
+    assert exit_info.value.code == 2
+    assert f"argument {option}" in capsys.readouterr().err
@@ -0,0 +1,142 @@
+import io
+import json
+
+import pytest
+
+from modules import json_codec
+from modules.json_codec import BACKENDS, COMPACT, PRETTY, JsonCodec, available_backends, iter_array
+
+TABLE = [
+    {"bookingID": 1, "guestName": "Nguyễn Văn An", "totalAmount": 1500000, "status": "Confirmed"},
+    {"bookingID": 2, "guestName": "日本 😀", "totalAmount": 12.5, "paid": True, "note": None},
+    {"bookingID": 3, "tags": ["a", "b\"c", "\\", "\n"], "nested": {"x": [1, -2, 3e-05, {}], "y": []}},
+]
+
+BACKEND_PARAMS = [
+    pytest.param(name, marks=pytest.mark.skipif(name not in available_backends(), reason=f"{name} not installed"))
+    for name in BACKENDS
+]
+
+
+# ----------------------- dumps / loads --------------------------------------
+@pytest.mark.parametrize("reader", BACKEND_PARAMS)
+@pytest.mark.parametrize("writer", BACKEND_PARAMS)
+@pytest.mark.parametrize("storage_format", [COMPACT, PRETTY])
+def test_round_trip_across_backends(writer, reader, storage_format):
+    raw = JsonCodec(writer, storage_format).dumps(TABLE)
+    assert JsonCodec(reader).loads(raw) == TABLE
+
+
+@pytest.mark.parametrize("backend", BACKEND_PARAMS)
+def test_non_ascii_is_stored_as_utf8(backend):
+    for storage_format in (COMPACT, PRETTY):
+        raw = JsonCodec(backend, storage_format).dumps(TABLE)
+        assert "Nguyễn Văn An".encode("utf-8") in raw
+        assert b"\\u" not in raw
+
+
+@pytest.mark.parametrize("backend", BACKEND_PARAMS)
+def test_layouts(backend):
+    compact = JsonCodec(backend, COMPACT).dumps(TABLE)
+    assert b"\n" not in compact and b": " not in compact
+    # Same layout as the files shipped in db/
+    assert JsonCodec(backend, PRETTY).dumps(TABLE) == json.dumps(TABLE, indent=4, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", BACKEND_PARAMS)
+def test_loads_rejects_invalid_json(backend):
+    with pytest.raises(ValueError):
+        JsonCodec(backend).loads(b'[{"bookingID": 1,]')
+
+
+def test_defaults_to_pretty(monkeypatch):
+    monkeypatch.delenv("ANHOTEL_JSON_FORMAT", raising=False)
+    assert JsonCodec().storage_format == PRETTY
+    monkeypatch.setenv("ANHOTEL_JSON_FORMAT", COMPACT)
+    assert JsonCodec().storage_format == COMPACT
+
+
+def test_unknown_backend_or_format():
+    with pytest.raises(ValueError):
+        JsonCodec("yaml")
+    with pytest.raises(ValueError):
+        JsonCodec(storage_format="tabs")
+
+
+# ----------------------- iter_array -----------------------------------------
+DOCUMENTS = {
+    "compact": json.dumps(TABLE, ensure_ascii=False, separators=(",", ":")),
+    "pretty": json.dumps(TABLE, ensure_ascii=False, indent=4),
+    "escaped": json.dumps(TABLE),
+    "empty": "[]",
+    "empty with whitespace": " \r\n[ \t\n ]\n",
+    "numbers": "[1,22,333,-4444,5.5,66.25e3,-7E-2,0]",
+    "spaced numbers": "[ 12 , 3.5\n,\t-8 ]",
+    "literals": "[true,false,null,true]",
+    "strings": '["", "a,b]", "\\"]", "\\u00e9\\ud83d\\ude00", "é😀"]',
+    "nested": '[[1, [2, [3]]], {"a": {"b": [true, {"c": null}]}}]',
+    "multibyte": '["' + "日本語テキスト😀é" * 20 + '"]',
+}
+
+CHUNK_SIZES = [1, 2, 3, 7, 64, json_codec.STREAM_CHUNK_SIZE]
+
+MALFORMED = {
+    "empty file": "",
+    "whitespace only": "  \n",
+    "object": '{"a": 1}',
+    "unterminated": "[1, 2",
+    "unterminated item": '[{"a": 1',
+    "unterminated string": '["abc',
+    "missing comma": "[1 2]",
+    "leading comma": "[,1]",
+    "trailing comma": "[1,]",
+    "double comma": "[1,,2]",
+    "bad literal": "[tru]",
+    "bad number": "[1.]",
+    "bad delimiter": "[1;2]",
+    "mismatched bracket": '[{"a": 1]',
+}
+
+
+@pytest.fixture
+def fallback_parser(monkeypatch):
+    """Use the built-in parser even when ijson is installed"""
+    monkeypatch.setattr(json_codec, "ijson", None)
+
+
+def parse(text, chunk_size):
+    return list(iter_array(io.BytesIO(text.encode("utf-8")), chunk_size))
+
+
+@pytest.mark.usefixtures("fallback_parser")
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_iter_array(name, chunk_size):
+    text = DOCUMENTS[name]
+    assert parse(text, chunk_size) == json.loads(text)
+
+
+@pytest.mark.usefixtures("fallback_parser")
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", MALFORMED)
+def test_iter_array_rejects_malformed_input(name, chunk_size):
+    with pytest.raises(ValueError):
+        parse(MALFORMED[name], chunk_size)
+
+
+@pytest.mark.usefixtures("fallback_parser")
+def test_iter_array_yields_items_before_reading_the_rest():
+    f = io.BytesIO(b'[{"a": 1}, {"b": 2}, ' + b" " * 1000 + b"3]")
+    items = iter_array(f, chunk_size=16)
+    assert next(items) == {"a": 1}
+    assert f.tell() < 100
+    assert list(items) == [{"b": 2}, 3]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, json_codec.STREAM_CHUNK_SIZE])
+@pytest.mark.parametrize("name", ["compact", "pretty", "strings", "nested"])
+def test_iter_array_with_ijson(name, chunk_size):
+    if json_codec.ijson is None:
+        pytest.skip("ijson not installed")
+    text = DOCUMENTS[name]
+    assert parse(text, chunk_size) == json.loads(text)
@@ -0,0 +1,196 @@
+import json
+import os
+import struct
+
+import pytest
+
+from modules import snapshot
+from modules.db_manager import DBManager
+from modules.snapshot import MAGIC, VERSION, Snapshot, key_hash, write_snapshot
+
+RECORDS = [
+    {"id": 1, "email": "An@Example.com", "name": "Nguyễn An", "score": 9.5, "vip": True, "note": None},
+    {"id": 2, "email": "binh@example.com", "name": "Bình", "tags": ["a", "b"], "extra": {"k": [1, 2]}},
+    {"id": 3, "email": "an@example.com", "name": "An", "vip": False, "big": 2 ** 70},
+    {"id": 4, "name": "Nguyễn An", "score": -1.0},
+    {"id": 5, "email": "BINH@example.com", "name": "", "code": "1"},
+]
+INDEXES = (("id", False), ("email", False), ("email", True), ("name", False), ("code", False))
+
+
+@pytest.fixture
+def snap(tmp_path):
+    path = str(tmp_path / "table.snap")
+    write_snapshot(path, RECORDS, INDEXES, source_stamp=(123456789, 4096))
+    snapshot_file = Snapshot(path)
+    yield snapshot_file
+    snapshot_file.close()
+
+
+def expected(field, value, lower=False):
+    def normalize(v):
+        return v.lower() if lower and isinstance(v, str) else v
+    return [r for r in RECORDS if field in r and normalize(r[field]) == normalize(value)
+            and type(r[field]) is type(value)]
+
+
+def test_round_trip(snap):
+    assert len(snap) == len(RECORDS)
+    assert list(snap) == RECORDS
+    assert snap.source_stamp == (123456789, 4096)
+    assert snap.fields == ["id", "email", "name", "score", "vip", "note", "tags", "extra", "big", "code"]
+    assert snap.value(3, "score") == -1.0
+    with pytest.raises(KeyError):
+        snap.value(3, "email")
+    with pytest.raises(IndexError):
+        snap.record(len(RECORDS))
+
+
+def test_layout(snap):
+    with open(snap.path, "rb") as f:
+        raw = f.read()
+    (magic, version, records, fields, mtime_ns, size, fields_offset, records_offset,
+     heap_offset, directory_offset, indexes) = snapshot._HEADER.unpack_from(raw, 0)
+    assert (magic, version, records, fields, indexes) == (MAGIC, VERSION, len(RECORDS), len(snap.fields), len(INDEXES))
+    assert (mtime_ns, size) == (123456789, 4096)
+    assert fields_offset == snapshot._HEADER.size
+    assert heap_offset - records_offset == len(RECORDS) * len(snap.fields) * snapshot._SLOT.size
+    # Each string is stored once in the heap
+    heap = raw[heap_offset:]
+    assert heap.count("Nguyễn An".encode("utf-8")) == 1
+    assert directory_offset < len(raw)
+    assert set(snap.indexes) == set(INDEXES)
+    for (field, lower), keys in snap.indexes.items():
+        hashes = [keys[i] for i in range(len(keys))]
+        assert hashes == sorted(hashes)
+        assert len(hashes) == sum(1 for r in RECORDS if field in r)
+
+
+@pytest.mark.parametrize("field, lower", INDEXES)
+def test_find_by_every_indexed_field(snap, field, lower):
+    for record in RECORDS:
+        if field not in record:
+            continue
+        value = record[field]
+        assert snap.find(field, value, lower) == expected(field, value, lower)
+        if isinstance(value, str):
+            assert snap.find(field, value.upper(), lower) == expected(field, value.upper(), lower)
+    assert snap.find(field, "no such value", lower) == []
+
+
+def test_find_ignoring_case(snap):
+    assert [r["id"] for r in snap.find("email", "AN@EXAMPLE.COM", lower=True)] == [1, 3]
+    assert [r["id"] for r in snap.find("email", "binh@EXAMPLE.com", lower=True)] == [2, 5]
+    assert snap.find("email", "AN@EXAMPLE.COM") == []
+    assert [r["id"] for r in snap.find("email", "an@example.com")] == [3]
+
+
+def test_find_unindexed_field(snap):
+    with pytest.raises(KeyError):
+        snap.find("score", 9.5)
+    assert not snap.has_index("name", lower=True)
+
+
+MIXED = [
+    {"key": 1}, {"key": "1"}, {"key": True}, {"key": 1.0}, {"key": 0}, {"key": False},
+    {"key": None}, {"key": "null"}, {"key": "true"}, {"key": 2 ** 63}, {"key": str(2 ** 63)},
+]
+
+
+@pytest.mark.parametrize("colliding", [False, True], ids=["real hash", "every key collides"])
+def test_find_matches_type_exactly(tmp_path, monkeypatch, colliding):
+    if colliding:
+        monkeypatch.setattr(snapshot, "key_hash", lambda value, lower=False: 42)
+    path = str(tmp_path / "mixed.snap")
+    write_snapshot(path, MIXED, [("key", False)])
+    mixed = Snapshot(path)
+    try:
+        for record in MIXED:
+            assert mixed.find("key", record["key"]) == [record], record
+    finally:
+        mixed.close()
+
+
+def test_key_hash():
+    assert key_hash(7) == 7
+    assert key_hash(-1) == 2 ** 64 - 1
+    assert key_hash("AbC", lower=True) == key_hash("abc")
+    assert key_hash("AbC") != key_hash("abc")
+    assert key_hash(True) != key_hash(1)
+    assert key_hash(1.0) != key_hash(1)
+    assert key_hash(True) == key_hash("true")  # told apart by find()
+
+
+@pytest.mark.parametrize("content", [b"", b"ANHSNAP1", b"NOTASNAP" + b"\0" * 200])
+def test_rejects_other_files(tmp_path, content):
+    path = tmp_path / "bad.snap"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        Snapshot(str(path))
+
+
+def test_rejects_other_versions(tmp_path):
+    path = str(tmp_path / "old.snap")
+    write_snapshot(path, RECORDS, INDEXES)
+    with open(path, "r+b") as f:
+        f.seek(len(MAGIC))
+        f.write(struct.pack("<I", VERSION + 1))
+    with pytest.raises(ValueError):
+        Snapshot(path)
+
+
+# ----------------------- DBManager ------------------------------------------
+CUSTOMERS = [
+    {"customerID": i, "name": f"Customer {i}", "email": f"Customer{i}@Example.com"}
+    for i in range(1, 6)
+]
+
+
+@pytest.fixture
+def db_folder(tmp_path):
+    with open(tmp_path / "customer.json", "w", encoding="utf-8") as f:
+        json.dump(CUSTOMERS, f, indent=4)
+    db = DBManager(str(tmp_path))
+    assert db.refresh_snapshots(min_bytes=0) == [db.customer_file]
+    return str(tmp_path)
+
+
+def test_lookups_use_the_snapshot(db_folder):
+    db = DBManager(db_folder)
+    assert db.get_snapshot(db.customer_file) is not None
+    assert db._snapshot_lookup(db.customer_file, "customerID", 3) == [CUSTOMERS[2]]
+    assert db.get_customer_by_id(3) == CUSTOMERS[2]
+    assert db.find_customer_by_email("customer4@example.COM") == CUSTOMERS[3]
+    # Answered without parsing the table
+    assert db.customer_file not in db._tables
+
+
+def test_snapshot_ignored_once_the_table_changes(db_folder):
+    db = DBManager(db_folder)
+    assert db.get_snapshot(db.customer_file) is not None
+    changed = [dict(c, name="Renamed") if c["customerID"] == 3 else c for c in CUSTOMERS]
+    with open(db.customer_file, "w", encoding="utf-8") as f:
+        json.dump(changed, f, indent=4)
+    stat = os.stat(db.customer_file)
+    os.utime(db.customer_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert db.get_snapshot(db.customer_file) is None
+    assert db._snapshot_lookup(db.customer_file, "customerID", 3) is None
+    assert db.get_customer_by_id(3)["name"] == "Renamed"
+    # Rebuilt for the new stamp
+    assert db.refresh_snapshots(min_bytes=0) == [db.customer_file]
+    assert DBManager(db_folder)._snapshot_lookup(db.customer_file, "customerID", 3)[0]["name"] == "Renamed"
+
+
+def test_snapshot_with_a_stale_stamp_is_rejected(db_folder):
+    db = DBManager(db_folder)
+    stamp = db._file_stamp(db.customer_file)
+    write_snapshot(db._snapshot_path(db.customer_file), CUSTOMERS,
+                   DBManager.SNAPSHOT_INDEXES["customer.json"], (stamp[0] - 1, stamp[1]))
+    assert db.get_snapshot(db.customer_file) is None
+    assert db.get_customer_by_id(3) == CUSTOMERS[2]
+
+
+def test_snapshots_can_be_disabled(db_folder):
+    db = DBManager(db_folder)
+    db.use_snapshots = False
+    assert db._snapshot_lookup(db.customer_file, "customerID", 3) is None
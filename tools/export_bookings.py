@@ -0,0 +1,69 @@
+import argparse
+import csv
+import sys
+from datetime import date
+
+from modules.booking_service import BookingService
+from modules.db_manager import DBManager
+
+# CSV columns, in order; other booking fields are not exported
+COLUMNS = ["bookingID", "customerID", "roomId", "checkInDate", "checkOutDate", "numGuests",
+           "totalAmount", "status", "guestName", "guestPhone", "guestEmail", "guestNationalID"]
+
+
+def export_csv(db, out, statuses=None, room_id=None, start=None, end=None):
+    """
+    Write the matching bookings as CSV, one row at a time
+
+    Only the COLUMNS fields are written (the header has to be known before
+    the first row is streamed); missing fields are left empty.
+
+    Args:
+        db: DBManager to read from
+        out: Text file to write to
+        statuses, room_id, start, end: Filters (see DBManager.iter_bookings)
+
+    Returns:
+        Number of rows written
+    """
+    writer = csv.DictWriter(out, fieldnames=COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    rows = 0
+    for booking in db.iter_bookings(statuses=statuses, room_id=room_id, start=start, end=end):
+        writer.writerow(booking)
+        rows += 1
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export booking history as CSV, or print revenue per month, streaming booking.json"
+    )
+    parser.add_argument("command", choices=("csv", "revenue"))
+    parser.add_argument("--data-folder", default="db")
+    parser.add_argument("--status", action="append", help="Only this status (repeatable)")
+    parser.add_argument("--room", type=int, help="Only this roomId")
+    parser.add_argument("--start", type=date.fromisoformat, help="First check-in date included (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Check-in date excluded (YYYY-MM-DD)")
+    parser.add_argument("--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    db = DBManager(args.data_folder)
+    if args.command == "revenue":
+        service = BookingService(db)
+        statuses = args.status or ("Confirmed", "In stay", "In Stay", "Completed")
+        for month, (count, total) in service.get_revenue_by_month(args.start, args.end, statuses).items():
+            print(f"{month}  {count:8d} bookings  {total:16,.0f}")
+        return 0
+
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            rows = export_csv(db, out, args.status, args.room, args.start, args.end)
+        print(f"Exported {rows} bookings to {args.output}", file=sys.stderr)
+    else:
+        export_csv(db, sys.stdout, args.status, args.room, args.start, args.end)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
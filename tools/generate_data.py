@@ -0,0 +1,246 @@
+import argparse
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+import bcrypt
+
+from modules.db_manager import DBManager
+
+# Password of every generated customer and admin (for logins in load tests)
+DEFAULT_PASSWORD = "password123"
+
+# typeName, description, price per night, share of the rooms
+ROOM_TYPES = [
+    ("Standard", "A standard room with basic amenities.", 1000000, 0.45),
+    ("Deluxe", "A deluxe room with additional space and amenities.", 2000000, 0.30),
+    ("Family", "A large room for families, with two double beds.", 2500000, 0.12),
+    ("Suite", "A luxurious suite with premium features.", 3000000, 0.10),
+    ("Presidential", "The top floor suite with a private lounge.", 8000000, 0.03),
+]
+
+FIRST_NAMES = ["An", "Binh", "Chi", "Dung", "Giang", "Ha", "Hai", "Hoa", "Hung", "Khanh",
+               "Lan", "Linh", "Long", "Mai", "Minh", "Nam", "Ngoc", "Phong", "Quang", "Thao",
+               "Thinh", "Trang", "Tuan", "Van", "Viet", "Yen", "John", "Alice", "Emma", "David"]
+LAST_NAMES = ["Nguyen", "Tran", "Le", "Pham", "Hoang", "Phan", "Vu", "Vo", "Dang", "Bui",
+              "Do", "Ho", "Ngo", "Duong", "Ly", "Smith", "Johnson", "Brown"]
+
+# Relative demand per month (January..December): Tet, summer holidays, year end
+SEASONALITY = [1.3, 1.2, 0.8, 0.8, 0.9, 1.2, 1.4, 1.4, 0.8, 0.7, 0.8, 1.2]
+
+# Stay length in nights -> weight
+STAY_LENGTHS = [(1, 0.22), (2, 0.28), (3, 0.2), (4, 0.12), (5, 0.08), (7, 0.07), (10, 0.03)]
+
+# Mean number of empty nights between two stays in a room at average demand
+MEAN_GAP_NIGHTS = 1.5
+
+# Days of future bookings after today
+BOOKING_HORIZON_DAYS = 90
+
+
+def password_hash(password=DEFAULT_PASSWORD):
+    """Hash shared by all generated accounts (low cost so logins stay fast)"""
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+
+def generate_room_types():
+    return [
+        {
+            "typeID": i,
+            "typeName": name,
+            "description": description,
+            "price": price,
+            "imagePath": f"assets/images/room_type_{i}.jpg"
+        }
+        for i, (name, description, price, _) in enumerate(ROOM_TYPES, start=1)
+    ]
+
+
+def generate_rooms(count, rng, maintenance_ratio=0.01):
+    """Rooms numbered by floor (101, 102, ... 40 per floor) with weighted room types"""
+    type_ids = list(range(1, len(ROOM_TYPES) + 1))
+    weights = [share for _, _, _, share in ROOM_TYPES]
+    rooms = []
+    for i in range(count):
+        floor, number = divmod(i, 40)
+        rooms.append({
+            "roomId": i + 1,
+            "roomNumber": str((floor + 1) * 100 + number + 1),
+            "typeID": rng.choices(type_ids, weights)[0],
+            "Status": "Maintenance" if rng.random() < maintenance_ratio else "Available"
+        })
+    return rooms
+
+
+def generate_customers(count, rng, hashed_password):
+    customers = []
+    for i in range(1, count + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        customers.append({
+            "customerID": i,
+            "name": f"{last} {first}",
+            "email": f"{first.lower()}.{last.lower()}{i}@example.com",
+            "phone": "0" + str(rng.randrange(300000000, 999999999)),
+            "passwordHash": hashed_password,
+            "role": "customer"
+        })
+    return customers
+
+
+def generate_admins(hashed_password):
+    return [{"adminID": 1, "email": "admin@example.com", "passwordHash": hashed_password, "role": "admin"}]
+
+
+def _stay_length(rng):
+    return rng.choices([n for n, _ in STAY_LENGTHS], [w for _, w in STAY_LENGTHS])[0]
+
+
+def _gap(rng, day):
+    # Busier months leave shorter gaps between stays
+    mean = MEAN_GAP_NIGHTS / SEASONALITY[day.month - 1]
+    return int(rng.expovariate(1 / mean))
+
+
+def _booking_status(check_in, check_out, today, rng, cancel_ratio, confirm_ratio):
+    if rng.random() < cancel_ratio:
+        return "Canceled"
+    if check_out <= today:
+        return "Completed"
+    if check_in <= today:
+        return "In stay"
+    return "Confirmed" if rng.random() < confirm_ratio else "Pending"
+
+
+def generate_bookings(count, rooms, room_types, customers, rng, today=None, end=None,
+                      cancel_ratio=0.12, confirm_ratio=0.6):
+    """
+    Generate bookings that never overlap within a room
+
+    Each room gets an equal share of `count`, laid out back to back (with
+    seasonal gaps between stays) going backwards from `end`, so every room
+    has past, current and future stays whatever the scale. Statuses follow
+    the dates relative to `today` (past stays are Completed, current ones
+    In stay, future ones Pending/Confirmed), except `cancel_ratio` of them
+    which are Canceled. Booking IDs follow booking order (a few days to
+    months before check-in).
+
+    Args:
+        count: Number of bookings
+        rooms: Generated rooms
+        room_types: Generated room types (for prices)
+        customers: Generated customers (booking owners and guests)
+        rng: random.Random
+        today: Date the statuses are relative to (defaults to today)
+        end: Last check-out date (defaults to 90 days after today)
+        cancel_ratio: Share of Canceled bookings
+        confirm_ratio: Share of future bookings already Confirmed
+
+    Returns:
+        List of bookings ordered by bookingID
+    """
+    today = today or date.today()
+    if not rooms or not count:
+        return []
+    prices = {rt["typeID"]: rt["price"] for rt in room_types}
+    per_room, extra = divmod(count, len(rooms))
+    end = end or today + timedelta(days=BOOKING_HORIZON_DAYS)
+
+    pending = []  # (booked at, booking)
+    for index, room in enumerate(rooms):
+        quota = per_room + (1 if index < extra else 0)
+        day = end - timedelta(days=rng.randrange(0, 3))
+        for _ in range(quota):
+            nights = _stay_length(rng)
+            check_in, check_out = day - timedelta(days=nights), day
+            customer = rng.choice(customers) if customers else {}
+            booked_at = check_in - timedelta(days=int(rng.expovariate(1 / 30)))
+            pending.append((booked_at, {
+                "bookingID": None,
+                "customerID": customer.get("customerID"),
+                "roomId": room["roomId"],
+                "checkInDate": datetime.combine(check_in, datetime.min.time()).isoformat(),
+                "checkOutDate": datetime.combine(check_out, datetime.min.time()).isoformat(),
+                "numGuests": rng.randint(1, 4),
+                "totalAmount": prices.get(room["typeID"], 0) * nights,
+                "status": _booking_status(check_in, check_out, today, rng, cancel_ratio, confirm_ratio),
+                "guestName": customer.get("name", ""),
+                "guestPhone": customer.get("phone", ""),
+                "guestEmail": customer.get("email", ""),
+                "guestNationalID": ""
+            }))
+            day = check_in - timedelta(days=_gap(rng, check_in))
+
+    pending.sort(key=lambda item: (item[0], item[1]["roomId"]))
+    bookings = []
+    for booking_id, (_, booking) in enumerate(pending, start=1):
+        booking["bookingID"] = booking_id
+        bookings.append(booking)
+    return bookings
+
+
+def generate_dataset(data_folder, rooms=1000, customers=100000, bookings=1000000, seed=0,
+                     cancel_ratio=0.12, today=None, password=DEFAULT_PASSWORD):
+    """
+    Write a synthetic roomType/room/customer/booking/admin dataset
+
+    Args:
+        data_folder: Folder to write the JSON files to (created if missing)
+        rooms: Number of rooms
+        customers: Number of customers
+        bookings: Number of bookings
+        seed: Random seed (the same arguments always produce the same files)
+        cancel_ratio: Share of Canceled bookings
+        today: Date the booking statuses are relative to
+        password: Password of every customer and of admin@example.com
+
+    Returns:
+        {table: record count}
+    """
+    rng = random.Random(seed)
+    hashed = password_hash(password)
+    room_types = generate_room_types()
+    room_list = generate_rooms(rooms, rng)
+    customer_list = generate_customers(customers, rng, hashed)
+    booking_list = generate_bookings(bookings, room_list, room_types, customer_list, rng,
+                                     today=today, cancel_ratio=cancel_ratio)
+
+    os.makedirs(data_folder, exist_ok=True)
+    db = DBManager(data_folder)
+    db.save_json(db.room_type_file, room_types)
+    db.save_json(db.room_file, room_list)
+    db.save_json(db.customer_file, customer_list)
+    db.save_json(db.booking_file, booking_list)
+    db.save_json(db.admin_file, generate_admins(hashed))
+    return {
+        "roomType": len(room_types),
+        "room": len(room_list),
+        "customer": len(customer_list),
+        "booking": len(booking_list),
+        "admin": 1
+    }
+
+
+def main(argv=None):
+    """CLI: python -m tools.generate_data OUT_FOLDER [--rooms N] [--customers N] [--bookings N]"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic hotel database")
+    parser.add_argument("folder", help="Output folder (never point this at db/)")
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--customers", type=int, default=100000)
+    parser.add_argument("--bookings", type=int, default=1000000)
+    parser.add_argument("--cancel-ratio", type=float, default=0.12)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--today", type=date.fromisoformat, default=None,
+                        help="Date booking statuses are relative to (YYYY-MM-DD)")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    counts = generate_dataset(args.folder, args.rooms, args.customers, args.bookings, args.seed,
+                              args.cancel_ratio, args.today)
+    for table, count in counts.items():
+        print(f"{count:10d}  {table}")
+    print(f"Written to {args.folder} (password for every account: {DEFAULT_PASSWORD})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
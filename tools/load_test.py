@@ -0,0 +1,278 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from modules.db_manager import DBManager
+from modules.auth_service import AuthService
+from modules.booking_service import BookingService
+from modules.search_service import SearchService
+from tools.generate_data import DEFAULT_PASSWORD
+
+# Operation -> weight
+DEFAULT_MIX = {"search": 60, "book": 15, "cancel": 5, "confirm": 10, "login": 10}
+
+# How far ahead searched and booked stays start
+BOOKING_HORIZON_DAYS = 90
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def parse_mix(text):
+    """Parse "search=60,book=20" into {"search": 60.0, "book": 20.0}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class LoadDriver:
+    """
+    Replays a weighted mix of customer and admin operations against the services
+
+    Operations:
+        search: SearchService.find_available_rooms + apply_filters for a random stay
+        book: availability check + BookingService.create_booking (under the DB lock)
+        cancel: customer cancel of a Pending booking
+        confirm: admin confirm of a Pending booking
+        login: AuthService.unified_login of a random customer
+
+    Pending bookings for cancel/confirm come from the data set and from the
+    driver's own bookings. Every call is timed; run() returns the latencies.
+    """
+
+    def __init__(self, db_manager, mix=None, seed=0, password=DEFAULT_PASSWORD, today=None):
+        """
+        Args:
+            db_manager: DBManager over the data set (it is modified)
+            mix: {operation: weight} (defaults to DEFAULT_MIX)
+            seed: Random seed
+            password: Password of the data set's customers (see tools.generate_data)
+            today: First day stays may start on
+        """
+        self.db = db_manager
+        self.mix = dict(mix or DEFAULT_MIX)
+        self.seed = seed
+        self.password = password
+        self.today = today or date.today()
+        self.auth_service = AuthService(self.db)
+        self.booking_service = BookingService(self.db)
+        self.search_service = SearchService(self.db)
+
+        self.room_ids = [r["roomId"] for r in self.db.get_all_rooms()]
+        self.room_types = self.db.get_all_room_types()
+        self.type_names = [rt["typeName"] for rt in self.room_types]
+        self.prices = {rt["typeID"]: rt.get("price", 0) for rt in self.room_types}
+        customers = self.db.get_all_customers()
+        self.customers = random.Random(seed).sample(customers, min(len(customers), 1000))
+        pending, _ = self.booking_service.get_bookings_page("Pending", page_size=5000)
+        self.pending = [(b["bookingID"], b.get("customerID")) for b in pending]
+        self._pending_lock = threading.Lock()
+
+    # ----------------------- Operations -------------------------------------
+    def _random_stay(self, rng):
+        check_in = self.today + timedelta(days=rng.randrange(BOOKING_HORIZON_DAYS))
+        return check_in, check_in + timedelta(days=rng.randint(1, 5))
+
+    def _take_pending(self, rng):
+        with self._pending_lock:
+            if not self.pending:
+                return None
+            index = rng.randrange(len(self.pending))
+            self.pending[index], self.pending[-1] = self.pending[-1], self.pending[index]
+            return self.pending.pop()
+
+    def op_search(self, rng):
+        check_in, check_out = self._random_stay(rng)
+        type_name = rng.choice(self.type_names + ["All Types"]) if self.type_names else None
+        rooms = self.search_service.find_available_rooms(check_in, check_out, type_name)
+        self.search_service.apply_filters(rooms, 0, rng.choice([1500000, 3000000, 999999999]))
+        return True
+
+    def op_book(self, rng):
+        if not self.room_ids:
+            return False
+        check_in, check_out = self._random_stay(rng)
+        room_id = rng.choice(self.room_ids)
+        customer = rng.choice(self.customers) if self.customers else {}
+        with self.db.lock:
+            if not self.db.is_room_available(room_id, check_in, check_out):
+                return False
+            room = self.db.get_room_by_id(room_id) or {}
+            total = self.booking_service.calculate_total_amount(
+                self.prices.get(room.get("typeID"), 0), check_in, check_out
+            )
+            booking = self.booking_service.create_booking(
+                room_id, check_in, check_out, 1, customer.get("name", "Guest"),
+                customer.get("phone", ""), customer.get("email", ""), "", total,
+                customer_id=customer.get("customerID")
+            )
+        with self._pending_lock:
+            self.pending.append((booking["bookingID"], booking["customerID"]))
+        return True
+
+    def op_cancel(self, rng):
+        item = self._take_pending(rng)
+        if item is None:
+            return False
+        with self.db.lock:
+            return self.booking_service.cancel_booking(*item)
+
+    def op_confirm(self, rng):
+        item = self._take_pending(rng)
+        if item is None:
+            return False
+        with self.db.lock:
+            return self.booking_service.confirm_booking(item[0])
+
+    def op_login(self, rng):
+        if not self.customers:
+            return False
+        return self.auth_service.unified_login(rng.choice(self.customers)["email"], self.password) is not None
+
+    # ----------------------- Running ----------------------------------------
+    def run(self, operations=1000, duration=None, threads=1):
+        """
+        Run the mix
+
+        Args:
+            operations: Total number of operations (ignored when duration is set)
+            duration: Seconds to run for
+            threads: Number of concurrent clients
+
+        Returns:
+            {"elapsed": seconds, "operations": {name: {"latencies": [ms], "ok": n, "rejected": n, "errors": n}}}
+        """
+        names = [name for name, weight in self.mix.items() if weight > 0]
+        weights = [self.mix[name] for name in names]
+        results = {name: {"latencies": [], "ok": 0, "rejected": 0, "errors": 0} for name in names}
+        results_lock = threading.Lock()
+        remaining = [operations]
+        deadline = time.perf_counter() + duration if duration else None
+
+        def claim():
+            if deadline is not None:
+                return time.perf_counter() < deadline
+            with results_lock:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+                return True
+
+        def worker(index):
+            rng = random.Random(self.seed * 1000 + index)
+            while claim():
+                name = rng.choices(names, weights)[0]
+                started = time.perf_counter()
+                try:
+                    outcome = "ok" if getattr(self, f"op_{name}")(rng) else "rejected"
+                except Exception as e:
+                    print(f"Warning: {name} failed: {e}")
+                    outcome = "errors"
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                with results_lock:
+                    results[name]["latencies"].append(elapsed_ms)
+                    results[name][outcome] += 1
+
+        started = time.perf_counter()
+        workers = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        return {"elapsed": time.perf_counter() - started, "operations": results}
+
+
+def summarize(run_result):
+    """
+    Turn run() output into throughput and latency percentiles
+
+    Returns:
+        {"elapsed_s", "throughput", "operations": {name: {"count", "ok", "rejected",
+        "errors", "throughput", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}}
+    """
+    elapsed = run_result["elapsed"] or 1e-9
+    operations = {}
+    total = 0
+    for name, result in run_result["operations"].items():
+        latencies = sorted(result["latencies"])
+        total += len(latencies)
+        operations[name] = {
+            "count": len(latencies),
+            "ok": result["ok"],
+            "rejected": result["rejected"],
+            "errors": result["errors"],
+            "throughput": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else 0.0,
+        }
+    return {"elapsed_s": elapsed, "throughput": total / elapsed, "operations": operations}
+
+
+def format_summary(summary):
+    lines = [f"{'operation':<10}{'count':>8}{'ok':>8}{'rej':>6}{'err':>6}{'ops/s':>10}"
+             f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+    for name, s in summary["operations"].items():
+        lines.append(f"{name:<10}{s['count']:>8}{s['ok']:>8}{s['rejected']:>6}{s['errors']:>6}"
+                     f"{s['throughput']:>10.1f}{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}"
+                     f"{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+    lines.append(f"total {summary['throughput']:.1f} ops/s over {summary['elapsed_s']:.2f} s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """CLI: python -m tools.load_test DATA_FOLDER [--operations N | --duration S] [--threads N] [--mix ...]"""
+    parser = argparse.ArgumentParser(description="Replay a booking workload and report latencies")
+    parser.add_argument("folder", help="Data folder (e.g. written by tools.generate_data)")
+    parser.add_argument("--operations", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds instead")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Weights, e.g. search=60,book=15,cancel=5,confirm=10,login=10")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--in-place", action="store_true",
+                        help="Modify the folder itself instead of a temporary copy")
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this file")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    folder = args.folder
+    temp_dir = None
+    if not args.in_place:
+        temp_dir = tempfile.mkdtemp(prefix="anhotel-load-")
+        folder = os.path.join(temp_dir, "db")
+        shutil.copytree(args.folder, folder)
+    try:
+        driver = LoadDriver(DBManager(folder), args.mix, args.seed, args.password)
+        summary = summarize(driver.run(args.operations, args.duration, args.threads))
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print(format_summary(summary))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,13 @@
 import customtkinter as ctk
 from customtkinter import FontManager
 import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from views.widgets.card_reconciler import CardReconciler
+from views.widgets.sidebar import Sidebar
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -46,7 +53,8 @@ class AccountView(ctk.CTkFrame):
 
         self.sidebar = None  # Initialize sidebar variable
         self.create_account_tabview()
-        self.create_sidebar()  # Create sidebar after main content
+        if not self.controller:
+            Sidebar.for_view(self)
     
     def _load_user_data(self):
         """Load user data from controller's current user"""
@@ -72,61 +80,6 @@ class AccountView(ctk.CTkFrame):
             "role": "customer"
         }
 
-    def create_sidebar(self):
-        """Left navigation sidebar (reused layout)."""
-        # Destroy existing sidebar if it exists
-        if self.sidebar:
-            self.sidebar.destroy()
-        
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0,
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-
-        # Get user name from controller
-        user_name = "User"
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                user_name = current_user.get("name", current_user.get("email", "User"))
-        
-        # Greeting label
-        greeting_label = ctk.CTkLabel(
-            self.sidebar,
-            text=f"Hi, {user_name}",
-            font=("SVN-Gilroy", 16, "bold"),
-            text_color="black",
-            anchor="w"
-        )
-        greeting_label.pack(fill="x", padx=10, pady=(20, 10))
-
-        nav_items = [
-            "Home",
-            "Room",
-            "My Bookings",
-            "Account Settings",
-            "Sign out",
-        ]
-
-        for item in nav_items:
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x),
-            )
-            btn.pack(fill="x", padx=10, pady=5)
-
     def create_account_tabview(self):
         """Main tabbed content (Account Info / Update / Password)."""
         self.content_frame = ctk.CTkFrame(self.main_container, fg_color="white")
@@ -145,6 +98,21 @@ class AccountView(ctk.CTkFrame):
         self.tab_update = self.tabview.add("Change Information")
         self.tab_password = self.tabview.add("Change Password")
 
+        # Info and update tabs are rebuilt only when the account data changed
+        account_key = lambda account: (account.get("role"), account.get("customerID"))
+        self.info_reconciler = CardReconciler(
+            self.tab_info,
+            create_card=self.create_account_info_card,
+            key=account_key,
+            pack_options={"fill": "both", "expand": True, "padx": 20, "pady": 20}
+        )
+        self.update_reconciler = CardReconciler(
+            self.tab_update,
+            create_card=self.create_update_info_card,
+            key=account_key,
+            pack_options={"fill": "both", "expand": True, "padx": 20, "pady": 20}
+        )
+
         self.build_account_info_tab()
         self.build_update_info_tab()
         self.build_change_password_tab()
@@ -152,9 +120,10 @@ class AccountView(ctk.CTkFrame):
     def build_account_info_tab(self):
         # Reload user data to ensure it's up to date
         self.account_data = self._load_user_data()
-        
-        info_container = ctk.CTkFrame(self.tab_info, fg_color="white", corner_radius=50)
-        info_container.pack(fill="both", expand=True, padx=20, pady=20)
+        self.info_reconciler.reconcile([self.account_data])
+
+    def create_account_info_card(self, parent, account_data):
+        info_container = ctk.CTkFrame(parent, fg_color="white", corner_radius=50)
 
         info_frame = ctk.CTkFrame(
             info_container,
@@ -174,9 +143,9 @@ class AccountView(ctk.CTkFrame):
         header.pack(anchor="w", padx=20, pady=(20, 10))
 
         # Get actual values from account_data
-        full_name = self.account_data.get("full_name", "") or "Not updated"
-        phone = self.account_data.get("phone", "") or "Not updated"
-        email = self.account_data.get("email", "") or "Not updated"
+        full_name = account_data.get("full_name", "") or "Not updated"
+        phone = account_data.get("phone", "") or "Not updated"
+        email = account_data.get("email", "") or "Not updated"
 
         info_items = [
             ("Full Name", full_name),
@@ -205,13 +174,15 @@ class AccountView(ctk.CTkFrame):
                 anchor="e",
             )
             value.pack(side="right", anchor="e")
+        return info_container
 
     def build_update_info_tab(self):
         # Reload user data to ensure it's up to date
         self.account_data = self._load_user_data()
-        
-        form_container = ctk.CTkFrame(self.tab_update, fg_color="white", corner_radius=50)
-        form_container.pack(fill="both", expand=True, padx=20, pady=20)
+        self.update_reconciler.reconcile([self.account_data])
+
+    def create_update_info_card(self, parent, account_data):
+        form_container = ctk.CTkFrame(parent, fg_color="white", corner_radius=50)
 
         form_frame = ctk.CTkFrame(
             form_container,
@@ -264,7 +235,7 @@ class AccountView(ctk.CTkFrame):
             )
             entry.pack(fill="x", pady=(0, 10))
             # Pre-fill with current user data
-            current_value = self.account_data.get(key, "")
+            current_value = account_data.get(key, "")
             if current_value:
                 entry.insert(0, current_value)
             self.update_entries[key] = entry
@@ -280,6 +251,7 @@ class AccountView(ctk.CTkFrame):
             command=self.save_account_changes,
         )
         save_btn.pack(anchor="e", padx=20, pady=(10, 20))
+        return form_container
 
     def build_change_password_tab(self):
         pwd_container = ctk.CTkFrame(self.tab_password, fg_color="white", corner_radius=50)
@@ -434,11 +406,7 @@ class AccountView(ctk.CTkFrame):
     
     def _refresh_account_info_tab(self):
         """Refresh the account information tab with updated data"""
-        # Clear existing widgets in tab_info
-        for widget in self.tab_info.winfo_children():
-            widget.destroy()
-        
-        # Rebuild the tab
+        # Rebuilds the tab only if the data changed
         self.build_account_info_tab()
 
     def change_password(self):
@@ -506,44 +474,16 @@ class AccountView(ctk.CTkFrame):
         except Exception as e:
             self._show_message("Error", f"An error occurred: {str(e)}", "error")
 
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
-            return
-        
-        nav_map = {
-            "Home": "MainAppView",
-            "Room": "RoomView",
-            "My Bookings": "MyBookingsView",
-            "Account Settings": "AccountView",
-            "Sign out": None  # Special handling
-        }
-        
-        if item == "Sign out":
-            self.controller.logout()
-            return
-        
-        target = nav_map.get(item)
-        if target:
-            self.controller.show_frame(target)
-    
     def on_show(self):
         """Called when this view is shown - refresh sidebar and reload user data"""
         # Reload user data
         self.account_data = self._load_user_data()
         
         # Refresh sidebar
-        self.create_sidebar()
+        Sidebar.for_view(self)
         
-        # Refresh tabs to show updated data
-        # Clear and rebuild account info tab
-        for widget in self.tab_info.winfo_children():
-            widget.destroy()
+        # Refresh tabs to show updated data (unchanged tabs are kept as they are)
         self.build_account_info_tab()
-        
-        # Clear and rebuild update info tab
-        for widget in self.tab_update.winfo_children():
-            widget.destroy()
         self.build_update_info_tab()
 
 
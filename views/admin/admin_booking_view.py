@@ -9,8 +9,11 @@ import sys
 # Add parent directory to path to import modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from modules.booking_service import BookingService
+from modules.booking_service import BookingService, STATUS_MAP
 from modules.db_manager import DBManager
+from modules.event_bus import BOOKING_CREATED, BOOKING_STATUS_CHANGED, TABLE_CHANGED
+from modules.io_accounting import user_action
+from views.widgets.virtual_list import VirtualList
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -34,6 +37,22 @@ gilroy_bold_path = os.path.join(assets_font_dir, "SVN-Gilroy Bold.otf")
 if os.path.exists(gilroy_bold_path):
     FontManager.load_font(gilroy_bold_path)
 
+TAB_NAMES = ["Pending", "Confirmed", "In stay", "Completed", "Cancelled"]
+
+# Bookings fetched per page when a tab is loaded or scrolled to its end
+PAGE_SIZE = 50
+
+# Rows shown on every booking card, in display order
+BOOKING_SUMMARY_FIELDS = [
+    "Guest Name",
+    "Email",
+    "National ID",
+    "Check-in Date",
+    "Check-out Date",
+    "Status",
+    "Total Amount"
+]
+
 
 class AdminBookingView(ctk.CTkFrame):
     def __init__(self, parent, controller=None, *args, **kwargs):
@@ -64,6 +83,12 @@ class AdminBookingView(ctk.CTkFrame):
         
         # Right side - Main content
         self.create_main_content()
+
+        # Booking changes only reload the tabs they affect
+        self.db_manager.events.subscribe(
+            self.on_booking_events,
+            (BOOKING_CREATED, BOOKING_STATUS_CHANGED, TABLE_CHANGED)
+        )
     
     def create_sidebar(self):
         """Create left sidebar navigation"""
@@ -119,140 +144,140 @@ class AdminBookingView(ctk.CTkFrame):
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 20))
 
-        # TabView
+        # TabView (tabs are loaded when they are selected)
         self.tabview = ctk.CTkTabview(
             self.content_frame,
             fg_color="white",
             segmented_button_fg_color="#E5E5E5",
             segmented_button_selected_color="#3A7BFF",
-            segmented_button_unselected_color="#A9A9A9"
+            segmented_button_unselected_color="#A9A9A9",
+            command=self.on_tab_change
         )
         self.tabview.grid(row=1, column=0, sticky="nsew")
         self.content_frame.grid_rowconfigure(1, weight=1)
 
         # Create tabs
         self.tabs = {}
-        tab_names = ["Pending", "Confirmed", "In stay", "Completed", "Cancelled"]
+        tab_names = TAB_NAMES
+        self.dirty_tabs = set(tab_names)
+        self.cursors = {}
         
         for tab_name in tab_names:
             tab = self.tabview.add(tab_name)
             self.tabs[tab_name] = tab
             
-            # Create scrollable frame for cards
-            scrollable_frame = ctk.CTkScrollableFrame(tab, fg_color="#F5F5F5")
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            # Virtualized list: only the visible booking cards are built
+            booking_list = VirtualList(
+                tab,
+                create_card=lambda parent, t=tab_name: self.create_booking_card(parent, t),
+                bind_card=lambda card, booking, t=tab_name: self.bind_booking_card(card, booking, t),
+                item_height=300,
+                empty_text="No bookings",
+                on_end_reached=lambda t=tab_name: self.load_next_page(t)
+            )
+            booking_list.pack(fill="both", expand=True, padx=10, pady=10)
             
-            # Store reference to scrollable frame
-            setattr(self, f"scrollable_frame_{tab_name.replace(' ', '_')}", scrollable_frame)
+            # Store reference to the list
+            setattr(self, f"booking_list_{tab_name.replace(' ', '_')}", booking_list)
 
-        # Load initial data
-        self.load_bookings_data()
-        
-        # Auto-complete checkouts on load
-        self.booking_service.auto_complete_checkouts()
+        # Load the visible tab (due checkouts are completed by the App's CheckoutScheduler)
         self.load_bookings_data()
 
     def load_bookings_data(self):
-        """Load and display bookings in each tab"""
-        # Load bookings for each tab
-        for tab_name in ["Pending", "Confirmed", "In stay", "Completed", "Cancelled"]:
+        """Mark every tab as out of date and load the selected one"""
+        self.dirty_tabs = set(TAB_NAMES)
+        self.load_tab_bookings(self.tabview.get())
+
+    def on_tab_change(self):
+        """Load a tab the first time it is selected after a change"""
+        tab_name = self.tabview.get()
+        if tab_name in self.dirty_tabs:
             self.load_tab_bookings(tab_name)
 
-    def load_tab_bookings(self, tab_name):
-        """Load bookings for a specific tab"""
-        # Get scrollable frame for this tab
-        frame_attr = f"scrollable_frame_{tab_name.replace(' ', '_')}"
-        scrollable_frame = getattr(self, frame_attr, None)
-        
-        if not scrollable_frame:
+    def on_booking_events(self, events):
+        """Mark the tabs touched by booking changes and reload the selected one if shown"""
+        affected = set()
+        for event in events:
+            if event.type == TABLE_CHANGED:
+                if event.key == self.db_manager.booking_file:
+                    affected.update(TAB_NAMES)
+            elif event.type == BOOKING_CREATED:
+                affected.add(STATUS_MAP.get(event.data.get("status"), "Pending"))
+            else:
+                affected.add(STATUS_MAP.get(event.data.get("status")))
+                affected.add(STATUS_MAP.get(event.data.get("previous")))
+        affected.discard(None)
+        if not affected:
             return
+        self.dirty_tabs.update(affected)
 
-        # Clear existing widgets
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
+        if self.controller and not self.controller.is_frame_shown(self):
+            return
+        tab_name = self.tabview.get()
+        if tab_name in self.dirty_tabs:
+            self.load_tab_bookings(tab_name)
 
-        # Get bookings filtered by status
-        bookings = self.booking_service.get_bookings_by_status(tab_name)
+    def get_booking_list(self, tab_name):
+        """Return the VirtualList of a tab"""
+        return getattr(self, f"booking_list_{tab_name.replace(' ', '_')}", None)
 
-        if not bookings:
-            # Show empty message
-            empty_label = ctk.CTkLabel(
-                scrollable_frame,
-                text="No bookings",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            empty_label.pack(pady=50)
+    def load_tab_bookings(self, tab_name):
+        """Load the first page of bookings for a specific tab"""
+        booking_list = self.get_booking_list(tab_name)
+        if booking_list is None:
             return
 
-        # Create booking cards
-        for booking in bookings:
-            self.create_booking_card(scrollable_frame, booking, tab_name)
+        # Reload as many bookings as were already shown so the scroll position holds
+        page_size = max(PAGE_SIZE, len(booking_list.get_items()))
+        bookings, cursor = self.booking_service.get_bookings_page(tab_name, page_size=page_size)
+
+        # Visible cards are rebound, not rebuilt
+        booking_list.set_items(bookings)
+        self.cursors[tab_name] = cursor
+        self.dirty_tabs.discard(tab_name)
 
-    def create_booking_card(self, parent, booking, tab_name):
-        """Create a booking card widget styled like my_bookings_view"""
+    def load_next_page(self, tab_name):
+        """Append the next page when the list is scrolled to its end"""
+        cursor = self.cursors.get(tab_name)
+        if cursor is None or tab_name in self.dirty_tabs:
+            return
+        bookings, next_cursor = self.booking_service.get_bookings_page(tab_name, page_size=PAGE_SIZE, cursor=cursor)
+        self.cursors[tab_name] = next_cursor
+        self.get_booking_list(tab_name).append_items(bookings)
+
+    def format_date(self, date_str):
+        """Format date string to readable format"""
+        if not date_str:
+            return "N/A"
+        try:
+            # Handle ISO format with time
+            if "T" in date_str:
+                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                return dt.strftime("%d/%m/%Y")
+            # Handle date-only format
+            else:
+                dt = datetime.strptime(date_str, "%Y-%m-%d")
+                return dt.strftime("%d/%m/%Y")
+        except Exception:
+            return date_str
+
+    def create_booking_card(self, parent, tab_name):
+        """Create an empty booking card widget styled like my_bookings_view"""
         card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
 
         # Title - BookingID
-        title = ctk.CTkLabel(
+        card.title = ctk.CTkLabel(
             card,
-            text=f"Booking ID: {booking.get('bookingID', '')}",
+            text="",
             font=("SVN-Gilroy", 16, "bold"),
             text_color="black",
             anchor="w"
         )
-        title.pack(anchor="w", pady=(10, 5), padx=20)
-
-        # Get booking information
-        guest_name = booking.get("guestName", "")
-        guest_email = booking.get("guestEmail", "")
-        guest_national_id = booking.get("guestNationalID", "")
-        total_amount = booking.get("totalAmount", 0)
-        status = booking.get("status", "")
-        
-        # Format check-in and check-out dates
-        check_in_date_str = booking.get("checkInDate", "")
-        check_out_date_str = booking.get("checkOutDate", "")
-        
-        def format_date(date_str):
-            """Format date string to readable format"""
-            if not date_str:
-                return "N/A"
-            try:
-                # Handle ISO format with time
-                if "T" in date_str:
-                    dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    return dt.strftime("%d/%m/%Y")
-                # Handle date-only format
-                else:
-                    dt = datetime.strptime(date_str, "%Y-%m-%d")
-                    return dt.strftime("%d/%m/%Y")
-            except Exception:
-                return date_str
-        
-        check_in_formatted = format_date(check_in_date_str)
-        check_out_formatted = format_date(check_out_date_str)
-        
-        # Normalize status display
-        status_map = {
-            "Canceled": "Cancelled",
-            "In Stay": "In stay"
-        }
-        status_display = status_map.get(status, status)
+        card.title.pack(anchor="w", pady=(10, 5), padx=20)
 
         # Summary items - only show required fields
-        summary_items = [
-            ("Guest Name", guest_name),
-            ("Email", guest_email),
-            ("National ID", guest_national_id),
-            ("Check-in Date", check_in_formatted),
-            ("Check-out Date", check_out_formatted),
-            ("Status", status_display),
-            ("Total Amount", f"{total_amount:,} VND")
-        ]
-
-        for label_text, value_text in summary_items:
+        card.values = {}
+        for label_text in BOOKING_SUMMARY_FIELDS:
             item_frame = ctk.CTkFrame(card, fg_color="white")
             item_frame.pack(fill="x", pady=2, padx=20)
             label = ctk.CTkLabel(
@@ -265,21 +290,22 @@ class AdminBookingView(ctk.CTkFrame):
             label.pack(side="left", anchor="w")
             value = ctk.CTkLabel(
                 item_frame,
-                text=value_text,
+                text="",
                 font=("SVN-Gilroy", 13) if label_text == "Total Amount" else ("SVN-Gilroy", 12),
                 text_color="black" if label_text in ["Total Amount", "Status"] else "gray",
                 anchor="e"
             )
             value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20, 0))
+            card.values[label_text] = value
 
         # Action buttons based on tab - only create btn_frame if needed
-        booking_id = booking.get("bookingID")
+        card.buttons = {}
 
         if tab_name == "Pending":
             btn_frame = ctk.CTkFrame(card, fg_color="white")
             btn_frame.pack(fill="x", pady=(10, 15), padx=20)
             
-            confirm_btn = ctk.CTkButton(
+            card.buttons["confirm"] = ctk.CTkButton(
                 btn_frame,
                 text="Confirm",
                 font=("SVN-Gilroy", 14),
@@ -287,12 +313,11 @@ class AdminBookingView(ctk.CTkFrame):
                 text_color="white",
                 hover_color="#218838",
                 corner_radius=10,
-                width=100,
-                command=lambda bid=booking_id: self.confirm_booking(bid)
+                width=100
             )
-            confirm_btn.pack(side="left", padx=(0, 10))
+            card.buttons["confirm"].pack(side="left", padx=(0, 10))
 
-            cancel_btn = ctk.CTkButton(
+            card.buttons["cancel"] = ctk.CTkButton(
                 btn_frame,
                 text="Cancel",
                 font=("SVN-Gilroy", 14),
@@ -300,16 +325,15 @@ class AdminBookingView(ctk.CTkFrame):
                 text_color="white",
                 hover_color="#C82333",
                 corner_radius=10,
-                width=100,
-                command=lambda bid=booking_id: self.cancel_booking(bid)
+                width=100
             )
-            cancel_btn.pack(side="left")
+            card.buttons["cancel"].pack(side="left")
 
         elif tab_name == "Confirmed":
             btn_frame = ctk.CTkFrame(card, fg_color="white")
             btn_frame.pack(fill="x", pady=(10, 15), padx=20)
             
-            check_in_btn = ctk.CTkButton(
+            card.buttons["check_in"] = ctk.CTkButton(
                 btn_frame,
                 text="Confirm",
                 font=("SVN-Gilroy", 14),
@@ -317,12 +341,11 @@ class AdminBookingView(ctk.CTkFrame):
                 text_color="white",
                 hover_color="#218838",
                 corner_radius=10,
-                width=100,
-                command=lambda bid=booking_id: self.check_in_booking(bid)
+                width=100
             )
-            check_in_btn.pack(side="left", padx=(0, 10))
+            card.buttons["check_in"].pack(side="left", padx=(0, 10))
 
-            cancel_btn = ctk.CTkButton(
+            card.buttons["cancel"] = ctk.CTkButton(
                 btn_frame,
                 text="Cancel",
                 font=("SVN-Gilroy", 14),
@@ -330,10 +353,9 @@ class AdminBookingView(ctk.CTkFrame):
                 text_color="white",
                 hover_color="#C82333",
                 corner_radius=10,
-                width=100,
-                command=lambda bid=booking_id: self.cancel_booking(bid)
+                width=100
             )
-            cancel_btn.pack(side="left")
+            card.buttons["cancel"].pack(side="left")
 
         elif tab_name == "In stay":
             btn_frame = ctk.CTkFrame(card, fg_color="white")
@@ -348,7 +370,7 @@ class AdminBookingView(ctk.CTkFrame):
             )
             info_label.pack(anchor="w", pady=(0, 10))
             
-            cancel_btn = ctk.CTkButton(
+            card.buttons["cancel"] = ctk.CTkButton(
                 btn_frame,
                 text="Cancel",
                 font=("SVN-Gilroy", 14),
@@ -356,30 +378,63 @@ class AdminBookingView(ctk.CTkFrame):
                 text_color="white",
                 hover_color="#C82333",
                 corner_radius=10,
-                width=100,
-                command=lambda bid=booking_id: self.cancel_booking(bid)
+                width=100
             )
-            cancel_btn.pack(side="left")
+            card.buttons["cancel"].pack(side="left")
 
         # For Completed and Cancelled tabs, no buttons needed - no extra space
+        return card
+
+    def bind_booking_card(self, card, booking, tab_name):
+        """Show a booking in a (possibly recycled) booking card"""
+        card.title.configure(text=f"Booking ID: {booking.get('bookingID', '')}")
+
+        # Get booking information
+        total_amount = booking.get("totalAmount", 0)
+        status = booking.get("status", "")
+        
+        # Normalize status display
+        status_map = {
+            "Canceled": "Cancelled",
+            "In Stay": "In stay"
+        }
+
+        values = {
+            "Guest Name": booking.get("guestName", ""),
+            "Email": booking.get("guestEmail", ""),
+            "National ID": booking.get("guestNationalID", ""),
+            "Check-in Date": self.format_date(booking.get("checkInDate", "")),
+            "Check-out Date": self.format_date(booking.get("checkOutDate", "")),
+            "Status": status_map.get(status, status),
+            "Total Amount": f"{total_amount:,} VND"
+        }
+        for label_text, value in card.values.items():
+            value.configure(text=values[label_text])
+
+        # Point the action buttons at this booking
+        booking_id = booking.get("bookingID")
+        actions = {
+            "confirm": self.confirm_booking,
+            "check_in": self.check_in_booking,
+            "cancel": self.cancel_booking
+        }
+        for name, button in card.buttons.items():
+            button.configure(command=lambda bid=booking_id, action=actions[name]: action(bid))
 
     def confirm_booking(self, booking_id):
-        """Confirm a pending booking"""
-        success = self.booking_service.confirm_booking(booking_id)
-        if success:
-            self.load_bookings_data()
+        """Confirm a pending booking (the status change event reloads the affected tabs)"""
+        with user_action(f"admin confirm booking #{booking_id}"):
+            self.booking_service.confirm_booking(booking_id)
 
     def check_in_booking(self, booking_id):
-        """Check in a confirmed booking"""
-        success = self.booking_service.check_in_booking(booking_id)
-        if success:
-            self.load_bookings_data()
+        """Check in a confirmed booking (the status change event reloads the affected tabs)"""
+        with user_action(f"admin check in booking #{booking_id}"):
+            self.booking_service.check_in_booking(booking_id)
 
     def cancel_booking(self, booking_id):
-        """Cancel a booking"""
-        success = self.booking_service.cancel_booking_admin(booking_id)
-        if success:
-            self.load_bookings_data()
+        """Cancel a booking (the status change event reloads the affected tabs)"""
+        with user_action(f"admin cancel booking #{booking_id}"):
+            self.booking_service.cancel_booking_admin(booking_id)
     
     def on_nav_click(self, item):
         """Handle navigation item click"""
@@ -402,8 +457,5 @@ class AdminBookingView(ctk.CTkFrame):
             self.controller.show_frame(target)
 
     def on_show(self):
-        """Called when this view is shown - reload data and auto-complete checkouts"""
-        # Auto-complete checkouts
-        self.booking_service.auto_complete_checkouts()
-        # Reload bookings
-        self.load_bookings_data()
+        """Called when this view is shown - load the selected tab if it changed"""
+        self.on_tab_change()
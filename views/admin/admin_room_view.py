@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
 import sys
 from tkinter import filedialog, messagebox
@@ -10,6 +9,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.room_service import RoomService
 from modules.db_manager import DBManager
+from modules.image_cache import ImageCache
+from modules.event_bus import ROOM_EVENTS, ROOM_TYPE_EVENTS, TABLE_CHANGED
+from modules.io_accounting import user_action
+from views.widgets.lazy_image_loader import LazyImageLoader
+from views.widgets.virtual_list import VirtualList
+from views.widgets.card_reconciler import CardReconciler, image_record_version
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -33,6 +38,11 @@ gilroy_bold_path = os.path.join(assets_font_dir, "SVN-Gilroy Bold.otf")
 if os.path.exists(gilroy_bold_path):
     FontManager.load_font(gilroy_bold_path)
 
+TAB_NAMES = ["Room", "Room Type", "Room Status"]
+
+# Rooms fetched per page when a tab is loaded or scrolled to its end
+ROOM_PAGE_SIZE = 50
+
 
 class AdminRoomView(ctk.CTkFrame):
     def __init__(self, parent, controller=None, *args, **kwargs):
@@ -43,9 +53,12 @@ class AdminRoomView(ctk.CTkFrame):
         if controller:
             self.db_manager = controller.get_db_manager()
             self.room_service = controller.get_room_service() if hasattr(controller, 'get_room_service') else RoomService(self.db_manager)
+            self.image_cache = controller.get_image_cache() if hasattr(controller, 'get_image_cache') else ImageCache()
         else:
             self.db_manager = DBManager("db")
             self.room_service = RoomService(self.db_manager)
+            self.image_cache = ImageCache()
+        self.image_loader = LazyImageLoader(self.image_cache, self)
 
         self.configure(fg_color="white")
         self.grid_rowconfigure(0, weight=1)
@@ -124,126 +137,180 @@ class AdminRoomView(ctk.CTkFrame):
             fg_color="white",
             segmented_button_fg_color="#E5E5E5",
             segmented_button_selected_color="#3A7BFF",
-            segmented_button_unselected_color="#A9A9A9"
+            segmented_button_unselected_color="#A9A9A9",
+            command=self.on_tab_change
         )
         self.tabview.grid(row=1, column=0, sticky="nsew")
         self.content_frame.grid_rowconfigure(1, weight=1)
 
         # Create tabs
         self.tabs = {}
-        tab_names = ["Room", "Room Type", "Room Status"]
+        tab_names = TAB_NAMES
+        self.dirty_tabs = set(tab_names)
+        self.cursors = {}
         
         for tab_name in tab_names:
             tab = self.tabview.add(tab_name)
             self.tabs[tab_name] = tab
-            
-            # Create scrollable frame for cards
-            scrollable_frame = ctk.CTkScrollableFrame(tab, fg_color="#F5F5F5")
-            scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
-            
-            # Store reference to scrollable frame
-            setattr(self, f"scrollable_frame_{tab_name.replace(' ', '_')}", scrollable_frame)
-
-        # Load initial data
-        self.load_data()
 
-    def load_data(self):
-        """Load and display data in each tab"""
-        self.load_room_tab()
-        self.load_room_type_tab()
-        self.load_room_status_tab()
+        # Room tab: add button above a virtualized list of room cards
+        add_btn_frame = ctk.CTkFrame(self.tabs["Room"], fg_color="white")
+        add_btn_frame.pack(fill="x", padx=10, pady=(10, 0))
+        
+        add_btn = ctk.CTkButton(
+            add_btn_frame,
+            text="+ Add Room",
+            font=("SVN-Gilroy", 14),
+            fg_color="#28A745",
+            hover_color="#218838",
+            command=self.show_add_room_dialog
+        )
+        add_btn.pack(side="left")
 
-    # Room Tab
-    def load_room_tab(self):
-        """Load rooms in Room tab"""
-        scrollable_frame = getattr(self, "scrollable_frame_Room", None)
-        if not scrollable_frame:
-            return
+        self.room_list = VirtualList(
+            self.tabs["Room"],
+            create_card=self.create_room_card,
+            bind_card=self.bind_room_card,
+            item_height=170,
+            empty_text="No rooms",
+            on_end_reached=lambda: self.load_next_room_page("Room")
+        )
+        self.room_list.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Clear existing widgets
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
+        # Room Type tab: few cards with images, kept in a scrollable frame
+        self.scrollable_frame_Room_Type = ctk.CTkScrollableFrame(self.tabs["Room Type"], fg_color="#F5F5F5")
+        self.scrollable_frame_Room_Type.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Add button
-        add_btn_frame = ctk.CTkFrame(scrollable_frame, fg_color="#F5F5F5")
+        add_btn_frame = ctk.CTkFrame(self.scrollable_frame_Room_Type, fg_color="#F5F5F5")
         add_btn_frame.pack(fill="x", pady=(0, 10))
         
         add_btn = ctk.CTkButton(
             add_btn_frame,
-            text="+ Add Room",
+            text="+ Add Room Type",
             font=("SVN-Gilroy", 14),
             fg_color="#28A745",
             hover_color="#218838",
-            command=self.show_add_room_dialog
+            command=self.show_add_room_type_dialog
         )
         add_btn.pack(side="left")
 
-        # Get rooms
-        rooms = self.room_service.get_all_rooms()
+        self.room_type_empty_label = ctk.CTkLabel(
+            self.scrollable_frame_Room_Type,
+            text="No room types",
+            font=("SVN-Gilroy", 14),
+            text_color="gray"
+        )
+
+        # Room type cards keyed by typeID, only changed cards are rebuilt
+        self.room_type_reconciler = CardReconciler(
+            self.scrollable_frame_Room_Type,
+            create_card=self.create_room_type_card,
+            key=lambda room_type: room_type.get("typeID"),
+            version=image_record_version,
+            pack_options={"fill": "x", "pady": 10, "padx": 10}
+        )
 
-        if not rooms:
-            empty_label = ctk.CTkLabel(
-                scrollable_frame,
-                text="No rooms",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            empty_label.pack(pady=50)
+        # Room Status tab: virtualized list of room status cards
+        self.room_status_list = VirtualList(
+            self.tabs["Room Status"],
+            create_card=self.create_room_status_card,
+            bind_card=self.bind_room_status_card,
+            item_height=170,
+            empty_text="No rooms",
+            on_end_reached=lambda: self.load_next_room_page("Room Status")
+        )
+        self.room_status_list.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Room type previews are prioritised by the Room Type tab's viewport
+        self.image_loader.viewport = self.scrollable_frame_Room_Type._parent_canvas
+
+        # Room and room type changes only reload the tabs they affect
+        self.db_manager.events.subscribe(self.on_room_events, ROOM_EVENTS + ROOM_TYPE_EVENTS + (TABLE_CHANGED,))
+
+        # Load initial data
+        self.load_data()
+
+    def load_data(self):
+        """Mark every tab as out of date and load the selected one"""
+        self.dirty_tabs = set(TAB_NAMES)
+        self.on_tab_change()
+
+    def on_tab_change(self):
+        """Load a tab the first time it is selected after a change"""
+        tab_name = self.tabview.get()
+        if tab_name not in self.dirty_tabs:
             return
+        loaders = {
+            "Room": self.load_room_tab,
+            "Room Type": self.load_room_type_tab,
+            "Room Status": self.load_room_status_tab
+        }
+        loaders[tab_name]()
+
+    def on_room_events(self, events):
+        """Mark the tabs touched by room changes and reload the selected one if shown"""
+        affected = set()
+        for event in events:
+            if event.type in ROOM_EVENTS or (event.type == TABLE_CHANGED and event.key == self.db_manager.room_file):
+                affected.update(("Room", "Room Status"))
+            elif event.type in ROOM_TYPE_EVENTS or (event.type == TABLE_CHANGED and event.key == self.db_manager.room_type_file):
+                # Room cards show the type name
+                affected.update(("Room Type", "Room"))
+        if not affected:
+            return
+        self.dirty_tabs.update(affected)
+        if not self.controller or self.controller.is_frame_shown(self):
+            self.on_tab_change()
+
+    def load_room_page(self, tab_name, room_list):
+        """Load the first page of rooms into a tab's list"""
+        # Reload as many rooms as were already shown so the scroll position holds
+        page_size = max(ROOM_PAGE_SIZE, len(room_list.get_items()))
+        rooms, cursor = self.room_service.get_rooms_page(page_size=page_size)
+
+        # Visible cards are rebound, not rebuilt
+        room_list.set_items(rooms)
+        self.cursors[tab_name] = cursor
+        self.dirty_tabs.discard(tab_name)
+
+    def load_next_room_page(self, tab_name):
+        """Append the next page of rooms when a list is scrolled to its end"""
+        cursor = self.cursors.get(tab_name)
+        if cursor is None or tab_name in self.dirty_tabs:
+            return
+        rooms, next_cursor = self.room_service.get_rooms_page(page_size=ROOM_PAGE_SIZE, cursor=cursor)
+        self.cursors[tab_name] = next_cursor
+        room_list = self.room_list if tab_name == "Room" else self.room_status_list
+        room_list.append_items(rooms)
 
-        # Create room cards
-        for room in rooms:
-            self.create_room_card(scrollable_frame, room)
+    # Room Tab
+    def load_room_tab(self):
+        """Load rooms in Room tab"""
+        self.load_room_page("Room", self.room_list)
 
-    def create_room_card(self, parent, room):
-        """Create a room card"""
+    def create_room_card(self, parent):
+        """Create an empty room card"""
         card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
 
         # Title - Room Number
-        title = ctk.CTkLabel(
+        card.title = ctk.CTkLabel(
             card,
-            text=f"Room: {room.get('roomNumber', '')}",
+            text="",
             font=("SVN-Gilroy", 16, "bold"),
             text_color="black",
             anchor="w"
         )
-        title.pack(anchor="w", pady=(10, 5), padx=20)
+        card.title.pack(anchor="w", pady=(10, 5), padx=20)
 
         # Room information
-        room_type_name = room.get("typeName", "Unknown")
-        status = room.get("Status", "")
-
-        summary_items = [
-            ("Room Type", room_type_name),
-            ("Status", status)
-        ]
-
-        for label_text, value_text in summary_items:
-            item_frame = ctk.CTkFrame(card, fg_color="white")
-            item_frame.pack(fill="x", pady=2, padx=20)
-            label = ctk.CTkLabel(
-                item_frame,
-                text=label_text,
-                font=("SVN-Gilroy", 13),
-                text_color="black",
-                anchor="w"
-            )
-            label.pack(side="left", anchor="w")
-            value = ctk.CTkLabel(
-                item_frame,
-                text=value_text,
-                font=("SVN-Gilroy", 12),
-                text_color="black" if label_text == "Status" else "gray",
-                anchor="e"
-            )
-            value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20, 0))
+        card.values = self.create_summary_rows(card, ["Room Type", "Status"])
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card, fg_color="white")
         btn_frame.pack(fill="x", pady=(10, 15), padx=20)
 
-        edit_btn = ctk.CTkButton(
+        card.edit_btn = ctk.CTkButton(
             btn_frame,
             text="Edit",
             font=("SVN-Gilroy", 14),
@@ -251,12 +318,11 @@ class AdminRoomView(ctk.CTkFrame):
             text_color="white",
             hover_color="#2A5BCC",
             corner_radius=10,
-            width=100,
-            command=lambda r=room: self.show_edit_room_dialog(r)
+            width=100
         )
-        edit_btn.pack(side="left", padx=(0, 10))
+        card.edit_btn.pack(side="left", padx=(0, 10))
 
-        delete_btn = ctk.CTkButton(
+        card.delete_btn = ctk.CTkButton(
             btn_frame,
             text="Delete",
             font=("SVN-Gilroy", 14),
@@ -264,10 +330,43 @@ class AdminRoomView(ctk.CTkFrame):
             text_color="white",
             hover_color="#C82333",
             corner_radius=10,
-            width=100,
-            command=lambda r=room: self.delete_room(r)
+            width=100
         )
-        delete_btn.pack(side="left")
+        card.delete_btn.pack(side="left")
+        return card
+
+    def bind_room_card(self, card, room):
+        """Show a room in a (possibly recycled) room card"""
+        card.title.configure(text=f"Room: {room.get('roomNumber', '')}")
+        card.values["Room Type"].configure(text=room.get("typeName", "Unknown"))
+        card.values["Status"].configure(text=room.get("Status", ""))
+        card.edit_btn.configure(command=lambda r=room: self.show_edit_room_dialog(r))
+        card.delete_btn.configure(command=lambda r=room: self.delete_room(r))
+
+    def create_summary_rows(self, card, label_texts):
+        """Create label/value rows on a card and return the value labels by name"""
+        values = {}
+        for label_text in label_texts:
+            item_frame = ctk.CTkFrame(card, fg_color="white")
+            item_frame.pack(fill="x", pady=2, padx=20)
+            label = ctk.CTkLabel(
+                item_frame,
+                text=label_text,
+                font=("SVN-Gilroy", 13),
+                text_color="black",
+                anchor="w"
+            )
+            label.pack(side="left", anchor="w")
+            value = ctk.CTkLabel(
+                item_frame,
+                text="",
+                font=("SVN-Gilroy", 12),
+                text_color="black" if label_text == "Status" else "gray",
+                anchor="e"
+            )
+            value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20, 0))
+            values[label_text] = value
+        return values
 
     def show_add_room_dialog(self):
         """Show dialog to add new room"""
@@ -312,7 +411,6 @@ class AdminRoomView(ctk.CTkFrame):
             
             result = self.room_service.create_room(room_number, type_id)
             if result:
-                self.load_room_tab()
                 dialog.destroy()
             else:
                 messagebox.showerror("Error", "Room number already exists")
@@ -368,7 +466,6 @@ class AdminRoomView(ctk.CTkFrame):
             
             success = self.room_service.update_room(room.get("roomId"), room_number=room_number, type_id=type_id)
             if success:
-                self.load_room_tab()
                 dialog.destroy()
             else:
                 messagebox.showerror("Error", "Room number already exists")
@@ -378,58 +475,30 @@ class AdminRoomView(ctk.CTkFrame):
     def delete_room(self, room):
         """Delete a room"""
         if messagebox.askyesno("Confirm", f"Delete room {room.get('roomNumber')}?"):
-            success = self.room_service.delete_room(room.get("roomId"))
-            if success:
-                self.load_room_tab()
-            else:
+            with user_action(f"admin delete room #{room.get('roomId')}"):
+                success = self.room_service.delete_room(room.get("roomId"))
+            if not success:
                 messagebox.showerror("Error", "Cannot delete room (room is booked or not found)")
 
     # Room Type Tab
     def load_room_type_tab(self):
         """Load room types in Room Type tab"""
-        scrollable_frame = getattr(self, "scrollable_frame_Room_Type", None)
-        if not scrollable_frame:
-            return
-
-        # Clear existing widgets
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
-
-        # Add button
-        add_btn_frame = ctk.CTkFrame(scrollable_frame, fg_color="#F5F5F5")
-        add_btn_frame.pack(fill="x", pady=(0, 10))
-        
-        add_btn = ctk.CTkButton(
-            add_btn_frame,
-            text="+ Add Room Type",
-            font=("SVN-Gilroy", 14),
-            fg_color="#28A745",
-            hover_color="#218838",
-            command=self.show_add_room_type_dialog
-        )
-        add_btn.pack(side="left")
+        self.dirty_tabs.discard("Room Type")
 
         # Get room types
         room_types = self.room_service.get_all_room_types()
 
         if not room_types:
-            empty_label = ctk.CTkLabel(
-                scrollable_frame,
-                text="No room types",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            empty_label.pack(pady=50)
-            return
+            self.room_type_empty_label.pack(pady=50)
+        else:
+            self.room_type_empty_label.pack_forget()
 
-        # Create room type cards
-        for room_type in room_types:
-            self.create_room_type_card(scrollable_frame, room_type)
+        # Only new, changed or removed room types touch their cards
+        self.room_type_reconciler.reconcile(room_types)
 
     def create_room_type_card(self, parent, room_type):
         """Create a room type card"""
         card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
 
         # Title - Type Name
         title = ctk.CTkLabel(
@@ -473,14 +542,18 @@ class AdminRoomView(ctk.CTkFrame):
 
         # Image preview if exists
         if image_path and os.path.exists(image_path):
-            try:
-                img = Image.open(image_path)
-                img = img.resize((200, 150))
-                photo = ctk.CTkImage(light_image=img, size=(200, 150))
-                img_label = ctk.CTkLabel(card, image=photo, text="")
-                img_label.pack(pady=10, padx=20)
-            except:
-                pass
+            # Grey placeholder first, the preview is decoded in the background
+            img_label = ctk.CTkLabel(
+                card,
+                text="Room Image",
+                font=("SVN-Gilroy", 12),
+                text_color="gray",
+                fg_color="#E5E5E5",
+                width=200,
+                height=150
+            )
+            img_label.pack(pady=10, padx=20)
+            self.image_loader.request(img_label, image_path, (200, 150))
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card, fg_color="white")
@@ -511,6 +584,7 @@ class AdminRoomView(ctk.CTkFrame):
             command=lambda rt=room_type: self.delete_room_type(rt)
         )
         delete_btn.pack(side="left")
+        return card
 
     def show_add_room_type_dialog(self):
         """Show dialog to add new room type"""
@@ -573,7 +647,6 @@ class AdminRoomView(ctk.CTkFrame):
 
             result = self.room_service.create_room_type(type_name, description, price, image_path)
             if result:
-                self.load_room_type_tab()
                 dialog.destroy()
             else:
                 messagebox.showerror("Error", "Type name already exists")
@@ -656,7 +729,6 @@ class AdminRoomView(ctk.CTkFrame):
                 image_path=image_path if image_path and image_path != current_image else None
             )
             if success:
-                self.load_room_type_tab()
                 dialog.destroy()
             else:
                 messagebox.showerror("Error", "Type name already exists")
@@ -666,138 +738,99 @@ class AdminRoomView(ctk.CTkFrame):
     def delete_room_type(self, room_type):
         """Delete a room type"""
         if messagebox.askyesno("Confirm", f"Delete room type {room_type.get('typeName')}?"):
-            success = self.room_service.delete_room_type(room_type.get("typeID"))
-            if success:
-                self.load_room_type_tab()
-            else:
+            with user_action(f"admin delete room type #{room_type.get('typeID')}"):
+                success = self.room_service.delete_room_type(room_type.get("typeID"))
+            if not success:
                 messagebox.showerror("Error", "Cannot delete room type (type is in use or not found)")
 
     # Room Status Tab
     def load_room_status_tab(self):
         """Load rooms in Room Status tab"""
-        scrollable_frame = getattr(self, "scrollable_frame_Room_Status", None)
-        if not scrollable_frame:
-            return
-
-        # Clear existing widgets
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
+        self.load_room_page("Room Status", self.room_status_list)
 
-        # Get rooms
-        rooms = self.room_service.get_rooms_for_status_management()
-
-        if not rooms:
-            empty_label = ctk.CTkLabel(
-                scrollable_frame,
-                text="No rooms",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            empty_label.pack(pady=50)
-            return
-
-        # Create room cards
-        for room in rooms:
-            self.create_room_status_card(scrollable_frame, room)
-
-    def create_room_status_card(self, parent, room):
-        """Create a room status card"""
+    def create_room_status_card(self, parent):
+        """Create an empty room status card"""
         card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
 
         # Title - Room Number
-        title = ctk.CTkLabel(
+        card.title = ctk.CTkLabel(
             card,
-            text=f"Room: {room.get('roomNumber', '')}",
+            text="",
             font=("SVN-Gilroy", 16, "bold"),
             text_color="black",
             anchor="w"
         )
-        title.pack(anchor="w", pady=(10, 5), padx=20)
+        card.title.pack(anchor="w", pady=(10, 5), padx=20)
 
         # Room information
-        room_type_name = room.get("typeName", "Unknown")
-        status = room.get("Status", "")
+        card.values = self.create_summary_rows(card, ["Room Type", "Status"])
 
-        summary_items = [
-            ("Room Type", room_type_name),
-            ("Status", status)
-        ]
+        # Status update buttons, packed per status when bound
+        card.btn_frame = ctk.CTkFrame(card, fg_color="white")
 
-        for label_text, value_text in summary_items:
-            item_frame = ctk.CTkFrame(card, fg_color="white")
-            item_frame.pack(fill="x", pady=2, padx=20)
-            label = ctk.CTkLabel(
-                item_frame,
-                text=label_text,
-                font=("SVN-Gilroy", 13),
-                text_color="black",
-                anchor="w"
-            )
-            label.pack(side="left", anchor="w")
-            value = ctk.CTkLabel(
-                item_frame,
-                text=value_text,
-                font=("SVN-Gilroy", 12),
-                text_color="black" if label_text == "Status" else "gray",
-                anchor="e"
-            )
-            value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20, 0))
+        card.cleaning_btn = ctk.CTkButton(
+            card.btn_frame,
+            text="Set Cleaning",
+            font=("SVN-Gilroy", 14),
+            fg_color="#FFC107",
+            text_color="white",
+            hover_color="#E0A800",
+            corner_radius=10,
+            width=120
+        )
 
-        # Status update buttons (only for Available rooms)
-        status = room.get("Status", "")
-        if status == "Available":
-            btn_frame = ctk.CTkFrame(card, fg_color="white")
-            btn_frame.pack(fill="x", pady=(10, 15), padx=20)
+        card.maintenance_btn = ctk.CTkButton(
+            card.btn_frame,
+            text="Set Maintenance",
+            font=("SVN-Gilroy", 14),
+            fg_color="#FF9800",
+            text_color="white",
+            hover_color="#E68900",
+            corner_radius=10,
+            width=120
+        )
 
-            cleaning_btn = ctk.CTkButton(
-                btn_frame,
-                text="Set Cleaning",
-                font=("SVN-Gilroy", 14),
-                fg_color="#FFC107",
-                text_color="white",
-                hover_color="#E0A800",
-                corner_radius=10,
-                width=120,
-                command=lambda r=room: self.update_room_status(r, "Cleaning")
-            )
-            cleaning_btn.pack(side="left", padx=(0, 10))
+        card.available_btn = ctk.CTkButton(
+            card.btn_frame,
+            text="Set Available",
+            font=("SVN-Gilroy", 14),
+            fg_color="#28A745",
+            text_color="white",
+            hover_color="#218838",
+            corner_radius=10,
+            width=120
+        )
+        return card
 
-            maintenance_btn = ctk.CTkButton(
-                btn_frame,
-                text="Set Maintenance",
-                font=("SVN-Gilroy", 14),
-                fg_color="#FF9800",
-                text_color="white",
-                hover_color="#E68900",
-                corner_radius=10,
-                width=120,
-                command=lambda r=room: self.update_room_status(r, "Maintenance")
-            )
-            maintenance_btn.pack(side="left")
-        elif status in ["Cleaning", "Maintenance"]:
-            btn_frame = ctk.CTkFrame(card, fg_color="white")
-            btn_frame.pack(fill="x", pady=(10, 15), padx=20)
+    def bind_room_status_card(self, card, room):
+        """Show a room in a (possibly recycled) room status card"""
+        card.title.configure(text=f"Room: {room.get('roomNumber', '')}")
+        card.values["Room Type"].configure(text=room.get("typeName", "Unknown"))
+        card.values["Status"].configure(text=room.get("Status", ""))
 
-            available_btn = ctk.CTkButton(
-                btn_frame,
-                text="Set Available",
-                font=("SVN-Gilroy", 14),
-                fg_color="#28A745",
-                text_color="white",
-                hover_color="#218838",
-                corner_radius=10,
-                width=120,
-                command=lambda r=room: self.update_room_status(r, "Available")
-            )
-            available_btn.pack(side="left")
+        for button in (card.cleaning_btn, card.maintenance_btn, card.available_btn):
+            button.pack_forget()
+
+        # Status update buttons (only for Available, Cleaning and Maintenance rooms)
+        status = room.get("Status", "")
+        if status == "Available":
+            card.cleaning_btn.configure(command=lambda r=room: self.update_room_status(r, "Cleaning"))
+            card.cleaning_btn.pack(side="left", padx=(0, 10))
+            card.maintenance_btn.configure(command=lambda r=room: self.update_room_status(r, "Maintenance"))
+            card.maintenance_btn.pack(side="left")
+            card.btn_frame.pack(fill="x", pady=(10, 15), padx=20)
+        elif status in ["Cleaning", "Maintenance"]:
+            card.available_btn.configure(command=lambda r=room: self.update_room_status(r, "Available"))
+            card.available_btn.pack(side="left")
+            card.btn_frame.pack(fill="x", pady=(10, 15), padx=20)
+        else:
+            card.btn_frame.pack_forget()
 
     def update_room_status(self, room, new_status):
         """Update room status"""
-        success = self.room_service.update_room_status(room.get("roomId"), new_status)
-        if success:
-            self.load_room_status_tab()
-        else:
+        with user_action(f"admin set room #{room.get('roomId')} {new_status}"):
+            success = self.room_service.update_room_status(room.get("roomId"), new_status)
+        if not success:
             messagebox.showerror("Error", "Cannot update room status (invalid status change)")
 
     def on_nav_click(self, item):
@@ -821,5 +854,5 @@ class AdminRoomView(ctk.CTkFrame):
             self.controller.show_frame(target)
 
     def on_show(self):
-        """Called when this view is shown - reload data"""
-        self.load_data()
+        """Called when this view is shown - load the selected tab if it changed"""
+        self.on_tab_change()
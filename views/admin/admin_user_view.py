@@ -9,6 +9,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.db_manager import DBManager
 from modules.auth_service import AuthService
+from modules.event_bus import CUSTOMER_CREATED, CUSTOMER_UPDATED, CUSTOMER_DELETED, TABLE_CHANGED
+from modules.io_accounting import user_action
+from views.widgets.virtual_list import VirtualList
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -44,7 +47,7 @@ class AdminUserView(ctk.CTkFrame):
             self.auth_service = controller.get_auth_service()
         else:
             self.db_manager = DBManager("db")
-            self.auth_service = AuthService()
+            self.auth_service = AuthService(self.db_manager)
 
         self.configure(fg_color="white")
         self.grid_rowconfigure(0, weight=1)
@@ -117,64 +120,59 @@ class AdminUserView(ctk.CTkFrame):
         )
         title_label.grid(row=0, column=0, sticky="w", pady=(0, 20))
 
-        # Scrollable frame for user cards
-        self.scrollable_frame = ctk.CTkScrollableFrame(self.content_frame, fg_color="#F5F5F5")
-        self.scrollable_frame.grid(row=1, column=0, sticky="nsew")
+        # Virtualized list for user cards: only the visible cards are built
+        self.user_list = VirtualList(
+            self.content_frame,
+            create_card=self.create_user_card,
+            bind_card=self.bind_user_card,
+            item_height=200,
+            empty_text="No users"
+        )
+        self.user_list.grid(row=1, column=0, sticky="nsew")
         self.content_frame.grid_rowconfigure(1, weight=1)
 
+        # Customer changes reload the list (now if shown, else on next show)
+        self.users_dirty = True
+        self.db_manager.events.subscribe(
+            self.on_customer_events,
+            (CUSTOMER_CREATED, CUSTOMER_UPDATED, CUSTOMER_DELETED, TABLE_CHANGED)
+        )
+
         # Load users
         self.load_users()
 
     def load_users(self):
         """Load and display all users"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-
-        # Get all customers
+        # Get all customers; visible cards are rebound, not rebuilt
         customers = self.db_manager.get_all_customers()
+        self.user_list.set_items(customers)
+        self.users_dirty = False
 
-        if not customers:
-            empty_label = ctk.CTkLabel(
-                self.scrollable_frame,
-                text="No users",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            empty_label.pack(pady=50)
+    def on_customer_events(self, events):
+        """Reload the user list when customers changed"""
+        if all(e.type == TABLE_CHANGED and e.key != self.db_manager.customer_file for e in events):
             return
+        self.users_dirty = True
+        if not self.controller or self.controller.is_frame_shown(self):
+            self.load_users()
 
-        # Create user cards
-        for customer in customers:
-            self.create_user_card(customer)
-
-    def create_user_card(self, user):
-        """Create a user card"""
-        card = ctk.CTkFrame(self.scrollable_frame, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
+    def create_user_card(self, parent):
+        """Create an empty user card"""
+        card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
 
         # Title - Customer ID
-        title = ctk.CTkLabel(
+        card.title = ctk.CTkLabel(
             card,
-            text=f"Customer ID: {user.get('customerID', '')}",
+            text="",
             font=("SVN-Gilroy", 16, "bold"),
             text_color="black",
             anchor="w"
         )
-        title.pack(anchor="w", pady=(10, 5), padx=20)
+        card.title.pack(anchor="w", pady=(10, 5), padx=20)
 
         # User information
-        name = user.get("name", "")
-        email = user.get("email", "")
-        phone = user.get("phone", "")
-
-        summary_items = [
-            ("Name", name),
-            ("Email", email),
-            ("Phone", phone)
-        ]
-
-        for label_text, value_text in summary_items:
+        card.values = {}
+        for label_text in ["Name", "Email", "Phone"]:
             item_frame = ctk.CTkFrame(card, fg_color="white")
             item_frame.pack(fill="x", pady=2, padx=20)
             label = ctk.CTkLabel(
@@ -187,18 +185,19 @@ class AdminUserView(ctk.CTkFrame):
             label.pack(side="left", anchor="w")
             value = ctk.CTkLabel(
                 item_frame,
-                text=value_text,
+                text="",
                 font=("SVN-Gilroy", 12),
                 text_color="gray",
                 anchor="e"
             )
             value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20, 0))
+            card.values[label_text] = value
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card, fg_color="white")
         btn_frame.pack(fill="x", pady=(10, 15), padx=20)
 
-        update_info_btn = ctk.CTkButton(
+        card.update_info_btn = ctk.CTkButton(
             btn_frame,
             text="Update Personal Info",
             font=("SVN-Gilroy", 14),
@@ -206,12 +205,11 @@ class AdminUserView(ctk.CTkFrame):
             text_color="white",
             hover_color="#2A5BCC",
             corner_radius=10,
-            width=150,
-            command=lambda u=user: self.show_update_info_dialog(u)
+            width=150
         )
-        update_info_btn.pack(side="left", padx=(0, 10))
+        card.update_info_btn.pack(side="left", padx=(0, 10))
 
-        change_password_btn = ctk.CTkButton(
+        card.change_password_btn = ctk.CTkButton(
             btn_frame,
             text="Change Password",
             font=("SVN-Gilroy", 14),
@@ -219,12 +217,11 @@ class AdminUserView(ctk.CTkFrame):
             text_color="white",
             hover_color="#218838",
             corner_radius=10,
-            width=150,
-            command=lambda u=user: self.show_change_password_dialog(u)
+            width=150
         )
-        change_password_btn.pack(side="left", padx=(0, 10))
+        card.change_password_btn.pack(side="left", padx=(0, 10))
 
-        delete_btn = ctk.CTkButton(
+        card.delete_btn = ctk.CTkButton(
             btn_frame,
             text="Delete",
             font=("SVN-Gilroy", 14),
@@ -232,10 +229,20 @@ class AdminUserView(ctk.CTkFrame):
             text_color="white",
             hover_color="#C82333",
             corner_radius=10,
-            width=150,
-            command=lambda u=user: self.delete_user(u)
+            width=150
         )
-        delete_btn.pack(side="left")
+        card.delete_btn.pack(side="left")
+        return card
+
+    def bind_user_card(self, card, user):
+        """Show a user in a (possibly recycled) user card"""
+        card.title.configure(text=f"Customer ID: {user.get('customerID', '')}")
+        card.values["Name"].configure(text=user.get("name", ""))
+        card.values["Email"].configure(text=user.get("email", ""))
+        card.values["Phone"].configure(text=user.get("phone", ""))
+        card.update_info_btn.configure(command=lambda u=user: self.show_update_info_dialog(u))
+        card.change_password_btn.configure(command=lambda u=user: self.show_change_password_dialog(u))
+        card.delete_btn.configure(command=lambda u=user: self.delete_user(u))
 
     def show_update_info_dialog(self, user):
         """Show dialog to update user personal information"""
@@ -273,7 +280,7 @@ class AdminUserView(ctk.CTkFrame):
 
             success, updated_user, error = self.auth_service.update_user_info(user_data, name, phone)
             if success:
-                self.load_users()
+                self.invalidate_user_sessions(user)
                 dialog.destroy()
                 messagebox.showinfo("Success", "User information updated successfully")
             else:
@@ -318,7 +325,7 @@ class AdminUserView(ctk.CTkFrame):
             # Use admin_change_password which doesn't require old password
             success, updated_user, error = self.auth_service.admin_change_password(user, new_pw)
             if success:
-                self.load_users()
+                self.invalidate_user_sessions(user)
                 dialog.destroy()
                 messagebox.showinfo("Success", "Password changed successfully")
             else:
@@ -329,13 +336,19 @@ class AdminUserView(ctk.CTkFrame):
     def delete_user(self, user):
         """Delete a user"""
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete user {user.get('name', '')} (ID: {user.get('customerID', '')})?"):
-            success = self.db_manager.delete_customer(user.get("customerID"))
+            with user_action(f"admin delete user #{user.get('customerID')}"):
+                success = self.db_manager.delete_customer(user.get("customerID"))
             if success:
-                self.load_users()
+                self.invalidate_user_sessions(user)
                 messagebox.showinfo("Success", "User deleted successfully")
             else:
                 messagebox.showerror("Error", "Failed to delete user")
 
+    def invalidate_user_sessions(self, user):
+        """Make open sessions of this customer reload their profile on next read"""
+        if self.controller and hasattr(self.controller, "get_session_manager"):
+            self.controller.get_session_manager().invalidate_user("customer", user.get("customerID"))
+
     def on_nav_click(self, item):
         """Handle navigation item click"""
         if not self.controller:
@@ -357,5 +370,6 @@ class AdminUserView(ctk.CTkFrame):
             self.controller.show_frame(target)
 
     def on_show(self):
-        """Called when this view is shown - reload data"""
-        self.load_users()
+        """Called when this view is shown - reload users if they changed"""
+        if self.users_dirty:
+            self.load_users()
@@ -0,0 +1,73 @@
+import customtkinter as ctk
+import os
+import threading
+
+from modules.image_cache import ImageCache
+
+# Static screen artwork and the size each screen draws it at
+HERO_IMAGE = "assets/images/hotel.png"
+HERO_SIZE = (600, 750)
+BANNER_IMAGE = "assets/images/hotelBanner.jpg"
+BANNER_SIZE = (1200, 675)
+DESCRIPTION_IMAGE = "assets/images/hotel.jpg"
+DESCRIPTION_SIZE = (400, 300)
+
+
+class AssetCache:
+    """
+    Process-wide cache of hero/banner CTkImages
+
+    Each asset is decoded once at its target size through ImageCache (which
+    persists the pre-scaled copy, so warm starts skip JPEG decoding) and the
+    same CTkImage is shared by every view that draws it.
+    """
+
+    def __init__(self, image_cache=None):
+        """
+        Args:
+            image_cache: Shared ImageCache used to decode and persist scaled copies
+        """
+        self.image_cache = image_cache or ImageCache()
+        self._images = {}
+        self._lock = threading.Lock()
+
+    def get(self, image_path, size):
+        """
+        Get a CTkImage of an asset at `size`
+
+        Returns:
+            CTkImage, or None if the asset is missing or unreadable
+        """
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        size = (int(size[0]), int(size[1]))
+        key = (os.path.abspath(image_path), size)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._images.get(key)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+
+        image = self.image_cache.get_thumbnail(image_path, size)
+        if image is None:
+            return None
+        photo = ctk.CTkImage(light_image=image, size=size)
+        with self._lock:
+            self._images[key] = (stamp, photo)
+        return photo
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_asset_cache(image_cache=None):
+    """Return the process-wide AssetCache, creating it on first use"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = AssetCache(image_cache)
+        return _shared_cache
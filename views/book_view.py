@@ -10,6 +10,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.db_manager import DBManager
 from modules.booking_service import BookingService
+from modules.io_accounting import user_action
+from views.widgets.sidebar import Sidebar
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -69,64 +71,8 @@ class BookView(ctk.CTkFrame):
         self.create_main_content()
         
         # Create sidebar after main content
-        self.create_sidebar()
-    
-    def create_sidebar(self):
-        """Create left sidebar navigation"""
-        # Destroy existing sidebar if it exists
-        if self.sidebar:
-            self.sidebar.destroy()
-        
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-        
-        # Get user name from controller
-        user_name = "User"
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                user_name = current_user.get("name", current_user.get("email", "User"))
-        
-        # Greeting label
-        greeting_label = ctk.CTkLabel(
-            self.sidebar,
-            text=f"Hi, {user_name}",
-            font=("SVN-Gilroy", 16, "bold"),
-            text_color="black",
-            anchor="w"
-        )
-        greeting_label.pack(fill="x", padx=10, pady=(20, 10))
-        
-        # Navigation items for logged-in users
-        nav_items = [
-            "Home",
-            "Room",
-            "My Bookings",
-            "Account Settings",
-            "Sign out"
-        ]
-        
-        # Create navigation buttons
-        for i, item in enumerate(nav_items):
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x)
-            )
-            btn.pack(fill="x", padx=10, pady=5)
+        if not self.controller:
+            Sidebar.for_view(self)
     
     def create_main_content(self):
         """Create main content area"""
@@ -561,18 +507,19 @@ class BookView(ctk.CTkFrame):
             guest_email = self.email_entry.get().strip()
             guest_national_id = self.national_id_entry.get().strip()
             
-            booking = self.booking_service.create_booking(
-                room_id=self.room["roomId"],
-                checkin_date=self.checkin_date,
-                checkout_date=self.checkout_date,
-                num_guests=self.num_guests,
-                guest_name=guest_name,
-                guest_phone=guest_phone,
-                guest_email=guest_email,
-                guest_national_id=guest_national_id,
-                total_amount=self.total_amount,
-                customer_id=customer_id
-            )
+            with user_action(f"book room #{self.room['roomId']}"):
+                booking = self.booking_service.create_booking(
+                    room_id=self.room["roomId"],
+                    checkin_date=self.checkin_date,
+                    checkout_date=self.checkout_date,
+                    num_guests=self.num_guests,
+                    guest_name=guest_name,
+                    guest_phone=guest_phone,
+                    guest_email=guest_email,
+                    guest_national_id=guest_national_id,
+                    total_amount=self.total_amount,
+                    customer_id=customer_id
+                )
             
             # Show success message (will navigate away, so don't re-enable button)
             self.show_success(f"Booking successful!\nBooking ID: {booking['bookingID']}\nRoom: #{self.room['roomNumber']}")
@@ -583,30 +530,9 @@ class BookView(ctk.CTkFrame):
             self.book_btn.configure(state="normal", text="BOOK ROOM")
             self.show_error(f"Error creating booking: {str(e)}")
     
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
-            return
-        
-        nav_map = {
-            "Home": "MainAppView",
-            "Room": "RoomView",
-            "My Bookings": "MyBookingsView",
-            "Account Settings": "AccountView",
-            "Sign out": None  # Special handling
-        }
-        
-        if item == "Sign out":
-            self.controller.logout()
-            return
-        
-        target = nav_map.get(item)
-        if target:
-            self.controller.show_frame(target)
-    
     def on_show(self):
         """Called when this view is shown - refresh sidebar to reflect login status"""
-        self.create_sidebar()
+        Sidebar.for_view(self)
 
 
 if __name__ == "__main__":
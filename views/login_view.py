@@ -1,7 +1,12 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from views.asset_cache import get_asset_cache, HERO_IMAGE, HERO_SIZE
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -62,14 +67,9 @@ class LoginView(ctk.CTkFrame):
     def load_image(self):
         """Load and display image on the left side"""
         try:
-            # Path to image - adjust this path as needed
-            image_path = "assets/images/hotel.png"  # Update this path
-            if os.path.exists(image_path):
-                image = Image.open(image_path)
-                # Resize image to fit the frame (3/5 of 1000 = 600)
-                image = image.resize((600, 750))
-                photo = ctk.CTkImage(light_image=image, size=(600, 750))
-                
+            # Shared hero image, pre-scaled to fit the frame (3/5 of 1000 = 600)
+            photo = get_asset_cache().get(HERO_IMAGE, HERO_SIZE)
+            if photo is not None:
                 image_label = ctk.CTkLabel(self.left_frame, image=photo, text="")
                 image_label.image = photo  # Keep a reference
                 image_label.pack(fill="both", expand=True)
@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
 from datetime import datetime, date
 import re
@@ -10,6 +9,13 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.db_manager import DBManager
+from modules.image_cache import ImageCache
+from modules.event_bus import ROOM_TYPE_EVENTS, TABLE_CHANGED
+from views.widgets.card_reconciler import CardReconciler, image_record_version
+from views.widgets.sidebar import Sidebar
+from views.asset_cache import (
+    get_asset_cache, BANNER_IMAGE, BANNER_SIZE, DESCRIPTION_IMAGE, DESCRIPTION_SIZE
+)
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -38,11 +44,13 @@ class MainAppView(ctk.CTkFrame):
         super().__init__(parent, *args, **kwargs)
         self.controller = controller
         
-        # Initialize database manager
+        # Initialize database manager and thumbnail cache
         if controller:
             self.db_manager = controller.get_db_manager()
+            self.image_cache = controller.get_image_cache()
         else:
             self.db_manager = DBManager("db")
+            self.image_cache = ImageCache()
         
         self.configure(fg_color="white")
         self.grid_rowconfigure(0, weight=1)
@@ -55,81 +63,16 @@ class MainAppView(ctk.CTkFrame):
         self.main_container.grid_columnconfigure(0, weight=0)  # Sidebar
         self.main_container.grid_columnconfigure(1, weight=5)  # Main content
         
-        # Left sidebar - Navigation (will be created in create_sidebar)
+        # Left sidebar - Navigation (shared sidebar, attached by Sidebar.for_view)
         self.sidebar = None
         
         # Right side - Main content
         self.create_main_content()
+        self.db_manager.events.subscribe(self.on_room_type_events, ROOM_TYPE_EVENTS + (TABLE_CHANGED,))
         
         # Create sidebar initially
-        self.create_sidebar()
-    
-    def create_sidebar(self):
-        """Create left sidebar navigation"""
-        # Destroy existing sidebar if it exists
-        if self.sidebar:
-            self.sidebar.destroy()
-        
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-        
-        # Check if user is logged in
-        is_logged_in = False
-        user_name = "User"
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                is_logged_in = True
-                user_name = current_user.get("name", current_user.get("email", "User"))
-        
-        if is_logged_in:
-            # Greeting label for logged-in users
-            greeting_label = ctk.CTkLabel(
-                self.sidebar,
-                text=f"Hi, {user_name}",
-                font=("SVN-Gilroy", 16, "bold"),
-                text_color="black",
-                anchor="w"
-            )
-            greeting_label.pack(fill="x", padx=10, pady=(20, 10))
-            
-            # Navigation items for logged-in users
-            nav_items = [
-                "Home",
-                "Room",
-                "My Bookings",
-                "Account Settings",
-                "Sign out"
-            ]
-        else:
-            # Navigation items for non-logged-in users
-            nav_items = [
-                "Home",
-                "Rooms",
-                "Login"
-            ]
-        
-        # Create navigation buttons
-        for i, item in enumerate(nav_items):
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x)
-            )
-            btn.pack(fill="x", padx=10, pady=5)
+        if not self.controller:
+            Sidebar.for_view(self)
     
     def create_main_content(self):
         """Create main content area"""
@@ -279,11 +222,8 @@ class MainAppView(ctk.CTkFrame):
         
         # Try to load banner image
         try:
-            image_path = "assets/images/hotelBanner.jpg"
-            if os.path.exists(image_path):
-                image = Image.open(image_path)
-                image = image.resize((1200,675))
-                photo = ctk.CTkImage(light_image=image, size=(1200, 675))
+            photo = get_asset_cache(self.image_cache).get(BANNER_IMAGE, BANNER_SIZE)
+            if photo is not None:
                 banner_label = ctk.CTkLabel(banner_frame, image=photo, text="")
                 banner_label.image = photo
                 banner_label.pack(fill="both", expand=True)
@@ -330,11 +270,8 @@ class MainAppView(ctk.CTkFrame):
         image_frame.pack_propagate(False)
         
         try:
-            image_path = "assets/images/hotel.jpg"
-            if os.path.exists(image_path):
-                image = Image.open(image_path)
-                image = image.resize((400, 300))
-                photo = ctk.CTkImage(light_image=image, size=(400, 300))
+            photo = get_asset_cache(self.image_cache).get(DESCRIPTION_IMAGE, DESCRIPTION_SIZE)
+            if photo is not None:
                 img_label = ctk.CTkLabel(image_frame, image=photo, text="")
                 img_label.image = photo
                 img_label.pack(fill="both", expand=True)
@@ -408,15 +345,20 @@ class MainAppView(ctk.CTkFrame):
         self.rooms_container.grid_columnconfigure(1, weight=1)
         self.rooms_container.grid_columnconfigure(2, weight=1)
         
+        # Cards keyed by typeID (or empty slot), only changed cards are rebuilt
+        self.room_card_reconciler = CardReconciler(
+            self.rooms_container,
+            create_card=self.create_room_type_card,
+            key=lambda slot: ("placeholder", slot["placeholder"]) if "placeholder" in slot else slot.get("typeID"),
+            version=image_record_version,
+            layout=lambda card, i: card.grid(row=0, column=i, padx=10, pady=(20,0), sticky="n")
+        )
+        
         # Load and display room types from database
         self.load_room_type_cards()
     
     def load_room_type_cards(self):
         """Load room types from database and display them as cards"""
-        # Clear existing cards
-        for widget in self.rooms_container.winfo_children():
-            widget.destroy()
-        
         # Get room types from database
         if self.db_manager:
             room_types = self.db_manager.get_all_room_types()
@@ -426,38 +368,32 @@ class MainAppView(ctk.CTkFrame):
         # Limit to 3 room types for display
         room_types = room_types[:3]
         
-        # Create room cards
-        for i, room_type in enumerate(room_types):
-            room_card = ctk.CTkFrame(
-                self.rooms_container,
-                fg_color="#E5E5E5",
-                width=250,
-                height=250,
-                corner_radius=10
-            )
-            room_card.grid(row=0, column=i, padx=10, pady=(20,0), sticky="n")
-            room_card.pack_propagate(False)
-            
-            try:
-                image_path = room_type.get("imagePath", "")
-                if image_path and os.path.exists(image_path) and image_path != "hi chua co tai anh ve":
-                    image = Image.open(image_path)
-                    image = image.resize((250, 250))
-                    photo = ctk.CTkImage(light_image=image, size=(250, 250))
-                    room_img = ctk.CTkLabel(room_card, image=photo, text="")
-                    room_img.image = photo
-                    room_img.pack(pady=0)
-                else:
-                    room_img = ctk.CTkLabel(
-                        room_card,
-                        text="IMAGE",
-                        font=("SVN-Gilroy", 16, "bold"),
-                        text_color="gray",
-                        width=250,
-                        height=250
-                    )
-                    room_img.pack(pady=0)
-            except Exception as e:
+        # Fill remaining slots if less than 3 room types
+        slots = room_types + [{"placeholder": i} for i in range(len(room_types), 3)]
+        self.room_card_reconciler.reconcile(slots)
+    
+    def create_room_type_card(self, parent, room_type):
+        """Create a room type card, or an empty placeholder card"""
+        room_card = ctk.CTkFrame(
+            parent,
+            fg_color="#E5E5E5",
+            width=250,
+            height=250,
+            corner_radius=10
+        )
+        room_card.pack_propagate(False)
+        
+        try:
+            image_path = room_type.get("imagePath", "")
+            image = None
+            if image_path and image_path != "hi chua co tai anh ve":
+                image = self.image_cache.get_thumbnail(image_path, (250, 250))
+            if image is not None:
+                photo = ctk.CTkImage(light_image=image, size=(250, 250))
+                room_img = ctk.CTkLabel(room_card, image=photo, text="")
+                room_img.image = photo
+                room_img.pack(pady=0)
+            else:
                 room_img = ctk.CTkLabel(
                     room_card,
                     text="IMAGE",
@@ -467,20 +403,8 @@ class MainAppView(ctk.CTkFrame):
                     height=250
                 )
                 room_img.pack(pady=0)
-        
-        # Fill remaining slots if less than 3 room types
-        for i in range(len(room_types), 3):
-            room_card = ctk.CTkFrame(
-                self.rooms_container,
-                fg_color="#E5E5E5",
-                width=250,
-                height=250,
-                corner_radius=10
-            )
-            room_card.grid(row=0, column=i, padx=10, pady=(20,0), sticky="n")
-            room_card.pack_propagate(False)
-            
-            placeholder = ctk.CTkLabel(
+        except Exception as e:
+            room_img = ctk.CTkLabel(
                 room_card,
                 text="IMAGE",
                 font=("SVN-Gilroy", 16, "bold"),
@@ -488,7 +412,8 @@ class MainAppView(ctk.CTkFrame):
                 width=250,
                 height=250
             )
-            placeholder.pack(pady=0)
+            room_img.pack(pady=0)
+        return room_card
     
     def parse_date(self, date_str):
         """Parse date string in DD/MM/YYYY format"""
@@ -607,42 +532,19 @@ class MainAppView(ctk.CTkFrame):
         if self.controller:
             self.controller.show_search_view(checkin=checkin, checkout=checkout, guests=guests)
     
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
+    def on_room_type_events(self, events):
+        """Reload the room type cards right away when room types changed while shown"""
+        if all(e.type == TABLE_CHANGED and e.key != self.db_manager.room_type_file for e in events):
             return
-        
-        # Check if user is logged in
-        current_user = self.controller.get_current_user()
-        is_logged_in = current_user is not None
-        
-        if is_logged_in:
-            nav_map = {
-                "Home": "MainAppView",
-                "Room": "RoomView",
-                "My Bookings": "MyBookingsView",
-                "Account Settings": "AccountView",
-                "Sign out": None  # Special handling
-            }
-            
-            if item == "Sign out":
-                self.controller.logout()
-                return
-        else:
-            nav_map = {
-                "Home": "MainAppView",
-                "Rooms": "RoomView",
-                "Login": "SignInView"
-            }
-        
-        target = nav_map.get(item)
-        if target:
-            self.controller.show_frame(target)
+        # Hidden screens catch up in on_show
+        if not self.controller or self.controller.is_frame_shown(self):
+            self.load_room_type_cards()
     
     def on_show(self):
-        """Called when this view is shown - refresh sidebar to reflect login status"""
-        self.create_sidebar()
-        # Refresh room type cards to show updated images
+        """Called when this view is shown - attach the sidebar and reconcile the room type cards"""
+        Sidebar.for_view(self)
+        # Cheap when nothing changed (cached table, no card rebuilt), and picks up
+        # changes from other desk stations even when the db/ watcher is off
         if hasattr(self, 'rooms_container'):
             self.load_room_type_cards()
 
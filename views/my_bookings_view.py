@@ -12,7 +12,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from modules.db_manager import DBManager
 from modules.booking_service import BookingService
 from modules.search_service import SearchService
+from modules.event_bus import BOOKING_CREATED, BOOKING_STATUS_CHANGED, TABLE_CHANGED
+from modules.io_accounting import user_action
 from .book_view import BookView
+from views.widgets.virtual_list import VirtualList
+from views.widgets.sidebar import Sidebar
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -47,7 +51,7 @@ class MyBookingsView(ctk.CTkFrame):
         else:
             self.db_manager = DBManager("db")
             self.booking_service = BookingService(self.db_manager)
-        self.search_service = SearchService()
+        self.search_service = SearchService(self.db_manager)
         self.search_checkin = checkin
         self.search_checkout = checkout
         self.search_guests = guests
@@ -67,64 +71,8 @@ class MyBookingsView(ctk.CTkFrame):
         self.main_container.grid_columnconfigure(1, weight=5)
         self.sidebar = None  # Initialize sidebar variable
         self.create_bookings_tabview()
-        self.create_sidebar()  # Create sidebar after main content
-    
-    def create_sidebar(self):
-        """Create left sidebar navigation"""
-        # Destroy existing sidebar if it exists
-        if self.sidebar:
-            self.sidebar.destroy()
-        
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-        
-        # Get user name from controller
-        user_name = "User"
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                user_name = current_user.get("name", current_user.get("email", "User"))
-        
-        # Greeting label
-        greeting_label = ctk.CTkLabel(
-            self.sidebar,
-            text=f"Hi, {user_name}",
-            font=("SVN-Gilroy", 16, "bold"),
-            text_color="black",
-            anchor="w"
-        )
-        greeting_label.pack(fill="x", padx=10, pady=(20, 10))
-        
-        # Navigation items for logged-in users
-        nav_items = [
-            "Home",
-            "Room",
-            "My Bookings",
-            "Account Settings",
-            "Sign out"
-        ]
-        
-        # Create navigation buttons
-        for i, item in enumerate(nav_items):
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x)
-            )
-            btn.pack(fill="x", padx=10, pady=5)
+        if not self.controller:
+            Sidebar.for_view(self)
     
     def create_bookings_tabview(self):
         """Create TabView for bookings (Upcoming, Completed, Canceled)"""
@@ -141,59 +89,105 @@ class MyBookingsView(ctk.CTkFrame):
         self.tab_completed = self.tabview.add("Completed")
         self.tab_canceled = self.tabview.add("Canceled")
 
-        # Scrollable frames for each tab
-        self.upcoming_frame = ctk.CTkScrollableFrame(self.tab_upcoming, fg_color="#F5F5F5")
-        self.upcoming_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.completed_frame = ctk.CTkScrollableFrame(self.tab_completed, fg_color="#F5F5F5")
-        self.completed_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        self.canceled_frame = ctk.CTkScrollableFrame(self.tab_canceled, fg_color="#F5F5F5")
-        self.canceled_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        # Virtualized lists for each tab: only the visible cards are built
+        self.upcoming_list = VirtualList(self.tab_upcoming, self.create_booking_card, self.bind_booking_card, item_height=260)
+        self.upcoming_list.pack(fill="both", expand=True, padx=10, pady=10)
+        self.completed_list = VirtualList(self.tab_completed, self.create_booking_card, self.bind_booking_card, item_height=260)
+        self.completed_list.pack(fill="both", expand=True, padx=10, pady=10)
+        self.canceled_list = VirtualList(self.tab_canceled, self.create_booking_card, self.bind_booking_card, item_height=260)
+        self.canceled_list.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Reload only when this customer's bookings changed or another customer logged in
+        self.loaded_customer_id = None
+        self.bookings_dirty = True
+        self.db_manager.events.subscribe(
+            self.on_booking_events,
+            (BOOKING_CREATED, BOOKING_STATUS_CHANGED, TABLE_CHANGED)
+        )
 
         self.load_bookings_data()
 
     def load_bookings_data(self):
         """Load bookings using BookingService and display in tabs"""
         bookings = []
-        
-        # Get bookings using BookingService
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                customer_id = current_user.get("customerID")
-                # Use BookingService to get customer bookings
-                bookings = self.booking_service.view_booking_list(customer_id)
-            else:
-                # If not logged in, don't show any bookings
-                bookings = []
-        else:
-            bookings = []
-
-        # Clear frames
-        for frame in [self.upcoming_frame, self.completed_frame, self.canceled_frame]:
-            for widget in frame.winfo_children():
-                widget.destroy()
+        customer_id = self.get_current_customer_id()
+        if customer_id is not None:
+            # Use BookingService to get customer bookings
+            bookings = self.booking_service.view_booking_list(customer_id)
+        # If not logged in, don't show any bookings
+        self.loaded_customer_id = customer_id
+        self.bookings_dirty = False
 
         upcoming_status = ["pending", "confirmed", "in_sstay"]
         completed_status = ["completed"]
         canceled_status = ["canceled"]
 
+        upcoming, completed, canceled = [], [], []
         for booking in bookings:
             status = str(booking.get("status", "")).strip().lower()
             if status in [s.lower() for s in upcoming_status]:
-                self.create_booking_card(self.upcoming_frame, booking, show_cancel=(status=="pending"))
+                upcoming.append(booking)
             elif status in [s.lower() for s in completed_status]:
-                self.create_booking_card(self.completed_frame, booking, show_cancel=False)
+                completed.append(booking)
             elif status in [s.lower() for s in canceled_status]:
-                self.create_booking_card(self.canceled_frame, booking, show_cancel=False)
+                canceled.append(booking)
+
+        # Visible cards are rebound, not rebuilt
+        self.upcoming_list.set_items(upcoming)
+        self.completed_list.set_items(completed)
+        self.canceled_list.set_items(canceled)
+
+    def get_current_customer_id(self):
+        """Return the logged-in customer's ID (or None)"""
+        if not self.controller:
+            return None
+        current_user = self.controller.get_current_user()
+        return current_user.get("customerID") if current_user else None
+
+    def on_booking_events(self, events):
+        """Reload when a booking of the shown customer was created or changed"""
+        for event in events:
+            if event.type == TABLE_CHANGED:
+                if event.key == self.db_manager.booking_file:
+                    break
+                continue
+            booking = event.data if event.type == BOOKING_CREATED else event.data.get("booking", {})
+            if booking.get("customerID") == self.loaded_customer_id:
+                break
+        else:
+            return
+        self.bookings_dirty = True
+        if self.controller and self.controller.is_frame_shown(self):
+            self.load_bookings_data()
 
-    def create_booking_card(self, parent, booking, show_cancel=False):
-        """Create a booking card widget styled like trip summary, with all required fields"""
+    def create_booking_card(self, parent):
+        """Create an empty booking card widget styled like trip summary, with all required fields"""
         card = ctk.CTkFrame(parent, fg_color="white", border_color="#E5E5E5", border_width=2, corner_radius=15)
-        card.pack(fill="x", pady=10, padx=10)
 
         # Title
-        title = ctk.CTkLabel(card, text=f"Booking ID: {booking.get('bookingID', '')}", font=("SVN-Gilroy", 16, "bold"), text_color="black", anchor="w")
-        title.pack(anchor="w", pady=(10, 5), padx=20)
+        card.title = ctk.CTkLabel(card, text="", font=("SVN-Gilroy", 16, "bold"), text_color="black", anchor="w")
+        card.title.pack(anchor="w", pady=(10, 5), padx=20)
+
+        # Summary items
+        card.values = {}
+        for label_text in ["Room number", "Check-in date", "Check-out date", "Guests", "Total", "Status"]:
+            item_frame = ctk.CTkFrame(card, fg_color="white")
+            item_frame.pack(fill="x", pady=2, padx=20)
+            label = ctk.CTkLabel(item_frame, text=label_text, font=("SVN-Gilroy", 13), text_color="black", anchor="w")
+            label.pack(side="left", anchor="w")
+            value = ctk.CTkLabel(item_frame, text="", font=("SVN-Gilroy", 13) if label_text=="Total" else ("SVN-Gilroy", 12), text_color="black" if label_text in ["Total", "Status"] else "gray", anchor="e")
+            value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20,0))
+            card.values[label_text] = value
+
+        # Cancel button, only packed for pending bookings
+        card.btn_frame = ctk.CTkFrame(card, fg_color="white")
+        card.cancel_btn = ctk.CTkButton(card.btn_frame, text="Cancel", font=("SVN-Gilroy", 14), fg_color="#555555", text_color="white", hover_color="#A0522D", corner_radius=10)
+        card.cancel_btn.pack(anchor="e")
+        return card
+
+    def bind_booking_card(self, card, booking):
+        """Show a booking in a (possibly recycled) booking card"""
+        card.title.configure(text=f"Booking ID: {booking.get('bookingID', '')}")
 
         # Get room number using BookingService
         room_number = ""
@@ -230,18 +224,14 @@ class MyBookingsView(ctk.CTkFrame):
         ]
 
         for label_text, value_text in summary_items:
-            item_frame = ctk.CTkFrame(card, fg_color="white")
-            item_frame.pack(fill="x", pady=2, padx=20)
-            label = ctk.CTkLabel(item_frame, text=label_text, font=("SVN-Gilroy", 13), text_color="black", anchor="w")
-            label.pack(side="left", anchor="w")
-            value = ctk.CTkLabel(item_frame, text=value_text, font=("SVN-Gilroy", 13) if label_text=="Total" else ("SVN-Gilroy", 12), text_color="black" if label_text in ["Total", "Status"] else "gray", anchor="e")
-            value.pack(side="right", anchor="e", fill="x", expand=True, padx=(20,0))
+            card.values[label_text].configure(text=value_text)
 
+        show_cancel = str(status).strip().lower() == "pending"
         if show_cancel:
-            btn_frame = ctk.CTkFrame(card, fg_color="white")
-            btn_frame.pack(fill="x", pady=(10, 15), padx=20)
-            cancel_btn = ctk.CTkButton(btn_frame, text="Cancel", font=("SVN-Gilroy", 14), fg_color="#555555", text_color="white", hover_color="#A0522D", corner_radius=10, command=lambda b=booking: self.cancel_booking(b))
-            cancel_btn.pack(anchor="e")
+            card.cancel_btn.configure(command=lambda b=booking: self.cancel_booking(b))
+            card.btn_frame.pack(fill="x", pady=(10, 15), padx=20)
+        else:
+            card.btn_frame.pack_forget()
 
     def cancel_booking(self, booking):
         """Call BookingService to cancel booking, then refresh UI"""
@@ -249,42 +239,17 @@ class MyBookingsView(ctk.CTkFrame):
             return
         
         booking_id = booking.get("bookingID")
-        customer_id = None
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                customer_id = current_user.get("customerID")
+        customer_id = self.get_current_customer_id()
         
-        # Use BookingService to cancel booking
-        success = self.booking_service.cancel_booking(booking_id, customer_id)
-        if success:
-            self.load_bookings_data()
+        # Use BookingService to cancel booking (the status change event refreshes the lists)
+        with user_action(f"cancel booking #{booking_id}"):
+            self.booking_service.cancel_booking(booking_id, customer_id)
     
     def on_show(self):
-        """Called when this view is shown - reload bookings data and refresh sidebar"""
-        self.create_sidebar()  # Refresh sidebar to reflect login status
-        self.load_bookings_data()
-    
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
-            return
-        
-        nav_map = {
-            "Home": "MainAppView",
-            "Room": "RoomView",
-            "My Bookings": "MyBookingsView",
-            "Account Settings": "AccountView",
-            "Sign out": None  # Special handling
-        }
-        
-        if item == "Sign out":
-            self.controller.logout()
-            return
-        
-        target = nav_map.get(item)
-        if target:
-            self.controller.show_frame(target)
+        """Called when this view is shown - attach the sidebar and reload bookings if they changed"""
+        Sidebar.for_view(self)
+        if self.bookings_dirty or self.get_current_customer_id() != self.loaded_customer_id:
+            self.load_bookings_data()
 
 
 if __name__ == "__main__":
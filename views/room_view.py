@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
 import sys
 
@@ -8,6 +7,11 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.db_manager import DBManager
+from modules.image_cache import ImageCache
+from modules.event_bus import ROOM_TYPE_EVENTS, TABLE_CHANGED
+from views.widgets.lazy_image_loader import LazyImageLoader
+from views.widgets.card_reconciler import CardReconciler, image_record_version
+from views.widgets.sidebar import Sidebar
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -35,7 +39,9 @@ class RoomView(ctk.CTkFrame):
     def __init__(self, parent, controller=None, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
         self.controller = controller
-        self.db = DBManager(data_folder="db")
+        self.db = controller.get_db_manager() if controller else DBManager(data_folder="db")
+        self.image_cache = controller.get_image_cache() if controller else ImageCache()
+        self.image_loader = LazyImageLoader(self.image_cache, self)
         self.configure(fg_color="white")
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -46,74 +52,9 @@ class RoomView(ctk.CTkFrame):
         self.main_container.grid_columnconfigure(1, weight=5)
         self.sidebar = None  # Initialize sidebar variable
         self.create_main_content()
-        self.create_sidebar()  # Create sidebar after main content
-    
-    def create_sidebar(self):
-        """Create left sidebar navigation"""
-        # Destroy existing sidebar if it exists
-        if self.sidebar:
-            self.sidebar.destroy()
-        
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-        
-        # Check if user is logged in
-        is_logged_in = False
-        user_name = "User"
-        if self.controller:
-            current_user = self.controller.get_current_user()
-            if current_user:
-                is_logged_in = True
-                user_name = current_user.get("name", current_user.get("email", "User"))
-        
-        if is_logged_in:
-            # Greeting label for logged-in users
-            greeting_label = ctk.CTkLabel(
-                self.sidebar,
-                text=f"Hi, {user_name}",
-                font=("SVN-Gilroy", 16, "bold"),
-                text_color="black",
-                anchor="w"
-            )
-            greeting_label.pack(fill="x", padx=10, pady=(20, 10))
-            
-            # Navigation items for logged-in users
-            nav_items = [
-                "Home",
-                "Room",
-                "My Bookings",
-                "Account Settings",
-                "Sign out"
-            ]
-        else:
-            # Navigation items for non-logged-in users
-            nav_items = [
-                "Home",
-                "Rooms",
-                "Login"
-            ]
-        
-        # Create navigation buttons
-        for i, item in enumerate(nav_items):
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x)
-            )
-            btn.pack(fill="x", padx=10, pady=5)
+        self.db.events.subscribe(self.on_room_type_events, ROOM_TYPE_EVENTS + (TABLE_CHANGED,))
+        if not self.controller:
+            Sidebar.for_view(self)
     
     def create_main_content(self):
         """Create main content area with room list"""
@@ -128,6 +69,16 @@ class RoomView(ctk.CTkFrame):
             fg_color="white"
         )
         self.scrollable_frame.pack(fill="both", expand=True)
+        self.image_loader.viewport = self.scrollable_frame._parent_canvas
+
+        # Room type cards keyed by typeID, only changed cards are rebuilt
+        self.card_reconciler = CardReconciler(
+            self.scrollable_frame,
+            create_card=lambda parent, room_type: self.create_room_card(room_type),
+            key=lambda room_type: room_type.get("typeID"),
+            version=image_record_version,
+            pack_options={"fill": "x", "padx": 10, "pady": 15}
+        )
         
         # Load and display room types
         self.load_and_display_rooms()
@@ -135,10 +86,8 @@ class RoomView(ctk.CTkFrame):
     def load_and_display_rooms(self):
         """Load room types from database and display them"""
         room_types = self.db.get_all_room_types()
-        
-        for room_type in room_types:
-            self.create_room_card(room_type)
-    
+        self.card_reconciler.reconcile(room_types)
+
     def create_room_card(self, room_type):
         """Create a room card for each room type"""
         # Main card frame
@@ -147,7 +96,6 @@ class RoomView(ctk.CTkFrame):
             fg_color="white",
             corner_radius=10
         )
-        room_card.pack(fill="x", padx=10, pady=15)
         room_card.grid_columnconfigure(0, weight=0)  # Image column
         room_card.grid_columnconfigure(1, weight=1)  # Content column
         
@@ -162,34 +110,18 @@ class RoomView(ctk.CTkFrame):
         image_frame.grid(row=0, column=0, padx=15, pady=15, sticky="nsew")
         image_frame.pack_propagate(False)
         
-        # Try to load image
-        try:
-            image_path = room_type.get("imagePath", "")
-            if image_path and os.path.exists(image_path) and image_path != "hi chua co tai anh ve":
-                image = Image.open(image_path)
-                # Center crop to maintain aspect ratio
-                image = self.center_crop_image(image, 300, 200)
-                photo = ctk.CTkImage(light_image=image, size=(300, 200))
-                img_label = ctk.CTkLabel(image_frame, image=photo, text="")
-                img_label.image = photo
-                img_label.pack(fill="both", expand=True)
-            else:
-                # Default placeholder
-                img_label = ctk.CTkLabel(
-                    image_frame,
-                    text="IMAGE",
-                    font=("SVN-Gilroy", 16, "bold"),
-                    text_color="gray"
-                )
-                img_label.pack(expand=True)
-        except Exception as e:
-            img_label = ctk.CTkLabel(
-                image_frame,
-                text="IMAGE",
-                font=("SVN-Gilroy", 16, "bold"),
-                text_color="gray"
-            )
-            img_label.pack(expand=True)
+        # Default placeholder, the image is decoded in the background
+        img_label = ctk.CTkLabel(
+            image_frame,
+            text="IMAGE",
+            font=("SVN-Gilroy", 16, "bold"),
+            text_color="gray"
+        )
+        img_label.pack(expand=True)
+        image_path = room_type.get("imagePath", "")
+        if image_path and image_path != "hi chua co tai anh ve":
+            # Center crop to maintain aspect ratio (cached thumbnail)
+            self.image_loader.request(img_label, image_path, (300, 200), mode="crop")
         
         # Right side - Content
         content_frame = ctk.CTkFrame(room_card, fg_color="white")
@@ -263,84 +195,21 @@ class RoomView(ctk.CTkFrame):
         
         
         # The "BOOK NOW" button has been removed.
-        pass
-    
+        return room_card
     
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
+    def on_room_type_events(self, events):
+        """Reload the room type cards right away when room types changed while shown"""
+        if all(e.type == TABLE_CHANGED and e.key != self.db.room_type_file for e in events):
             return
-        
-        # Check if user is logged in
-        current_user = self.controller.get_current_user()
-        is_logged_in = current_user is not None
-        
-        if is_logged_in:
-            nav_map = {
-                "Home": "MainAppView",
-                "Room": "RoomView",
-                "My Bookings": "MyBookingsView",
-                "Account Settings": "AccountView",
-                "Sign out": None  # Special handling
-            }
-            
-            if item == "Sign out":
-                self.controller.logout()
-                return
-        else:
-            nav_map = {
-                "Home": "MainAppView",
-                "Rooms": "RoomView",
-                "Login": "SignInView"
-            }
-        
-        target = nav_map.get(item)
-        if target:
-            self.controller.show_frame(target)
-    
-    def center_crop_image(self, image, target_width, target_height):
-        """
-        Center crop image to target size while maintaining aspect ratio
-        
-        Args:
-            image: PIL Image object
-            target_width: Target width
-            target_height: Target height
-            
-        Returns:
-            Cropped PIL Image
-        """
-        img_width, img_height = image.size
-        target_ratio = target_width / target_height
-        img_ratio = img_width / img_height
-        
-        # Calculate crop size
-        if img_ratio > target_ratio:
-            # Image is wider, crop width
-            new_height = img_height
-            new_width = int(img_height * target_ratio)
-        else:
-            # Image is taller, crop height
-            new_width = img_width
-            new_height = int(img_width / target_ratio)
-        
-        # Calculate crop box (center crop)
-        left = (img_width - new_width) // 2
-        top = (img_height - new_height) // 2
-        right = left + new_width
-        bottom = top + new_height
-        
-        # Crop and resize
-        cropped = image.crop((left, top, right, bottom))
-        return cropped.resize((target_width, target_height), Image.Resampling.LANCZOS)
+        # Hidden screens catch up in on_show
+        if not self.controller or self.controller.is_frame_shown(self):
+            self.load_and_display_rooms()
     
     def on_show(self):
-        """Called when this view is shown - refresh sidebar to reflect login status"""
-        self.create_sidebar()
-        # Refresh room cards to show updated images
-        # Clear existing cards and reload
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        """Called when this view is shown - attach the sidebar and reconcile the room type cards"""
+        Sidebar.for_view(self)
+        # Cheap when nothing changed (cached table, no card rebuilt), and picks up
+        # changes from other desk stations even when the db/ watcher is off
         self.load_and_display_rooms()
 
 
@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
 from datetime import datetime, date
 import re
@@ -11,6 +10,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.db_manager import DBManager
 from modules.search_service import SearchService
+from modules.io_accounting import accounted
+from modules.image_cache import ImageCache
+from views.widgets.lazy_image_loader import LazyImageLoader
+from views.widgets.sidebar import Sidebar
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -43,7 +46,9 @@ class SearchView(ctk.CTkFrame):
             self.db_manager = controller.get_db_manager()
         else:
             self.db_manager = DBManager("db")
-        self.search_service = SearchService()
+        self.search_service = SearchService(self.db_manager)
+        self.image_cache = controller.get_image_cache() if controller else ImageCache()
+        self.image_loader = LazyImageLoader(self.image_cache, self)
         self.search_checkin = checkin
         self.search_checkout = checkout
         self.search_guests = guests
@@ -61,7 +66,9 @@ class SearchView(ctk.CTkFrame):
         self.main_container.grid_rowconfigure(0, weight=1)
         self.main_container.grid_columnconfigure(0, weight=0)
         self.main_container.grid_columnconfigure(1, weight=5)
-        self.create_sidebar()
+        self.sidebar = None
+        if not self.controller:
+            Sidebar.for_view(self)
         self.create_main_content()
     
     def set_search_criteria_and_reload(self, checkin, checkout, guests):
@@ -84,43 +91,6 @@ class SearchView(ctk.CTkFrame):
         # Reload rooms with new data
         self.reload_rooms()
 
-    def create_sidebar(self):
-        """Create left sidebar navigation"""
-        self.sidebar = ctk.CTkFrame(
-            self.main_container,
-            fg_color="#E5E5E5",
-            width=150,
-            corner_radius=0
-        )
-        self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_propagate(False)
-        
-        # Navigation items
-        nav_items = [
-            "Home",
-            "Rooms",
-            "Our Services",
-            "My Bookings",
-            "Account settings",
-            "Sign out"
-        ]
-        
-        # Create navigation buttons
-        for i, item in enumerate(nav_items):
-            btn = ctk.CTkButton(
-                self.sidebar,
-                text=item,
-                font=("SVN-Gilroy", 14),
-                fg_color="transparent",
-                text_color="black",
-                hover_color="#D0D0D0",
-                height=50,
-                corner_radius=5,
-                anchor="w",
-                command=lambda x=item: self.on_nav_click(x)
-            )
-            btn.pack(fill="x", padx=10, pady=5)
-    
     def create_main_content(self):
         """Create main content area"""
         self.content_frame = ctk.CTkFrame(
@@ -135,6 +105,7 @@ class SearchView(ctk.CTkFrame):
             fg_color="white"
         )
         self.scrollable_frame.pack(fill="both", expand=True)
+        self.image_loader.viewport = self.scrollable_frame._parent_canvas
         
         # Search section at top
         self.create_search_section()
@@ -490,6 +461,7 @@ class SearchView(ctk.CTkFrame):
         # Validate dates first
         if not self.validate_dates():
             # Clear rooms if validation fails
+            self.image_loader.cancel_all()
             for widget in self.rooms_container.winfo_children():
                 widget.destroy()
             return
@@ -509,9 +481,11 @@ class SearchView(ctk.CTkFrame):
         if self.checkin_date and self.checkout_date:
             self.load_available_rooms()
     
+    @accounted("search rooms")
     def load_available_rooms(self):
         """Load and display available rooms from database"""
         # Clear existing rooms
+        self.image_loader.cancel_all()
         for widget in self.rooms_container.winfo_children():
             widget.destroy()
         
@@ -579,31 +553,17 @@ class SearchView(ctk.CTkFrame):
         image_frame.grid(row=0, column=0, rowspan=3, padx=(0, 15), pady=0, sticky="nsew")
         image_frame.pack_propagate(False)
         
-        try:
-            image_path = room_type.get("imagePath", "")
-            if image_path and os.path.exists(image_path):
-                image = Image.open(image_path)
-                image = image.resize((180, 180))
-                photo = ctk.CTkImage(light_image=image, size=(180, 180))
-                img_label = ctk.CTkLabel(image_frame, image=photo, text="")
-                img_label.image = photo
-                img_label.pack(fill="both", expand=True)
-            else:
-                img_label = ctk.CTkLabel(
-                    image_frame,
-                    text="Room Image",
-                    font=("SVN-Gilroy", 14),
-                    text_color="gray"
-                )
-                img_label.pack(fill="both", expand=True)
-        except Exception as e:
-            img_label = ctk.CTkLabel(
-                image_frame,
-                text="Room Image",
-                font=("SVN-Gilroy", 14),
-                text_color="gray"
-            )
-            img_label.pack(fill="both", expand=True)
+        # Grey placeholder first, the image is decoded in the background
+        img_label = ctk.CTkLabel(
+            image_frame,
+            text="Room Image",
+            font=("SVN-Gilroy", 14),
+            text_color="gray"
+        )
+        img_label.pack(fill="both", expand=True)
+        image_path = room_type.get("imagePath", "")
+        if image_path:
+            self.image_loader.request(img_label, image_path, (180, 180))
         
         # Right side - Room details
         details_frame = ctk.CTkFrame(inner_frame, fg_color="white")
@@ -690,6 +650,7 @@ class SearchView(ctk.CTkFrame):
         )
         book_btn.pack(side="left", padx=(0, 10))
     
+    @accounted("filter rooms")
     def apply_filters(self):
         """Apply filters and reload rooms"""
         # Get filter values
@@ -706,6 +667,7 @@ class SearchView(ctk.CTkFrame):
         selected_type = self.room_type_var.get()
         
         # Clear existing rooms
+        self.image_loader.cancel_all()
         for widget in self.rooms_container.winfo_children():
             widget.destroy()
         
@@ -763,25 +725,9 @@ class SearchView(ctk.CTkFrame):
             num_guests=num_guests
         )
     
-    def on_nav_click(self, item):
-        """Handle navigation item click"""
-        if not self.controller:
-            return
-        
-        nav_map = {
-            "Home": "MainAppView",
-            "Rooms": "RoomView",
-            "My Bookings": "MyBookingsView",
-            "Account settings": "AccountView",
-            "Sign out": lambda: self.controller.logout()
-        }
-        
-        target = nav_map.get(item)
-        if target:
-            if callable(target):
-                target()
-            else:
-                self.controller.show_frame(target)
+    def on_show(self):
+        """Called when this view is shown - attach the shared sidebar"""
+        Sidebar.for_view(self)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from customtkinter import FontManager
-from PIL import Image
 import os
 import re
 import sys
@@ -12,6 +11,8 @@ if sys.platform == "win32":
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.auth_service import AuthService
+from modules.io_accounting import accounted
+from views.asset_cache import get_asset_cache, HERO_IMAGE, HERO_SIZE
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -64,14 +65,9 @@ class SignInView(ctk.CTkFrame):
     def load_image(self):
         """Load and display image on the left side"""
         try:
-            # Path to image - adjust this path as needed
-            image_path = "assets/images/hotel.png"
-            if os.path.exists(image_path):
-                image = Image.open(image_path)
-                # Resize image to fit the frame (3/5 of 1000 = 600)
-                image = image.resize((600, 750))
-                photo = ctk.CTkImage(light_image=image, size=(600, 750))
-                
+            # Shared hero image, pre-scaled to fit the frame (3/5 of 1000 = 600)
+            photo = get_asset_cache().get(HERO_IMAGE, HERO_SIZE)
+            if photo is not None:
                 image_label = ctk.CTkLabel(self.left_frame, image=photo, text="")
                 image_label.image = photo  # Keep a reference
                 image_label.pack(fill="both", expand=True)
@@ -191,6 +187,7 @@ class SignInView(ctk.CTkFrame):
         self.email_entry.configure(border_color="#E5E5E5")
         self.password_entry.configure(border_color="#E5E5E5")
 
+    @accounted("sign in")
     def on_sign_in(self):
         """Handle sign in button click"""
         email = self.email_entry.get().strip()
@@ -0,0 +1,118 @@
+import json
+import os
+from collections import OrderedDict
+
+
+def record_fingerprint(record):
+    """Default card version: the record's content, independent of key order"""
+    return json.dumps(record, sort_keys=True, default=str)
+
+
+def image_record_version(record, image_field="imagePath"):
+    """Card version for records with an image that may be replaced under the same path"""
+    try:
+        image_mtime = os.stat(record.get(image_field, "")).st_mtime_ns
+    except (OSError, TypeError, ValueError):
+        image_mtime = None
+    return record_fingerprint(record), image_mtime
+
+
+class CardReconciler:
+    """
+    Keeps the cards of a container in sync with a list of records
+
+    Instead of destroying and rebuilding every card, reconcile() compares the
+    new records with the rendered ones by key and version: cards whose key
+    disappeared are destroyed, new keys get a card, changed versions are
+    updated (or rebuilt when there is no update_card), and unchanged cards are
+    left alone. Cards are only laid out again when the order or set changed.
+    """
+
+    def __init__(self, container, create_card, key, version=record_fingerprint,
+                 update_card=None, layout=None, pack_options=None):
+        """
+        Args:
+            container: Widget the cards are created in
+            create_card: Function(container, record) -> card widget (not yet packed/gridded)
+            key: Function(record) -> stable identity (e.g. the record ID)
+            version: Function(record) -> value that changes whenever the card must change
+            update_card: Optional function(card, record) that updates a card in place
+            layout: Optional function(card, index) placing a card; defaults to pack(**pack_options)
+            pack_options: Keyword arguments for pack() when no layout is given
+        """
+        self.container = container
+        self.create_card = create_card
+        self.key = key
+        self.version = version
+        self.update_card = update_card
+        self.layout = layout
+        self.pack_options = pack_options or {}
+        self._rendered = OrderedDict()  # key -> (version, card)
+
+    def reconcile(self, records):
+        """
+        Bring the rendered cards in line with `records`
+
+        Returns:
+            True if any card was created, updated, removed or moved
+        """
+        wanted = OrderedDict()
+        for record in records:
+            wanted[self.key(record)] = record
+
+        changed = False
+
+        # Remove cards whose record is gone
+        for key in [k for k in self._rendered if k not in wanted]:
+            self._rendered.pop(key)[1].destroy()
+            changed = True
+
+        # Create new cards and refresh changed ones
+        new_order = OrderedDict()
+        relayout = list(self._rendered) != [k for k in wanted if k in self._rendered]
+        for key, record in wanted.items():
+            version = self.version(record)
+            entry = self._rendered.get(key)
+            if entry is None:
+                card = self.create_card(self.container, record)
+                relayout = True
+            elif entry[0] != version:
+                card = entry[1]
+                if self.update_card is not None:
+                    self.update_card(card, record)
+                else:
+                    card.destroy()
+                    card = self.create_card(self.container, record)
+                    relayout = True
+                changed = True
+            else:
+                card = entry[1]
+            new_order[key] = (version, card)
+
+        self._rendered = new_order
+        if relayout:
+            self._layout_all()
+            changed = True
+        return changed
+
+    def clear(self):
+        """Destroy every rendered card"""
+        for version, card in self._rendered.values():
+            card.destroy()
+        self._rendered.clear()
+
+    def cards(self):
+        """Return the rendered cards in display order"""
+        return [card for version, card in self._rendered.values()]
+
+    def _layout_all(self):
+        cards = self.cards()
+        if self.layout is not None:
+            for index, card in enumerate(cards):
+                self.layout(card, index)
+            return
+        # Re-pack in order; widgets packed before the cards (headers) stay on top
+        for card in cards:
+            card.pack_forget()
+        for card in cards:
+            card.pack(**self.pack_options)
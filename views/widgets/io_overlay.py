@@ -0,0 +1,58 @@
+import customtkinter as ctk
+
+from modules.io_accounting import accountant
+
+# Actions listed, newest first
+SHOWN_ACTIONS = 20
+
+
+class IOOverlay(ctk.CTkToplevel):
+    """
+    Debug window listing the file I/O of the latest user actions
+
+    Each line shows what one action (and its follow-up reloads) read, wrote
+    and served from cache, so a click that suddenly re-reads booking.json
+    ten times stands out. Toggled with F8 in the App.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.title("I/O per action")
+        self.geometry("760x360")
+        self.attributes("-topmost", True)
+        self._refresh_job = None
+
+        self.textbox = ctk.CTkTextbox(self, font=("Consolas", 12), wrap="word")
+        self.textbox.pack(fill="both", expand=True, padx=8, pady=8)
+
+        accountant.subscribe(self._on_action)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+        self.refresh()
+
+    def refresh(self):
+        """Show the most recent actions"""
+        self._refresh_job = None
+        actions = list(accountant.recent)[-SHOWN_ACTIONS:]
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("end", "\n".join(a.summary() for a in reversed(actions)) or "No file I/O yet")
+        self.textbox.configure(state="disabled")
+
+    def toggle(self):
+        if self.winfo_viewable():
+            self.withdraw()
+        else:
+            self.deiconify()
+            self.refresh()
+
+    def _on_action(self, action):
+        # Called from the thread that finished the action; redraw once on the Tk thread
+        if self._refresh_job is None:
+            try:
+                self._refresh_job = self.after(100, self.refresh)
+            except RuntimeError:
+                self._refresh_job = None
+
+    def destroy(self):
+        accountant.unsubscribe(self._on_action)
+        super().destroy()
@@ -0,0 +1,147 @@
+import customtkinter as ctk
+import itertools
+import threading
+import tkinter as tk
+
+
+class LazyImageLoader:
+    """
+    Decodes card images on a worker thread and swaps them into placeholder labels
+
+    Views draw their grey placeholder label first and call request(); the
+    image is produced through ImageCache off the Tk thread and the CTkImage is
+    created and configured back on the Tk thread. Pending cards that are inside
+    the scrollable viewport are decoded first.
+    """
+
+    def __init__(self, image_cache, widget, viewport=None, poll_interval=30):
+        """
+        Args:
+            image_cache: Shared ImageCache
+            widget: Any widget of the view, used to schedule polling with after()
+            viewport: Widget whose screen area counts as visible (e.g. a scrollable frame's canvas)
+            poll_interval: Milliseconds between checks for decoded images
+        """
+        self.image_cache = image_cache
+        self.widget = widget
+        self.viewport = viewport
+        self.poll_interval = poll_interval
+        self._seq = itertools.count()
+        self._generation = 0
+        self._pending = []
+        self._results = []
+        self._outstanding = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._poll_job = None
+
+    def request(self, label, image_path, size, mode="resize"):
+        """
+        Queue an image for a placeholder label
+
+        Args:
+            label: CTkLabel currently showing the placeholder text
+            image_path: Source image path
+            size: (width, height) of the CTkImage
+            mode: ImageCache mode ("resize" or "crop")
+        """
+        item = {
+            "seq": next(self._seq),
+            "generation": self._generation,
+            "label": label,
+            "path": image_path,
+            "size": tuple(size),
+            "mode": mode,
+            "visible": True
+        }
+        with self._cond:
+            self._pending.append(item)
+            self._outstanding += 1
+            self._cond.notify()
+        self._ensure_worker()
+        self._schedule_poll()
+
+    def cancel_all(self):
+        """Forget queued and in-flight images (call before destroying the cards)"""
+        with self._cond:
+            self._generation += 1
+            self._outstanding -= len(self._pending)
+            self._pending.clear()
+
+    # ----------------------- Worker thread ----------------------------------
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._work, name="LazyImageLoader", daemon=True)
+            self._thread.start()
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Visible cards first, then in creation order
+                item = min(self._pending, key=lambda i: (not i["visible"], i["seq"]))
+                self._pending.remove(item)
+
+            image = self.image_cache.get_thumbnail(item["path"], item["size"], item["mode"])
+
+            with self._cond:
+                self._results.append((item, image))
+
+    # ----------------------- Tk thread --------------------------------------
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            try:
+                self._poll_job = self.widget.after(self.poll_interval, self._poll)
+            except tk.TclError:
+                self._poll_job = None
+
+    def _poll(self):
+        self._poll_job = None
+        with self._cond:
+            results, self._results = self._results, []
+            pending = list(self._pending)
+            generation = self._generation
+
+        for item, image in results:
+            with self._cond:
+                self._outstanding -= 1
+            if item["generation"] != generation or image is None:
+                continue
+            self._apply(item, image)
+
+        # Re-rank what is still waiting against the current scroll position
+        if pending:
+            ranks = [(item, self._is_visible(item["label"])) for item in pending]
+            with self._cond:
+                for item, visible in ranks:
+                    item["visible"] = visible
+
+        with self._cond:
+            busy = self._outstanding > 0
+        if busy:
+            self._schedule_poll()
+
+    def _apply(self, item, image):
+        label = item["label"]
+        try:
+            if not label.winfo_exists():
+                return
+            photo = ctk.CTkImage(light_image=image, size=item["size"])
+            label.configure(image=photo, text="")
+            label.image = photo  # Keep a reference
+        except tk.TclError:
+            pass
+
+    def _is_visible(self, label):
+        if self.viewport is None:
+            return True
+        try:
+            if not label.winfo_exists() or not label.winfo_ismapped():
+                return False
+            top = self.viewport.winfo_rooty()
+            bottom = top + self.viewport.winfo_height()
+            label_top = label.winfo_rooty()
+            return label_top < bottom and label_top + label.winfo_height() > top
+        except tk.TclError:
+            return False
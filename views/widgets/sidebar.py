@@ -0,0 +1,155 @@
+import customtkinter as ctk
+
+# key -> (logged-in text, logged-out text, target frame); None text hides the item
+NAV_ITEMS = [
+    ("home", "Home", "Home", "MainAppView"),
+    ("rooms", "Room", "Rooms", "RoomView"),
+    ("my_bookings", "My Bookings", None, "MyBookingsView"),
+    ("account", "Account Settings", None, "AccountView"),
+    ("sign_out", "Sign out", None, None),
+    ("login", None, "Login", "SignInView"),
+]
+
+
+class Sidebar(ctk.CTkFrame):
+    """
+    Left navigation sidebar shared by the customer views
+
+    The App owns a single instance; each customer view moves it into its own
+    layout with attach() when shown. The greeting and nav buttons are built
+    once and only the items affected by a login state or name change are
+    updated, driven by SessionManager change notifications.
+    """
+
+    def __init__(self, parent, controller=None):
+        """
+        Args:
+            parent: Parent widget (must be an ancestor of every container it is attached to)
+            controller: App controller used for navigation and the current user
+        """
+        super().__init__(parent, fg_color="#E5E5E5", width=150, corner_radius=0)
+        self.controller = controller
+        self.grid_propagate(False)
+        self._state = None  # (logged in, greeting) currently shown
+        self._refresh_job = None
+        self._session_manager = None
+
+        self.greeting_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=("SVN-Gilroy", 16, "bold"),
+            text_color="black",
+            anchor="w"
+        )
+
+        self.buttons = {}
+        for key, _, _, _ in NAV_ITEMS:
+            self.buttons[key] = ctk.CTkButton(
+                self,
+                text="",
+                font=("SVN-Gilroy", 14),
+                fg_color="transparent",
+                text_color="black",
+                hover_color="#D0D0D0",
+                height=50,
+                corner_radius=5,
+                anchor="w",
+                command=lambda x=key: self.on_nav_click(x)
+            )
+
+        if controller and hasattr(controller, "get_session_manager"):
+            self._session_manager = controller.get_session_manager()
+            self._session_manager.subscribe(self._on_session_change)
+
+        self.refresh()
+
+    @classmethod
+    def for_view(cls, view):
+        """
+        Attach the navigation sidebar to a customer view
+
+        Uses the App's shared sidebar, or builds one of the view's own when it
+        runs without a controller. The view must have `controller`,
+        `main_container` and `sidebar` (None until first attached) attributes.
+        In the App this is called from on_show, so building a view does not
+        take the sidebar away from the screen currently shown.
+
+        Returns:
+            The attached sidebar (also stored as view.sidebar)
+        """
+        if view.sidebar is None:
+            view.sidebar = view.controller.get_sidebar() if view.controller else cls(view.main_container)
+        view.sidebar.attach(view.main_container)
+        return view.sidebar
+
+    def attach(self, container):
+        """Show the sidebar in column 0 of a view's main container"""
+        self.grid(in_=container, row=0, column=0, sticky="nsew")
+        # The sidebar is a sibling of the view frames, keep it above the raised one
+        self.lift()
+        self.refresh()
+
+    def refresh(self):
+        """Bring the greeting and nav items in line with the current user"""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+        current_user = self.controller.get_current_user() if self.controller else None
+        logged_in = current_user is not None
+        greeting = None
+        if logged_in:
+            greeting = f"Hi, {current_user.get('name', current_user.get('email', 'User'))}"
+        state = (logged_in, greeting)
+        if state == self._state:
+            return
+        previous, self._state = self._state, state
+
+        if previous is not None and previous[0] == logged_in:
+            # Same login state: only the greeting changed
+            self.greeting_label.configure(text=greeting)
+            return
+
+        # Login state changed: re-pack the nav items in order
+        for widget in [self.greeting_label] + list(self.buttons.values()):
+            widget.pack_forget()
+        if logged_in:
+            self.greeting_label.configure(text=greeting)
+            self.greeting_label.pack(fill="x", padx=10, pady=(20, 10))
+        for key, logged_in_text, logged_out_text, _ in NAV_ITEMS:
+            text = logged_in_text if logged_in else logged_out_text
+            if text is None:
+                continue
+            button = self.buttons[key]
+            if button.cget("text") != text:
+                button.configure(text=text)
+            button.pack(fill="x", padx=10, pady=5)
+
+    def on_nav_click(self, key):
+        """Handle navigation item click"""
+        if not self.controller:
+            return
+        if key == "sign_out":
+            self.controller.logout()
+            return
+        for item_key, _, _, target in NAV_ITEMS:
+            if item_key == key and target:
+                self.controller.show_frame(target)
+                return
+
+    def _on_session_change(self, token, user):
+        # Coalesce bursts (logout + login) into one refresh on the Tk thread
+        if self._refresh_job is None:
+            try:
+                self._refresh_job = self.after_idle(self.refresh)
+            except RuntimeError:
+                self._refresh_job = None
+
+    def destroy(self):
+        if self._session_manager is not None:
+            self._session_manager.unsubscribe(self._on_session_change)
+            self._session_manager = None
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        super().destroy()
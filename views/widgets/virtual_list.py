@@ -0,0 +1,254 @@
+import customtkinter as ctk
+import sys
+import tkinter as tk
+
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list that only builds cards for the visible rows
+
+    Cards are created on demand by `create_card(parent)` and filled with a
+    record by `bind_card(card, record)`. Only the rows inside the viewport plus
+    `buffer` rows above and below have a card; cards that scroll out are
+    hidden and reused for the rows that scroll in, and set_items() rebinds the
+    existing cards instead of destroying them. All rows share one height, which
+    grows to fit the tallest card bound so far.
+    """
+
+    def __init__(self, parent, create_card, bind_card, item_height=120, spacing=20,
+                 padx=10, buffer=2, empty_text="", fg_color="#F5F5F5", on_end_reached=None, **kwargs):
+        """
+        Args:
+            parent: Parent widget
+            create_card: Function(parent) -> new card widget (structure only)
+            bind_card: Function(card, record) that shows a record in a card
+            item_height: Initial row height in pixels (card height + spacing)
+            spacing: Vertical gap between cards
+            padx: Horizontal gap on each side of the cards
+            buffer: Extra rows built above and below the viewport
+            empty_text: Text shown when there are no items
+            on_end_reached: Optional function() called when the last row is about to be shown
+                (used to fetch the next page)
+        """
+        super().__init__(parent, fg_color=fg_color, **kwargs)
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.item_height = item_height
+        self.spacing = spacing
+        self.padx = padx
+        self.buffer = buffer
+        self.on_end_reached = on_end_reached
+        self._items = []
+        self._active = {}  # row index -> (card, canvas window id)
+        self._pool = []  # hidden (card, canvas window id) ready for reuse
+        self._render_job = None
+        self._end_job = None
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(self, bg=fg_color, highlightthickness=0, yscrollincrement=20)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.empty_label = ctk.CTkLabel(
+            self.canvas,
+            text=empty_text,
+            font=("SVN-Gilroy", 14),
+            text_color="gray"
+        )
+        self._empty_window = self.canvas.create_window(0, 50, anchor="n", window=self.empty_label, state="hidden")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        # Wheel events over the canvas or any card scroll this list only: the
+        # handler is bound to a tag of our own, added to each of our widgets
+        self._wheel_tag = f"VirtualListWheel{id(self)}"
+        for sequence in WHEEL_EVENTS:
+            self.bind_class(self._wheel_tag, sequence, self._on_mouse_wheel)
+        self._add_wheel_tag(self.canvas)
+        self._add_wheel_tag(self.empty_label)
+
+    # ----------------------- Public API -------------------------------------
+    def set_items(self, items, keep_position=True):
+        """
+        Show a new list of records
+
+        Args:
+            items: List of records passed to bind_card
+            keep_position: Keep the scroll offset (e.g. after an action) instead of jumping to the top
+        """
+        self._items = list(items)
+        count = len(self._items)
+
+        # Rebind the cards already on screen instead of rebuilding them
+        rebound = []
+        for index in list(self._active):
+            if index < count:
+                card = self._active[index][0]
+                self.bind_card(card, self._items[index])
+                self._add_wheel_tag(card)
+                rebound.append(card)
+            else:
+                self._release(index)
+        self._fit_height(rebound)
+
+        if count:
+            self.canvas.itemconfigure(self._empty_window, state="hidden")
+        else:
+            self.canvas.itemconfigure(self._empty_window, state="normal")
+
+        self._update_scrollregion()
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        self._render()
+
+    def append_items(self, items):
+        """Add records at the end (e.g. the next page) without touching existing cards"""
+        if not items:
+            return
+        self._items.extend(items)
+        self.canvas.itemconfigure(self._empty_window, state="hidden")
+        self._update_scrollregion()
+        self._render()
+
+    def get_items(self):
+        """Return the records currently shown"""
+        return list(self._items)
+
+    # ----------------------- Layout -----------------------------------------
+    def _row_y(self, index):
+        return index * self.item_height + self.spacing // 2
+
+    def _card_width(self):
+        return max(1, self.canvas.winfo_width() - 2 * self.padx)
+
+    def _update_scrollregion(self):
+        total = max(len(self._items) * self.item_height, 1)
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), total))
+
+    def _relayout(self):
+        """Apply a new width or row height to every card window"""
+        width = self._card_width()
+        height = self.item_height - self.spacing
+        for card, window in list(self._active.values()) + self._pool:
+            self.canvas.itemconfigure(window, width=width, height=height)
+        for index, (card, window) in self._active.items():
+            self.canvas.coords(window, self.padx, self._row_y(index))
+        self.canvas.coords(self._empty_window, self.canvas.winfo_width() // 2, 50)
+        self._update_scrollregion()
+
+    def _fit_height(self, cards):
+        """Grow the row height if a freshly bound card needs more room"""
+        if not cards:
+            return False
+        self.update_idletasks()
+        needed = max(card.winfo_reqheight() for card in cards) + self.spacing
+        if needed <= self.item_height:
+            return False
+        self.item_height = needed
+        self._relayout()
+        return True
+
+    # ----------------------- Rendering --------------------------------------
+    def _schedule_render(self):
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._render)
+
+    def _render(self):
+        """Make sure exactly the rows near the viewport have a card"""
+        if self._render_job is not None:
+            self.after_cancel(self._render_job)
+            self._render_job = None
+
+        count = len(self._items)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(0, int(top // self.item_height) - self.buffer)
+        last = min(count, int(bottom // self.item_height) + 1 + self.buffer)
+        wanted = range(first, last)
+
+        # Cards that scrolled out go back to the pool
+        for index in [i for i in self._active if i not in wanted]:
+            self._release(index)
+
+        bound = []
+        for index in wanted:
+            if index in self._active:
+                continue
+            card, window = self._pool.pop() if self._pool else self._new_card()
+            self.bind_card(card, self._items[index])
+            # bind_card may have created widgets
+            self._add_wheel_tag(card)
+            self.canvas.coords(window, self.padx, self._row_y(index))
+            self.canvas.itemconfigure(window, state="normal")
+            self._active[index] = (card, window)
+            bound.append(card)
+
+        # Taller rows change which rows are visible, so render once more
+        if self._fit_height(bound):
+            self._render()
+            return
+
+        # The buffer reaches the last row: ask for more outside of this render
+        if self.on_end_reached is not None and count and last >= count and self._end_job is None:
+            self._end_job = self.after_idle(self._notify_end_reached)
+
+    def _notify_end_reached(self):
+        self._end_job = None
+        self.on_end_reached()
+
+    def _new_card(self):
+        card = self.create_card(self.canvas)
+        window = self.canvas.create_window(
+            self.padx, 0,
+            anchor="nw",
+            window=card,
+            width=self._card_width(),
+            height=self.item_height - self.spacing
+        )
+        return card, window
+
+    def _release(self, index):
+        card, window = self._active.pop(index)
+        self.canvas.itemconfigure(window, state="hidden")
+        self._pool.append((card, window))
+
+    # ----------------------- Events -----------------------------------------
+    def _add_wheel_tag(self, widget):
+        """Route wheel events of a widget and its children to this list"""
+        tags = widget.bindtags()
+        if self._wheel_tag not in tags:
+            widget.bindtags((self._wheel_tag,) + tags)
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _on_configure(self, event):
+        self._relayout()
+        self._schedule_render()
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _on_mouse_wheel(self, event):
+        if self.canvas.yview() == (0.0, 1.0):
+            return
+        if getattr(event, "num", None) == 4:
+            step = -3
+        elif getattr(event, "num", None) == 5:
+            step = 3
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            step = -3 * int(event.delta / 120)
+        self.canvas.yview_scroll(step, "units")
+        self._render()
+
+    def destroy(self):
+        for sequence in WHEEL_EVENTS:
+            self.unbind_class(self._wheel_tag, sequence)
+        super().destroy()